@@ -0,0 +1,69 @@
+"""
+Optimización de recorrido de drones para monitoreo agrícola
+
+Las clases se importan de forma perezosa: `import drone_optimization` no carga
+SciPy, Matplotlib ni SymPy hasta que se accede al atributo correspondiente.
+"""
+from importlib import import_module
+
+__version__ = '0.1.0'
+
+# Atributo público -> módulo que lo define
+_LAZY_ATTRIBUTES = {
+    'BatchSolution': 'optimization_solver',
+    'DroneOptimization': 'optimization_solver',
+    'solve_batch': 'optimization_solver',
+    'Verification': 'optimization_solver',
+    'verify_batch': 'optimization_solver',
+    'ProblemBatch': 'spec',
+    'ProblemSpec': 'spec',
+    'SharedProblemBatch': 'spec',
+    'NZoneModel': 'lp_solver',
+    'Presolve': 'presolve',
+    'presolve_batch': 'presolve',
+    'presolve_model': 'presolve',
+    'ParametricSolution': 'parametric',
+    'ParametricSolver': 'parametric',
+    'SolutionCache': 'cache',
+    'MicroBatcher': 'service',
+    'PlanningService': 'service',
+    'Recorder': 'metrics',
+    'Route': 'routing',
+    'RouteOptimizer': 'routing',
+    'CostRaster': 'terrain',
+    'write_cost_raster': 'terrain',
+    'FleetAssignment': 'fleet',
+    'FleetModel': 'fleet',
+    'RobustnessAnalysis': 'robustness',
+    'ParetoAnalysis': 'pareto',
+    'MissionSimulator': 'simulation',
+    'SimulationResult': 'simulation',
+    'non_dominated': 'pareto',
+    'RobustnessReport': 'robustness',
+    'GridDesign': 'sweep',
+    'SampleDesign': 'sweep',
+    'SweepResult': 'sweep',
+    'latin_hypercube': 'sweep',
+    'run_sweep': 'sweep',
+    'DroneVisualization': 'visualization',
+    'KKTBatchSolution': 'lagrange_analysis',
+    'render_dashboards': 'render',
+    'run_benchmarks': 'benchmark',
+    'LagrangeAnalysis': 'lagrange_analysis',
+    'solve_kkt_batch': 'lagrange_analysis',
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,61 @@
+"""
+Modelo generado por drone_optimization.codegen; no editar a mano
+
+Regenerar con `drone-optimization codegen` tras cambiar codegen.MODEL.
+"""
+import numpy
+
+MODEL_HASH = 'a5b1ed02a64b40b4ee7d79c405dc8bc1392341c7246346bd484d81f2dc1d2482'
+PARAMETERS = ('c_A', 'c_B', 'c_C', 'autonomy', 'priority_ratio', 'balance_ratio')
+VARIABLES = ('s', 'w', 'j')
+MULTIPLIERS = ('lambda1', 'lambda2', 'lambda3')
+OBJECTIVE = 'c_A*s + c_B*w + c_C*j'
+CONSTRAINTS = ('s + w + j - autonomy', 's - priority_ratio*j', 'w - (balance_ratio*c_A/c_B)*s')
+
+
+def objective(s, w, j, c_A, c_B, c_C, autonomy, priority_ratio, balance_ratio):
+    """Valor de la función objetivo"""
+    return (c_A*s + c_B*w + c_C*j,)
+
+
+def constraints(s, w, j, c_A, c_B, c_C, autonomy, priority_ratio, balance_ratio):
+    """Valores de g₁, g₂, g₃"""
+    return (-autonomy + j + s + w, -j*priority_ratio + s, -balance_ratio*c_A*s/c_B + w)
+
+
+def gradients(s, w, j, c_A, c_B, c_C, autonomy, priority_ratio, balance_ratio):
+    """∇f, ∇g₁, ∇g₂, ∇g₃ (una fila por función)"""
+    return (
+        (c_A, c_B, c_C),
+        (1, 1, 1),
+        (1, 0, -priority_ratio),
+        (-balance_ratio*c_A/c_B, 1, 0),
+    )
+
+
+def lagrangian_hessian(s, w, j, lambda1, lambda2, lambda3, c_A, c_B, c_C, autonomy, priority_ratio, balance_ratio):
+    """Hessiana del Lagrangiano respecto a las variables"""
+    return (
+        (0, 0, 0),
+        (0, 0, 0),
+        (0, 0, 0),
+    )
+
+
+def kkt_system(c_A, c_B, c_C, autonomy, priority_ratio, balance_ratio):
+    """Entradas de M (6x6, por filas) seguidas de r en M·z = r"""
+    _x0 = balance_ratio*c_A/c_B
+    return (0, 0, 0, -1, -1, _x0, 0, 0, 0, -1, 0, -1, 0, 0, 0, -1, priority_ratio, 0, 1, 1, 1, 0, 0, 0, 1, 0, -priority_ratio, 0, 0, 0, -_x0, 1, 0, 0, 0, 0, -c_A, -c_B, -c_C, autonomy, 0, 0)
+
+
+def kkt_solution(c_A, c_B, c_C, autonomy, priority_ratio, balance_ratio):
+    """Solución cerrada z = (s, w, j, lambda1, lambda2, lambda3)"""
+    _x0 = c_B*priority_ratio
+    _x1 = c_A*priority_ratio
+    _x2 = _x1*balance_ratio
+    _x3 = (_x0 + _x2 + c_B)**(-1.0)
+    _x4 = _x3*autonomy
+    _x5 = _x3*c_B
+    _x6 = _x1 + c_C
+    _x7 = c_A*c_B
+    return (_x0*_x4, _x2*_x4, _x5*autonomy, _x5*(_x2 + _x6), _x3*(_x7*balance_ratio + _x7 - balance_ratio*c_A*c_C - c_B*c_C), -_x5*(-_x0 + _x6 - c_B))
@@ -0,0 +1,273 @@
+"""
+Benchmark reproducible de los métodos de solución
+
+Compara, para distintos tamaños de lote y números de zonas:
+- slsqp: DroneOptimization.solve_optimization() escenario por escenario
+- analytical: DroneOptimization.analytical_solution() escenario por escenario
+- closed_form: solve_batch() vectorizado
+- sympy_kkt: LagrangeAnalysis.solve_kkt_conditions() (informe simbólico completo)
+- kkt_compiled: solve_kkt_batch() (sistema KKT compilado)
+- lp_highs: NZoneModel.solve() (HiGHS)
+
+Para cada caso se mide tiempo de pared, pico de memoria (tracemalloc),
+iteraciones del solver y error máximo frente a la solución de referencia. SLSQP
+resuelve la autonomía como desigualdad (s + w + j <= L), así que su error se
+mide frente al óptimo de ese problema (presolve_batch) y no frente a solve_batch;
+error_kind indica la referencia de cada fila.
+Los resultados se guardan como JSON para seguir regresiones entre versiones.
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import scipy
+
+from . import __version__
+from .lagrange_analysis import solve_kkt_batch
+from .lp_solver import NZoneModel
+from .optimization_solver import DroneOptimization, solve_batch
+from .presolve import presolve_batch
+from .spec import PARAMETERS
+
+
+def make_scenarios(n, seed=0):
+    """
+    n escenarios aleatorios alrededor del problema base, reproducibles con seed
+    """
+    rng = np.random.default_rng(seed)
+    return {
+        'c_A': rng.uniform(1.0, 1.4, n),
+        'c_B': rng.uniform(0.7, 1.1, n),
+        'c_C': rng.uniform(1.2, 1.8, n),
+        'autonomy': rng.uniform(10, 20, n),
+        'priority_ratio': rng.uniform(1.5, 2.5, n),
+        'balance_ratio': rng.uniform(0.8, 1.2, n),
+    }
+
+
+def _optimizer(params, k):
+    optimizer = DroneOptimization()
+    for name in PARAMETERS:
+        setattr(optimizer, name, float(params[name][k]))
+    return optimizer
+
+
+def _size(params):
+    return params['autonomy'].size
+
+
+# Cada método devuelve (x de forma (n, 3), iteraciones totales o None)
+def run_closed_form(params):
+    result = solve_batch(*(params[name] for name in PARAMETERS))
+    return np.column_stack([result.s, result.w, result.j]), None
+
+
+def run_kkt_compiled(params):
+    result = solve_kkt_batch(*(params[name] for name in PARAMETERS))
+    return np.column_stack([result.s, result.w, result.j]), None
+
+
+def run_analytical(params):
+    x = np.array([_optimizer(params, k).analytical_solution() for k in range(_size(params))])
+    return x.reshape(-1, 3), None
+
+
+def run_slsqp(params):
+    # SLSQP usa la autonomía como desigualdad (ver constraint_autonomy)
+    x, iterations = [], 0
+    for k in range(_size(params)):
+        result = _optimizer(params, k).solve_optimization()
+        x.append(result.x)
+        iterations += result.nit
+    return np.array(x).reshape(-1, 3), iterations
+
+
+def run_sympy_kkt(params):
+    from .lagrange_analysis import LagrangeAnalysis
+
+    x = []
+    for k in range(_size(params)):
+        analyzer = LagrangeAnalysis(**{name: float(params[name][k]) for name in PARAMETERS})
+        with contextlib.redirect_stdout(io.StringIO()):
+            solution = analyzer.solve_kkt_conditions()
+        x.append(solution[:3] if solution else (np.nan,) * 3)
+    return np.array(x, dtype=float).reshape(-1, 3), None
+
+
+def run_lp_highs(params):
+    x, iterations = [], 0
+    for k in range(_size(params)):
+        result = NZoneModel.from_drone_optimization(_optimizer(params, k)).solve()
+        x.append(result.x)
+        iterations += result.nit
+    return np.array(x).reshape(-1, 3), iterations
+
+
+def inequality_optimum(params):
+    """
+    Óptimo del problema con la autonomía como desigualdad (el que resuelve SLSQP)
+    """
+    result = presolve_batch(*(params[name] for name in PARAMETERS))
+    return np.column_stack([result.s, result.w, result.j])
+
+
+# Métodos que no resuelven el problema con la autonomía activa:
+# método -> (referencia, error_kind)
+REFERENCES = {
+    'slsqp': (inequality_optimum, 'max_abs_error_vs_inequality_optimum'),
+}
+
+# Método -> (función, tamaño de lote máximo razonable)
+BATCH_METHODS = {
+    'closed_form': (run_closed_form, None),
+    'kkt_compiled': (run_kkt_compiled, None),
+    'analytical': (run_analytical, 10_000),
+    'lp_highs': (run_lp_highs, 1_000),
+    'slsqp': (run_slsqp, 1_000),
+    'sympy_kkt': (run_sympy_kkt, 10),
+}
+
+
+def make_zone_model(n_zones, seed=0):
+    """
+    Modelo de N zonas aleatorio: las zonas se agrupan de tres en tres con una
+    fila de razón (cobertura) y una de equilibrio por grupo
+    """
+    rng = np.random.default_rng(seed)
+    costs = rng.uniform(0.5, 2.0, n_zones)
+    first = np.arange(0, n_zones - 2, 3)
+    ratios = np.column_stack([first, first + 2, np.full(first.size, 2.0)])
+    balances = np.column_stack([first + 1, first, np.ones(first.size)])
+    return NZoneModel(costs, autonomy=5.0 * n_zones, ratios=ratios, balances=balances,
+                      upper=20.0)
+
+
+def measure(fn, *args, repeat=3):
+    """
+    Devuelve (resultado, mejor tiempo en s, pico de memoria en bytes)
+
+    Una primera ejecución de calentamiento deja fuera de la medición las
+    cachés de compilación (p. ej. el sistema KKT compilado). El pico de memoria
+    se mide en una ejecución aparte para que tracemalloc no distorsione los tiempos.
+    """
+    fn(*args)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, min(timings), peak
+
+
+def _record(method, batch_size, n_zones, wall, peak, iterations, error, error_kind):
+    return {
+        'method': method,
+        'batch_size': batch_size,
+        'n_zones': n_zones,
+        'wall_time_s': wall,
+        'time_per_scenario_s': wall / batch_size,
+        'memory_peak_bytes': peak,
+        'iterations': iterations,
+        'error': error,
+        'error_kind': error_kind,
+    }
+
+
+def run_benchmarks(batch_sizes=(1, 10, 100, 1_000, 100_000), zone_counts=(3, 30, 300, 3_000),
+                   methods=tuple(BATCH_METHODS), repeat=3, seed=0):
+    """
+    Ejecuta el benchmark completo y devuelve un diccionario serializable a JSON
+    """
+    records = []
+
+    for batch_size in batch_sizes:
+        params = make_scenarios(batch_size, seed)
+        closed_form, _ = run_closed_form(params)
+        for method in methods:
+            fn, max_batch = BATCH_METHODS[method]
+            if max_batch is not None and batch_size > max_batch:
+                continue
+            (x, iterations), wall, peak = measure(fn, params, repeat=repeat)
+            if method in REFERENCES:
+                reference_fn, error_kind = REFERENCES[method]
+                reference = reference_fn(params)
+            else:
+                reference, error_kind = closed_form, 'max_abs_error_vs_closed_form'
+            error = float(np.nanmax(np.abs(x - reference))) if batch_size else 0.0
+            records.append(_record(method, batch_size, 3, wall, peak, iterations,
+                                   error, error_kind))
+
+    for n_zones in zone_counts:
+        model = make_zone_model(n_zones, seed)
+        result, wall, peak = measure(model.solve, repeat=repeat)
+        _, _, _, A_eq, b_eq, _ = model.build()
+        residual = float(np.max(np.abs(A_eq @ result.x - b_eq))) if result.success else float('nan')
+        records.append(_record('lp_highs', 1, n_zones, wall, peak, int(result.nit),
+                               residual, 'max_equality_residual'))
+
+    return {
+        'metadata': {
+            'package_version': __version__,
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'scipy': scipy.__version__,
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'results': records,
+    }
+
+
+def save_results(results, path):
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump(results, fh, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='drone-optimization bench',
+                                     description='Benchmark de los métodos de solución')
+    parser.add_argument('--output', default='benchmark-results.json', help='archivo JSON de salida')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 10, 100, 1_000, 100_000])
+    parser.add_argument('--zone-counts', type=int, nargs='+', default=[3, 30, 300, 3_000])
+    parser.add_argument('--methods', nargs='+', choices=list(BATCH_METHODS), default=list(BATCH_METHODS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print("BENCHMARK DE MÉTODOS DE SOLUCIÓN")
+    print("="*78)
+
+    results = run_benchmarks(args.batch_sizes, args.zone_counts, args.methods, args.repeat, args.seed)
+
+    print(f"{'Método':<14}{'Lote':>9}{'Zonas':>7}{'Tiempo (s)':>13}{'Memoria (KB)':>14}{'Iter.':>8}{'Error':>13}")
+    for r in results['results']:
+        iterations = '-' if r['iterations'] is None else r['iterations']
+        print(f"{r['method']:<14}{r['batch_size']:>9}{r['n_zones']:>7}{r['wall_time_s']:>13.6f}"
+              f"{r['memory_peak_bytes'] / 1024:>14.1f}{iterations:>8}{r['error']:>13.3e}")
+    for method in REFERENCES:
+        if method in args.methods:
+            print(f"Error de {method}: {REFERENCES[method][1]}")
+
+    save_results(results, args.output)
+    print(f"\nResultados guardados en {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""
+Caché de soluciones con desalojo LRU y persistencia opcional en disco
+
+Las claves son un hash canónico de los parámetros del problema y de la versión
+de los solvers (paquete y CACHE_VERSION), así que una versión nueva no lee
+soluciones guardadas por otra. El nivel en memoria tiene tamaño acotado; el
+nivel en disco (SQLite en modo WAL) sobrevive a reinicios y puede compartirse
+entre varios procesos trabajadores.
+
+La caché guarda y devuelve copias de los arreglos de NumPy de cada valor: un
+llamador que modifica result.x no altera la entrada en caché.
+"""
+import copy
+import hashlib
+import json
+import numbers
+import os
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from . import __version__
+
+# Marcador de ausencia (None puede ser un valor válido en caché)
+MISSING = object()
+
+# Se incrementa cuando cambia el resultado de un solver para no reutilizar entradas antiguas
+CACHE_VERSION = 1
+
+
+def canonical_key(namespace, **params):
+    """
+    Hash estable de un método, sus parámetros y la versión de los solvers
+
+    Los valores numéricos se normalizan a float para que 15, 15.0 y np.float64(15)
+    produzcan la misma clave.
+    """
+    normalized = {
+        name: float(value) if isinstance(value, numbers.Real) else value
+        for name, value in params.items()
+    }
+    payload = json.dumps({'namespace': namespace, 'params': normalized,
+                          'version': [__version__, CACHE_VERSION]},
+                         sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def copy_arrays(value):
+    """
+    Copia de value con sus arreglos de NumPy copiados (también dentro de
+    diccionarios, como OptimizeResult, y de namedtuples); el resto se comparte
+    """
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, dict):
+        copied = copy.copy(value)
+        for name, item in value.items():
+            if isinstance(item, np.ndarray):
+                copied[name] = item.copy()
+        return copied
+    if isinstance(value, tuple) and hasattr(value, '_replace'):
+        return value._replace(**{name: item.copy() for name, item in value._asdict().items()
+                                 if isinstance(item, np.ndarray)})
+    return value
+
+
+class SolutionCache:
+    """
+    Caché de dos niveles: memoria (LRU de maxsize entradas) y disco opcional (path)
+    """
+
+    def __init__(self, maxsize=1024, path=None, timeout=30.0):
+        self.maxsize = maxsize
+        self.path = path
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        self._connection_pid = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # --- Nivel en disco -------------------------------------------------
+
+    def _db(self):
+        # Cada proceso abre su propia conexión (no se comparten tras un fork)
+        if self._connection is None or self._connection_pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, value BLOB)')
+            connection.commit()
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def _disk_get(self, key):
+        row = self._db().execute('SELECT value FROM solutions WHERE key = ?', (key,)).fetchone()
+        return MISSING if row is None else pickle.loads(row[0])
+
+    def _disk_set(self, key, value):
+        db = self._db()
+        with db:
+            db.execute('INSERT OR REPLACE INTO solutions (key, value) VALUES (?, ?)',
+                       (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    # --- Nivel en memoria ------------------------------------------------
+
+    def _memory_set(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key, default=MISSING):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy_arrays(self._entries[key])
+
+            if self.path is not None:
+                value = self._disk_get(key)
+                if value is not MISSING:
+                    self.hits += 1
+                    self.disk_hits += 1
+                    self._memory_set(key, value)
+                    return copy_arrays(value)
+
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        with self._lock:
+            # Copia propia: el llamador puede seguir modificando value
+            self._memory_set(key, copy_arrays(value))
+            if self.path is not None:
+                self._disk_set(key, value)
+
+    def get_or_compute(self, key, compute):
+        """
+        Devuelve el valor en caché o lo calcula con compute() y lo guarda
+        """
+        value = self.get(key)
+        if value is MISSING:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._entries.clear()
+            if disk and self.path is not None:
+                db = self._db()
+                with db:
+                    db.execute('DELETE FROM solutions')
+
+    def close(self):
+        if self._connection is not None and self._connection_pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        # La conexión y el lock no se serializan; cada proceso abre los suyos
+        state = self.__dict__.copy()
+        state.update(_lock=None, _connection=None, _connection_pid=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self):
+        """
+        Estadísticas de aciertos y fallos
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
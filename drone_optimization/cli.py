@@ -0,0 +1,80 @@
+"""
+Punto de entrada de línea de comandos
+
+    drone-optimization solve      # Solución numérica y analítica
+    drone-optimization lp         # Modelo lineal de N zonas (HiGHS)
+    drone-optimization presolve   # Diagnóstico de infactibilidad y redundancia
+    drone-optimization replan     # Re-solución incremental (conjunto activo)
+    drone-optimization sweep      # Barrido de sensibilidad multiparamétrico
+    drone-optimization stream     # Escenarios desde JSONL/CSV en micro-lotes
+    drone-optimization serve      # Servicio HTTP/JSON con micro-lotes
+    drone-optimization route      # Ruta entre puntos de paso (2-opt/Or-opt)
+    drone-optimization terrain    # Coeficientes a partir de un ráster de costos
+    drone-optimization fleet      # Asignación de zonas a una flota de drones
+    drone-optimization robust     # Robustez por Monte Carlo
+    drone-optimization pareto     # Frente de Pareto energía-cobertura-tiempo
+    drone-optimization simulate   # Simulación temporal de misiones (batería)
+    drone-optimization plot       # Visualizaciones
+    drone-optimization render     # Dashboards a archivos (sin interfaz)
+    drone-optimization lagrange   # Análisis de Lagrange
+    drone-optimization codegen    # Generar el modelo NumPy desde SymPy
+    drone-optimization bench      # Benchmark de los métodos de solución
+
+Los argumentos que siguen al subcomando se pasan a su main(), p. ej.
+`drone-optimization bench --output results.json`; los subcomandos sin opciones
+los rechazan con un error de uso.
+"""
+import argparse
+from importlib import import_module
+from inspect import signature
+
+# Subcomando -> (módulo, ayuda); cada módulo se importa solo si se usa
+COMMANDS = {
+    'solve': ('optimization_solver', 'Solución numérica y analítica'),
+    'lp': ('lp_solver', 'Modelo lineal de N zonas (HiGHS)'),
+    'presolve': ('presolve', 'Diagnóstico de infactibilidad y redundancia'),
+    'replan': ('parametric', 'Re-solución incremental con multiplicadores de Lagrange'),
+    'sweep': ('sweep', 'Barrido de sensibilidad multiparamétrico'),
+    'stream': ('stream', 'Resolver escenarios desde JSONL/CSV en micro-lotes'),
+    'serve': ('service', 'Servicio HTTP/JSON de planificación con micro-lotes'),
+    'route': ('routing', 'Ruta de bajo consumo entre puntos de paso'),
+    'terrain': ('terrain', 'Coeficientes efectivos desde un ráster de costos'),
+    'fleet': ('fleet', 'Asignación de zonas a una flota de drones'),
+    'robust': ('robustness', 'Análisis de robustez por Monte Carlo'),
+    'pareto': ('pareto', 'Frente de Pareto energía-cobertura-tiempo'),
+    'simulate': ('simulation', 'Simulación temporal de misiones y batería'),
+    'plot': ('visualization', 'Generar visualizaciones'),
+    'bench': ('benchmark', 'Benchmark de los métodos de solución'),
+    'render': ('render', 'Renderizar dashboards a archivos sin interfaz'),
+    'lagrange': ('lagrange_analysis', 'Análisis con multiplicadores de Lagrange'),
+    'codegen': ('codegen', 'Generar el módulo NumPy del modelo simbólico'),
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='drone-optimization',
+        description='Optimización de recorrido de drones para monitoreo agrícola',
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        subparsers.add_parser(name, help=help_text, add_help=False)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    module_name, _ = COMMANDS[args.command]
+    module = import_module(f'drone_optimization.{module_name}')
+    # Los main(argv=None) con argparse reciben la lista aunque esté vacía; si no,
+    # leerían sys.argv e interpretarían el nombre del subcomando como argumento
+    if signature(module.main).parameters:
+        return module.main(extra)
+    # Los demás no aceptan argumentos: argparse rechaza los sobrantes
+    parser.parse_args(argv)
+    return module.main()
+
+
+if __name__ == '__main__':
+    main()
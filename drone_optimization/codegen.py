@@ -0,0 +1,220 @@
+"""
+Generación anticipada (AOT) del modelo simbólico a un módulo NumPy puro
+
+SymPy se usa una sola vez, en la etapa de construcción, para derivar los
+gradientes, las Hessianas, el sistema KKT y su solución cerrada en función de
+los parámetros. El resultado se escribe como código Python que solo importa
+NumPy, de modo que los trabajadores de producción hacen el análisis de Lagrange
+sin importar SymPy.
+
+El módulo generado lleva el hash de la definición del modelo (MODEL) y de la
+versión del generador. load_model() busca, en orden:
+
+1. el módulo incluido en el paquete (`_generated_model.py`)
+2. la caché en disco (DRONE_OPTIMIZATION_CACHE_DIR o ~/.cache/drone_optimization)
+3. una nueva generación con SymPy, que se guarda en la caché
+
+y descarta cualquier módulo cuyo hash no coincida. Tras cambiar MODEL se
+regenera el módulo incluido con `drone-optimization codegen`.
+"""
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+from functools import lru_cache
+
+from .spec import PARAMETERS
+
+# Definición del modelo: expresiones en texto para poder calcular el hash sin SymPy
+MODEL = {
+    'parameters': PARAMETERS,
+    'variables': ('s', 'w', 'j'),
+    'multipliers': ('lambda1', 'lambda2', 'lambda3'),
+    'objective': 'c_A*s + c_B*w + c_C*j',
+    'constraints': (
+        's + w + j - autonomy',                 # Autonomía
+        's - priority_ratio*j',                 # Cobertura prioritaria
+        'w - (balance_ratio*c_A/c_B)*s',        # Equilibrio energético
+    ),
+}
+
+# Se incrementa cuando cambia el código emitido
+GENERATOR_VERSION = 1
+
+BUNDLED_MODULE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_generated_model.py')
+
+
+def model_hash(model=None):
+    """
+    Hash estable de la definición del modelo (por defecto MODEL) y de la versión del generador
+    """
+    model = model or MODEL
+    payload = json.dumps({'model': model, 'generator': GENERATOR_VERSION},
+                         sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def cache_dir():
+    return os.environ.get('DRONE_OPTIMIZATION_CACHE_DIR') or os.path.join(
+        os.path.expanduser('~'), '.cache', 'drone_optimization')
+
+
+def _function(printer, name, args, outputs, doc, shape=None):
+    """
+    Emite una función que evalúa `outputs` con subexpresiones comunes compartidas
+
+    shape: (filas, columnas) para devolver una tupla de tuplas
+    """
+    import sympy as sp
+
+    replacements, reduced = sp.cse(outputs, symbols=sp.numbered_symbols('_x'))
+    lines = [f'def {name}({", ".join(args)}):', f'    """{doc}"""']
+    lines += [f'    {symbol} = {printer.doprint(expr)}' for symbol, expr in replacements]
+    values = [printer.doprint(expr) for expr in reduced]
+    if shape is None:
+        trailing = ',' if len(values) == 1 else ''
+        lines.append(f'    return ({", ".join(values)}{trailing})')
+    else:
+        rows, cols = shape
+        lines.append('    return (')
+        lines += [f'        ({", ".join(values[r*cols:(r + 1)*cols])}),' for r in range(rows)]
+        lines.append('    )')
+    return '\n'.join(lines)
+
+
+def generate_source(model=None):
+    """
+    Deriva el modelo con SymPy y devuelve el código del módulo generado
+    """
+    model = model or MODEL
+    import sympy as sp
+    from sympy.printing.numpy import NumPyPrinter
+
+    names = model['parameters'] + model['variables'] + model['multipliers']
+    symbol = {name: sp.Symbol(name, real=True) for name in names}
+    params = [symbol[name] for name in model['parameters']]
+    x = [symbol[name] for name in model['variables']]
+    lam = [symbol[name] for name in model['multipliers']]
+
+    f = sp.sympify(model['objective'], locals=symbol)
+    g = [sp.sympify(expr, locals=symbol) for expr in model['constraints']]
+    lagrangian = f - sum(l*gi for l, gi in zip(lam, g))
+
+    gradients = [sp.diff(expr, var) for expr in [f] + g for var in x]
+    hessian = list(sp.hessian(lagrangian, x))
+    equations = [sp.diff(lagrangian, var) for var in x] + g
+    M, r = sp.linear_eq_to_matrix(equations, x + lam)
+    solution = [sp.factor(sp.simplify(expr)) for expr in M.LUsolve(r)]
+
+    printer = NumPyPrinter()
+    p_args = list(model['parameters'])
+    x_args = list(model['variables'])
+    n, m = len(x), len(x) + len(lam)
+
+    functions = [
+        _function(printer, 'objective', x_args + p_args, [f], 'Valor de la función objetivo'),
+        _function(printer, 'constraints', x_args + p_args, g, 'Valores de g₁, g₂, g₃'),
+        _function(printer, 'gradients', x_args + p_args, gradients,
+                  '∇f, ∇g₁, ∇g₂, ∇g₃ (una fila por función)', shape=(1 + len(g), n)),
+        _function(printer, 'lagrangian_hessian', x_args + list(model['multipliers']) + p_args,
+                  hessian, 'Hessiana del Lagrangiano respecto a las variables', shape=(n, n)),
+        _function(printer, 'kkt_system', p_args, list(M) + list(r),
+                  f'Entradas de M ({m}x{m}, por filas) seguidas de r en M·z = r'),
+        _function(printer, 'kkt_solution', p_args, solution,
+                  'Solución cerrada z = (' + ', '.join(model['variables'] + model['multipliers']) + ')'),
+    ]
+
+    header = [
+        '"""',
+        'Modelo generado por drone_optimization.codegen; no editar a mano',
+        '',
+        'Regenerar con `drone-optimization codegen` tras cambiar codegen.MODEL.',
+        '"""',
+        'import numpy',
+        '',
+        f'MODEL_HASH = {model_hash(model)!r}',
+        f'PARAMETERS = {tuple(model["parameters"])!r}',
+        f'VARIABLES = {tuple(model["variables"])!r}',
+        f'MULTIPLIERS = {tuple(model["multipliers"])!r}',
+        f'OBJECTIVE = {model["objective"]!r}',
+        f'CONSTRAINTS = {tuple(model["constraints"])!r}',
+    ]
+    return '\n'.join(header) + '\n\n\n' + '\n\n\n'.join(functions) + '\n'
+
+
+def _import_file(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_module(path, model=None):
+    """
+    Genera el módulo y lo escribe de forma atómica
+    """
+    source = generate_source(model)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as fh:
+        fh.write(source)
+    os.replace(tmp_path, path)
+    return path
+
+
+@lru_cache(maxsize=None)
+def load_model(directory=None):
+    """
+    Módulo generado vigente para MODEL (ver el orden de búsqueda arriba)
+    """
+    expected = model_hash()
+
+    if os.path.exists(BUNDLED_MODULE):
+        module = _import_file(BUNDLED_MODULE, 'drone_optimization._generated_model')
+        if module.MODEL_HASH == expected:
+            return module
+
+    path = os.path.join(directory or cache_dir(), f'model_{expected[:16]}.py')
+    if os.path.exists(path):
+        module = _import_file(path, f'drone_optimization_model_{expected[:16]}')
+        if module.MODEL_HASH == expected:
+            return module
+
+    try:
+        import sympy  # noqa: F401
+    except ImportError:
+        raise RuntimeError(
+            "El modelo generado no coincide con codegen.MODEL y SymPy no está instalado; "
+            "ejecute `drone-optimization codegen` donde SymPy esté disponible"
+        ) from None
+    write_module(path)
+    return _import_file(path, f'drone_optimization_model_{expected[:16]}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='drone-optimization codegen',
+                                     description='Genera el módulo NumPy del modelo simbólico')
+    parser.add_argument('-o', '--output', default=BUNDLED_MODULE,
+                        help='archivo de salida (por defecto, el módulo incluido en el paquete)')
+    parser.add_argument('--check', action='store_true',
+                        help='solo comprueba que el módulo incluido esté vigente')
+    args = parser.parse_args(argv)
+
+    expected = model_hash()
+    if args.check:
+        current = None
+        if os.path.exists(args.output):
+            current = _import_file(args.output, 'drone_optimization._generated_model').MODEL_HASH
+        status = 'vigente' if current == expected else 'desactualizado'
+        print(f"{args.output}: {status} (hash del modelo {expected[:16]})")
+        return 0 if current == expected else 1
+
+    write_module(args.output)
+    print(f"Modelo generado en {args.output} (hash {expected[:16]})")
+    return 0
+
+
+if __name__ == '__main__':
+    main()
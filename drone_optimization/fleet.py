@@ -0,0 +1,281 @@
+"""
+Asignación de zonas a una flota de drones
+
+Cada zona z tiene un costo por km c_z (como c_A, c_B, c_C) y una distancia de
+cobertura requerida d_z. Cada dron k tiene su propia autonomía L_k (límite de
+batería en km) y un multiplicador de costo m_k (eficiencia del equipo). Solo
+existen variables para los pares dron-zona elegibles:
+
+    min  Σ m_k·c_z·x_kz  (+ Σ f·y_kz si hay costo de asignación)
+    s.a. Σ_k x_kz = d_z          (cobertura de cada zona)
+         Σ_z x_kz <= L_k         (autonomía de cada dron)
+         x_kz <= u_kz·y_kz       (solo MILP: el dron vuela en la zona si se le asigna)
+         Σ_z y_kz <= max_zones   (solo MILP)
+
+Los pares elegibles forman un grafo bipartito; cada componente conexa es un
+subproblema independiente y los subproblemas se resuelven en paralelo.
+"""
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linprog
+from scipy.sparse.csgraph import connected_components
+
+FleetAssignment = namedtuple('FleetAssignment', [
+    'assignment',      # csr_array (K, Z): km que vuela cada dron en cada zona
+    'energy',          # consumo energético total de la flota
+    'objective',       # energía + costos de asignación
+    'drone_distance',  # km asignados a cada dron
+    'drone_energy',    # consumo de cada dron
+    'unserved',        # zonas sin solución factible (sin drones o sin autonomía suficiente)
+    'components',      # número de subproblemas independientes
+    'success',         # True si todos los subproblemas se resolvieron
+])
+
+
+class FleetModel:
+    """
+    Modelo disperso de asignación dron-zona resuelto con HiGHS
+
+    zone_costs, demands: arreglos (Z,) con el costo por km y los km a cubrir por zona
+    autonomy, multipliers: escalares o arreglos (K,) con la autonomía en km y el
+        multiplicador de costo de cada dron
+    eligible: None (todos los pares) o matriz booleana (K, Z), densa o dispersa
+    assignment_cost, max_zones: si alguno está activo el modelo es un MILP
+    """
+
+    def __init__(self, zone_costs, demands, autonomy, multipliers=1.0, eligible=None,
+                 n_drones=None, assignment_cost=0.0, max_zones=None):
+        self.zone_costs = np.asarray(zone_costs, dtype=float)
+        self.n_zones = self.zone_costs.size
+        self.demands = np.broadcast_to(np.asarray(demands, dtype=float), (self.n_zones,))
+
+        if n_drones is None:
+            n_drones = (eligible.shape[0] if eligible is not None
+                        else np.size(autonomy) if np.ndim(autonomy) else np.size(multipliers))
+        self.n_drones = int(n_drones)
+        self.autonomy = np.broadcast_to(np.asarray(autonomy, dtype=float), (self.n_drones,))
+        self.multipliers = np.broadcast_to(np.asarray(multipliers, dtype=float), (self.n_drones,))
+
+        if eligible is None:
+            drone, zone = np.divmod(np.arange(self.n_drones * self.n_zones), self.n_zones)
+        else:
+            eligible = sparse.coo_array(eligible)
+            if eligible.shape != (self.n_drones, self.n_zones):
+                raise ValueError(f"eligible debe tener forma ({self.n_drones}, {self.n_zones})")
+            mask = eligible.data != 0
+            order = np.lexsort((eligible.col[mask], eligible.row[mask]))
+            drone, zone = eligible.row[mask][order], eligible.col[mask][order]
+        self.drone = drone.astype(np.intp)
+        self.zone = zone.astype(np.intp)
+
+        self.assignment_cost = float(assignment_cost)
+        self.max_zones = max_zones
+
+    @classmethod
+    def from_positions(cls, zone_costs, demands, zone_xy, drone_xy, autonomy,
+                       multipliers=1.0, **kwargs):
+        """
+        Pares elegibles: zonas a las que el dron puede ir y volver desde su base
+
+        zone_xy, drone_xy: coordenadas (Z, 2) y (K, 2) en km
+        """
+        from scipy.spatial import cKDTree
+
+        drone_xy = np.asarray(drone_xy, dtype=float)
+        autonomy = np.broadcast_to(np.asarray(autonomy, dtype=float), (len(drone_xy),))
+        tree = cKDTree(np.asarray(zone_xy, dtype=float))
+        reachable = tree.query_ball_point(drone_xy, r=0.5 * autonomy)
+
+        counts = np.fromiter((len(zones) for zones in reachable), dtype=np.intp, count=len(drone_xy))
+        drone = np.repeat(np.arange(len(drone_xy)), counts)
+        zone = np.fromiter((z for zones in reachable for z in zones), dtype=np.intp, count=counts.sum())
+        eligible = sparse.coo_array((np.ones(drone.size, dtype=bool), (drone, zone)),
+                                    shape=(len(drone_xy), len(zone_xy)))
+        return cls(zone_costs, demands, autonomy, multipliers, eligible, **kwargs)
+
+    def pair_costs(self):
+        """
+        Costo por km de cada par elegible: m_k·c_z
+        """
+        return self.multipliers[self.drone] * self.zone_costs[self.zone]
+
+    def components(self):
+        """
+        Componentes conexas del grafo bipartito dron-zona
+
+        Devuelve (n, etiqueta de cada dron, etiqueta de cada zona).
+        """
+        graph = sparse.coo_array((np.ones(self.drone.size), (self.drone, self.n_drones + self.zone)),
+                                 shape=(self.n_drones + self.n_zones,) * 2)
+        n, labels = connected_components(graph, directed=False)
+        return n, labels[:self.n_drones], labels[self.n_drones:]
+
+    def subproblems(self):
+        """
+        Divide el modelo en subproblemas independientes
+
+        Cada subproblema es una tupla de arreglos con índices locales, lista para
+        enviarse a otro proceso: (pares, dron local, zona local, costos, cotas,
+        demandas, autonomías, costo de asignación, max_zones, zonas globales).
+        """
+        n, drone_labels, zone_labels = self.components()
+        costs = self.pair_costs()
+        pair_labels = drone_labels[self.drone]
+
+        pair_order = np.argsort(pair_labels, kind='stable')
+        drone_order = np.argsort(drone_labels, kind='stable')
+        zone_order = np.argsort(zone_labels, kind='stable')
+        pair_split = np.searchsorted(pair_labels[pair_order], np.arange(n + 1))
+        drone_split = np.searchsorted(drone_labels[drone_order], np.arange(n + 1))
+        zone_split = np.searchsorted(zone_labels[zone_order], np.arange(n + 1))
+
+        for label in range(n):
+            pairs = pair_order[pair_split[label]:pair_split[label + 1]]
+            if pairs.size == 0:
+                continue   # dron o zona aislados: no hay nada que resolver
+            zones = zone_order[zone_split[label]:zone_split[label + 1]]
+            drones = drone_order[drone_split[label]:drone_split[label + 1]]
+            drone_local = np.searchsorted(drones, self.drone[pairs])
+            zone_local = np.searchsorted(zones, self.zone[pairs])
+            upper = np.minimum(self.autonomy[self.drone[pairs]], self.demands[self.zone[pairs]])
+            yield (pairs, drone_local, zone_local, costs[pairs], upper, self.demands[zones],
+                   self.autonomy[drones], self.assignment_cost, self.max_zones, zones)
+
+    def solve(self, workers=None, tasks_per_worker=4, **options):
+        """
+        Resuelve todos los subproblemas y combina la asignación
+
+        workers: número de procesos (None = todos los núcleos, 1 = sin pool)
+        """
+        subproblems = sorted(self.subproblems(), key=lambda sub: -sub[0].size)
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(subproblems))
+        if workers <= 1:
+            results = [_solve_subproblem(sub, options) for sub in subproblems]
+        else:
+            # Reparto cíclico de los subproblemas (ordenados por tamaño) en pocas tareas
+            n_tasks = min(len(subproblems), workers * tasks_per_worker)
+            tasks = [(subproblems[k::n_tasks], options) for k in range(n_tasks)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = list(executor.map(_solve_subproblems, tasks))
+            results = [None] * len(subproblems)
+            for k, chunk in enumerate(chunks):
+                results[k::n_tasks] = chunk
+
+        x = np.zeros(self.drone.size)
+        assigned = 0
+        # Zonas con demanda a las que no llega ningún dron
+        isolated = np.bincount(self.zone, minlength=self.n_zones) == 0
+        unserved = [np.flatnonzero(isolated & (self.demands > 0))]
+        for sub, (values, n_assigned) in zip(subproblems, results):
+            if values is None:
+                unserved.append(sub[-1])
+            else:
+                x[sub[0]] = values
+                assigned += n_assigned
+
+        pair_energy = self.pair_costs() * x
+        energy = float(pair_energy.sum())
+        unserved = np.sort(np.concatenate(unserved))
+        return FleetAssignment(
+            assignment=sparse.csr_array((x, (self.drone, self.zone)),
+                                        shape=(self.n_drones, self.n_zones)),
+            energy=energy,
+            objective=energy + self.assignment_cost * assigned,
+            drone_distance=np.bincount(self.drone, x, minlength=self.n_drones),
+            drone_energy=np.bincount(self.drone, pair_energy, minlength=self.n_drones),
+            unserved=unserved,
+            components=len(subproblems),
+            success=unserved.size == 0,
+        )
+
+
+def _solve_subproblem(subproblem, options):
+    """
+    Resuelve un subproblema; devuelve (km por par, pares asignados) o (None, 0)
+    """
+    _, drone_local, zone_local, costs, upper, demands, autonomy, assignment_cost, max_zones, _ = subproblem
+    n = costs.size
+    columns = np.arange(n)
+    coverage = sparse.csr_array((np.ones(n), (zone_local, columns)), shape=(demands.size, n))
+    capacity = sparse.csr_array((np.ones(n), (drone_local, columns)), shape=(autonomy.size, n))
+
+    if not (max_zones is not None or assignment_cost > 0):
+        result = linprog(costs, A_ub=capacity, b_ub=autonomy, A_eq=coverage, b_eq=demands,
+                         bounds=np.column_stack([np.zeros(n), upper]), method='highs',
+                         options=options or None)
+        return (result.x, np.count_nonzero(result.x > 0)) if result.success else (None, 0)
+
+    # MILP: variables [x, y]; y_p = 1 si el dron del par p trabaja en su zona
+    zeros = sparse.csr_array((autonomy.size, n))
+    ub_blocks = [[capacity, zeros],
+                 [sparse.eye_array(n, format='csr'), sparse.diags_array(-upper, format='csr')]]
+    b_ub = [autonomy, np.zeros(n)]
+    if max_zones is not None:
+        ub_blocks.append([zeros, capacity])
+        b_ub.append(np.broadcast_to(np.asarray(max_zones, dtype=float), (autonomy.size,)))
+
+    result = linprog(np.concatenate([costs, np.full(n, assignment_cost)]),
+                     A_ub=sparse.block_array(ub_blocks, format='csr'), b_ub=np.concatenate(b_ub),
+                     A_eq=sparse.hstack([coverage, sparse.csr_array((demands.size, n))], format='csr'),
+                     b_eq=demands,
+                     bounds=np.column_stack([np.zeros(2 * n), np.concatenate([upper, np.ones(n)])]),
+                     integrality=np.repeat([0, 1], n), method='highs', options=options or None)
+    if not result.success:
+        return None, 0
+    return result.x[:n], int(np.round(result.x[n:]).sum())
+
+
+def _solve_subproblems(task):
+    subproblems, options = task
+    return [_solve_subproblem(sub, options) for sub in subproblems]
+
+
+def main():
+    import time
+
+    from .optimization_solver import DroneOptimization
+
+    print("ASIGNACIÓN DE ZONAS A UNA FLOTA DE DRONES")
+    print("="*50)
+
+    optimizer = DroneOptimization()
+    rng = np.random.default_rng(0)
+
+    # 8 fincas separadas 100 km; cada una con 20 drones y 60 zonas de tipo A/B/C
+    farms, drones_per_farm, zones_per_farm = 8, 20, 60
+    offsets = np.column_stack([np.arange(farms) * 100.0, np.zeros(farms)])
+    zone_xy = (rng.uniform(0, 10, (farms, zones_per_farm, 2)) + offsets[:, None]).reshape(-1, 2)
+    drone_xy = (rng.uniform(0, 10, (farms, drones_per_farm, 2)) + offsets[:, None]).reshape(-1, 2)
+    zone_type = rng.integers(0, 3, len(zone_xy))
+    zone_costs = np.array([optimizer.c_A, optimizer.c_B, optimizer.c_C])[zone_type]
+    demands = rng.uniform(0.5, 3.0, len(zone_xy))
+    autonomy = rng.uniform(0.7, 1.3, len(drone_xy)) * optimizer.autonomy
+    multipliers = rng.uniform(0.8, 1.3, len(drone_xy))
+
+    model = FleetModel.from_positions(zone_costs, demands, zone_xy, drone_xy, autonomy, multipliers)
+    start = time.perf_counter()
+    result = model.solve()
+    elapsed = time.perf_counter() - start
+
+    print(f"Drones: {model.n_drones}, zonas: {model.n_zones}, pares elegibles: {model.drone.size}")
+    print(f"Subproblemas independientes: {result.components}")
+    print(f"Consumo total de la flota: {result.energy:.4f} unidades")
+    print(f"Drones en uso: {np.count_nonzero(result.drone_distance > 1e-9)}")
+    if result.unserved.size:
+        print(f"Zonas sin cobertura factible: {result.unserved.size}")
+    print(f"Tiempo de solución: {elapsed:.3f} s")
+
+    milp = FleetModel.from_positions(zone_costs, demands, zone_xy, drone_xy, autonomy,
+                                     multipliers, max_zones=5).solve()
+    print(f"Con un máximo de 5 zonas por dron (MILP): {milp.energy:.4f} unidades")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,454 @@
+"""
+Análisis con multiplicadores de Lagrange
+
+Las partes simbólicas (derivación e impresión del Lagrangiano y de las
+condiciones KKT) usan SymPy si está instalado, importándolo solo cuando se
+llaman: importar el módulo, construir un LagrangeAnalysis o usar
+solve_kkt_batch no carga SymPy. Las evaluaciones numéricas, incluida la
+solución del sistema KKT, usan el módulo NumPy generado por codegen.py (el
+sistema se resuelve una sola vez, en función de los parámetros), así que sin
+SymPy el análisis sigue funcionando con los gradientes, la Hessiana y la
+solución KKT generados.
+"""
+import re
+
+import numpy as np
+from collections import namedtuple
+
+from . import metrics
+from .codegen import MODEL, load_model
+from .optimization_solver import constraint_residuals, solve_batch
+from .spec import resolve_spec, spec_parameters
+
+# Solución KKT vectorizada: un arreglo por variable y multiplicador
+KKTBatchSolution = namedtuple('KKTBatchSolution', ['s', 'w', 'j', 'lambda1', 'lambda2', 'lambda3'])
+
+# Símbolos y expresiones SymPy de un LagrangeAnalysis (ver LagrangeAnalysis._symbolic)
+SymbolicModel = namedtuple('SymbolicModel', ['sp', 's', 'w', 'j', 'lambda1', 'lambda2', 'lambda3',
+                                             'f', 'g1', 'g2', 'g3'])
+
+
+def _import_sympy():
+    """
+    Módulo sympy, o None si no está instalado (trabajadores de producción)
+    """
+    try:
+        import sympy
+    except ImportError:
+        return None
+    return sympy
+
+
+def compiled_kkt_system():
+    """
+    Sistema KKT paramétrico M(θ)·z = r(θ), con z = (s, w, j, λ₁, λ₂, λ₃) y
+    θ = (c_A, c_B, c_C, autonomía, p, b): función NumPy generada que devuelve
+    las 36 entradas de M seguidas de las 6 de r
+    """
+    return load_model().kkt_system
+
+
+def solve_kkt_batch(c_A, c_B, c_C, autonomy, priority_ratio=2.0, balance_ratio=1.0):
+    """
+    Resuelve el sistema KKT para muchos conjuntos de coeficientes con la
+    solución cerrada generada por codegen.py
+
+    Los argumentos aceptan escalares o arreglos compatibles por broadcasting.
+    Los escenarios con coeficientes no finitos (p. ej. c_B = 0) o con M
+    singular devuelven NaN.
+    """
+    params = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (c_A, c_B, c_C, autonomy, priority_ratio, balance_ratio))
+    )
+    shape = params[0].shape
+    flat = [param.ravel() for param in params]
+    n = flat[0].size
+
+    with metrics.stage('solve_kkt_batch', scenarios=n):
+        model = load_model()
+        # Las salidas constantes son escalares; se expanden a n escenarios
+        z = np.empty((6, n))
+        valid = np.ones(n, dtype=bool)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for k, value in enumerate(model.kkt_solution(*flat)):
+                z[k] = value
+            for entry in model.kkt_system(*flat):
+                valid &= np.isfinite(entry)
+        valid &= np.isfinite(z).all(axis=0)
+        z[:, ~valid] = np.nan
+
+    return KKTBatchSolution(*(z[k].reshape(shape) for k in range(6)))
+
+
+@spec_parameters
+class LagrangeAnalysis:
+    def __init__(self, c_A=None, c_B=None, c_C=None, autonomy=None,
+                 priority_ratio=None, balance_ratio=None, cache=None, spec=None):
+        # Caché opcional de soluciones del sistema KKT (ver cache.SolutionCache)
+        self.cache = cache
+
+        # Coeficientes del problema: spec, con los argumentos dados sustituidos
+        self.spec = resolve_spec(
+            spec, c_A=c_A, c_B=c_B, c_C=c_C, autonomy=autonomy,
+            priority_ratio=priority_ratio, balance_ratio=balance_ratio)
+
+        # Nombres de variables y multiplicadores: claves de las soluciones, con o
+        # sin SymPy; los símbolos viven aparte, en _symbolic()
+        self.s, self.w, self.j = MODEL['variables']
+        self.lambda1, self.lambda2, self.lambda3 = MODEL['multipliers']
+        self.f = MODEL['objective']
+        self.g1, self.g2, self.g3 = MODEL['constraints']
+        self._symbols = None
+
+    def _symbolic(self):
+        """
+        SymbolicModel con los símbolos y las expresiones de los parámetros
+        actuales, o None si SymPy no está instalado
+
+        SymPy se importa la primera vez; las expresiones se reconstruyen solo
+        si los parámetros cambiaron desde la última llamada.
+        """
+        parameters = self.parameters()
+        if self._symbols is not None and self._symbols[0] == parameters:
+            return self._symbols[1]
+        sp = _import_sympy()
+        if sp is None:
+            return None
+
+        # Definir símbolos
+        s, w, j = sp.symbols('s w j', real=True, positive=True)
+        lambda1, lambda2, lambda3 = sp.symbols('lambda1 lambda2 lambda3', real=True)
+
+        # Función objetivo y restricciones (autonomía, cobertura prioritaria,
+        # equilibrio energético) a partir de la definición compartida con codegen.py;
+        # los valores enteros (15, 2, 1) se mantienen exactos en las expresiones
+        namespace = {name: sp.Integer(value) if value.is_integer() else value
+                     for name, value in parameters.items()}
+        namespace.update(s=s, w=w, j=j)
+        f = sp.sympify(MODEL['objective'], locals=namespace)
+        g1, g2, g3 = (sp.sympify(expr, locals=namespace) for expr in MODEL['constraints'])
+
+        symbolic = SymbolicModel(sp, s, w, j, lambda1, lambda2, lambda3, f, g1, g2, g3)
+        self._symbols = (parameters, symbolic)
+        return symbolic
+
+    def parameters(self):
+        """
+        Parámetros que definen el problema (clave de la caché)
+        """
+        return self.spec.parameters()
+        
+    def constraint_expressions(self):
+        """
+        g₁, g₂ y g₃ con los valores de los parámetros sustituidos, para imprimirlas
+
+        Con SymPy son las expresiones simbólicas con los coeficientes como
+        fracciones (4/3 en lugar de 1.3333...); sin SymPy, el texto de
+        codegen.MODEL con cada parámetro reemplazado por su valor.
+        """
+        sym = self._symbolic()
+        if sym is not None:
+            return tuple(sym.sp.nsimplify(g) for g in (sym.g1, sym.g2, sym.g3))
+        values = {name: f'{value:g}' for name, value in self.parameters().items()}
+        pattern = re.compile(r'\b(' + '|'.join(values) + r')\b')
+        return tuple(pattern.sub(lambda match: values[match.group(1)], expr)
+                     for expr in MODEL['constraints'])
+
+    def setup_lagrangian(self):
+        """
+        Configura el Lagrangiano del problema
+        """
+        print("ANÁLISIS CON MULTIPLICADORES DE LAGRANGE")
+        print("="*60)
+        
+        # Lagrangiano
+        sym = self._symbolic()
+        if sym is None:
+            f = self.f
+            L = 'f - lambda1*g1 - lambda2*g2 - lambda3*g3'
+        else:
+            f = sym.f
+            L = sym.f - sym.lambda1*sym.g1 - sym.lambda2*sym.g2 - sym.lambda3*sym.g3
+        
+        print("\n1. FUNCIÓN OBJETIVO:")
+        print("f(s, w, j) =", f)
+        
+        print("\n2. RESTRICCIONES:")
+        for name, g in zip(('g₁', 'g₂', 'g₃'), self.constraint_expressions()):
+            print(f"{name}(s, w, j) = {g} = 0")
+        
+        print("\n3. LAGRANGIANO:")
+        print("L(s, w, j, λ₁, λ₂, λ₃) = f - λ₁g₁ - λ₂g₂ - λ₃g₃")
+        
+        return L
+    
+    def compute_gradients(self):
+        """
+        Calcula los gradientes necesarios
+        """
+        print("\n4. GRADIENTES:")
+        print("-" * 30)
+
+        sym = self._symbolic()
+        if sym is None:
+            # Gradientes generados (constantes: el modelo es lineal)
+            grad_f, grad_g1, grad_g2, grad_g3 = self.evaluate_gradients(0.0, 0.0, 0.0).tolist()
+            for name, gradient in zip(('∇f', '∇g₁', '∇g₂', '∇g₃'), (grad_f, grad_g1, grad_g2, grad_g3)):
+                print(name, "=", gradient)
+            return grad_f, grad_g1, grad_g2, grad_g3
+        
+        # Gradiente de f
+        variables = [sym.s, sym.w, sym.j]
+        grad_f = [sym.sp.diff(sym.f, var) for var in variables]
+        print("∇f =", grad_f)
+        
+        # Gradientes de las restricciones
+        grad_g1 = [sym.sp.diff(sym.g1, var) for var in variables]
+        grad_g2 = [sym.sp.diff(sym.g2, var) for var in variables]
+        grad_g3 = [sym.sp.diff(sym.g3, var) for var in variables]
+        
+        print("∇g₁ =", grad_g1)
+        print("∇g₂ =", grad_g2)
+        print("∇g₃ =", grad_g3)
+        
+        return grad_f, grad_g1, grad_g2, grad_g3
+    
+    def solve_kkt_conditions(self):
+        """
+        Resuelve las condiciones KKT
+
+        Con SymPy se imprimen las ecuaciones del sistema; la solución sale siempre
+        de la solución cerrada generada (solve_kkt_numeric), sin sympy.solve.
+        """
+        print("\n5. CONDICIONES DE KARUSH-KUHN-TUCKER:")
+        print("-" * 45)
+
+        sym = self._symbolic()
+        if sym is not None:
+            # Sistema de ecuaciones KKT
+            L = self.setup_lagrangian()
+
+            # Derivadas parciales del Lagrangiano
+            dL_ds = sym.sp.diff(L, sym.s)
+            dL_dw = sym.sp.diff(L, sym.w)
+            dL_dj = sym.sp.diff(L, sym.j)
+
+            print("∂L/∂s = 0:", dL_ds, "= 0")
+            print("∂L/∂w = 0:", dL_dw, "= 0")
+            print("∂L/∂j = 0:", dL_dj, "= 0")
+
+            # Sistema de ecuaciones
+            equations = [
+                dL_ds,  # c_A - λ₁ - λ₂ + (b·c_A/c_B)·λ₃ = 0
+                dL_dw,  # c_B - λ₁ - λ₃ = 0
+                dL_dj,  # c_C - λ₁ + p·λ₂ = 0
+                sym.g1,  # s + w + j - autonomy = 0
+                sym.g2,  # s - p·j = 0
+                sym.g3   # w - (b·c_A/c_B)·s = 0
+            ]
+
+            print("\nSistema de ecuaciones a resolver:")
+            for i, eq in enumerate(equations, 1):
+                print(f"Ecuación {i}: {eq} = 0")
+
+        with metrics.stage('solve_kkt_conditions') as stage:
+            if self.cache is not None:
+                from .cache import canonical_key
+
+                key = canonical_key('kkt', **self.parameters())
+                hits = self.cache.hits
+                values = self.cache.get_or_compute(key, self.solve_kkt_numeric)
+                stage['cache_hit'] = self.cache.hits > hits
+            else:
+                values = self.solve_kkt_numeric()
+            solution = {name: float(value) for name, value in zip(
+                MODEL['variables'] + MODEL['multipliers'], values)}
+            success = bool(np.isfinite(list(solution.values())).all())
+            stage['success'] = success
+            if success and metrics.enabled():
+                residuals = constraint_residuals(
+                    solution[self.s], solution[self.w], solution[self.j],
+                    self.c_A, self.c_B, self.autonomy, self.priority_ratio, self.balance_ratio)
+                stage.update({f'residual_{name}': float(value)
+                              for name, value in residuals._asdict().items()})
+
+        print("\n6. SOLUCIÓN DEL SISTEMA:")
+        print("-" * 30)
+        if not success:
+            print("No se encontró solución única")
+            return None
+        for var, val in solution.items():
+            print(f"{var} = {val:.6f}")
+        return solution[self.s], solution[self.w], solution[self.j], solution
+
+    def solve_kkt_numeric(self, c_A=None, c_B=None, c_C=None, autonomy=None,
+                          priority_ratio=None, balance_ratio=None):
+        """
+        Resuelve las condiciones KKT con el sistema lineal compilado (sin sympy.solve);
+        los parámetros omitidos toman los valores de esta instancia
+        """
+        return solve_kkt_batch(
+            self.c_A if c_A is None else c_A,
+            self.c_B if c_B is None else c_B,
+            self.c_C if c_C is None else c_C,
+            self.autonomy if autonomy is None else autonomy,
+            self.priority_ratio if priority_ratio is None else priority_ratio,
+            self.balance_ratio if balance_ratio is None else balance_ratio,
+        )
+
+    def parametric_solver(self):
+        """
+        Solver incremental que conserva el conjunto activo y λ₁-λ₃ entre cambios
+        de parámetros (ver parametric.ParametricSolver)
+
+        Sus multiplicadores de igualdad son (λ₁, λ₂, λ₃/c_B): la fila de equilibrio
+        del modelo lineal es c_B·w - b·c_A·s = 0.
+        """
+        from .parametric import ParametricSolver
+        return ParametricSolver.from_drone_optimization(self)
+
+    def evaluate_gradients(self, s_val, w_val, j_val):
+        """
+        Evalúa ∇f, ∇g₁, ∇g₂ y ∇g₃ en un punto con la función generada (sin .subs())
+        """
+        gradients = load_model().gradients(s_val, w_val, j_val, *self.parameters().values())
+        return np.array(gradients, dtype=float)
+
+    def evaluate_hessian(self, solution):
+        """
+        Hessiana del Lagrangiano respecto a (s, w, j) en una solución KKT (función generada)
+        """
+        point = [float(solution[name]) for name in (self.s, self.w, self.j,
+                                                     self.lambda1, self.lambda2, self.lambda3)]
+        hessian = load_model().lagrangian_hessian(*point, *self.parameters().values())
+        return np.array(hessian, dtype=float)
+
+    def verify_optimality_conditions(self, solution):
+        """
+        Verifica las condiciones de optimalidad
+        """
+        if not solution:
+            return
+            
+        print("\n7. VERIFICACIÓN DE CONDICIONES DE OPTIMALIDAD:")
+        print("-" * 50)
+        
+        s_val = float(solution[self.s])
+        w_val = float(solution[self.w])
+        j_val = float(solution[self.j])
+        
+        # Verificar que es un punto crítico
+        grad_f, grad_g1, grad_g2, grad_g3 = self.compute_gradients()
+        
+        # Evaluar gradientes en el punto óptimo
+        grad_f_val, grad_g1_val, grad_g2_val, grad_g3_val = self.evaluate_gradients(s_val, w_val, j_val).tolist()
+        
+        print("Gradientes evaluados en el punto óptimo:")
+        print(f"∇f = {grad_f_val}")
+        print(f"∇g₁ = {grad_g1_val}")
+        print(f"∇g₂ = {grad_g2_val}")
+        print(f"∇g₃ = {grad_g3_val}")
+        
+        # Verificar condición ∇f = λ₁∇g₁ + λ₂∇g₂ + λ₃∇g₃
+        lambda1_val = float(solution[self.lambda1])
+        lambda2_val = float(solution[self.lambda2])
+        lambda3_val = float(solution[self.lambda3])
+        
+        combination = [
+            lambda1_val * grad_g1_val[i] + lambda2_val * grad_g2_val[i] + lambda3_val * grad_g3_val[i]
+            for i in range(3)
+        ]
+        
+        print(f"\nλ₁∇g₁ + λ₂∇g₂ + λ₃∇g₃ = {combination}")
+        print(f"∇f = {grad_f_val}")
+        
+        # Verificar si son iguales (con tolerancia numérica)
+        tolerance = 1e-10
+        is_equal = all(abs(combination[i] - grad_f_val[i]) < tolerance for i in range(3))
+        print(f"¿Se cumple ∇f = λ₁∇g₁ + λ₂∇g₂ + λ₃∇g₃? {is_equal}")
+        
+    def analyze_hessian(self, solution):
+        """
+        Análisis de la matriz Hessiana para verificar optimalidad
+        """
+        if not solution:
+            return
+            
+        print("\n8. ANÁLISIS DE LA MATRIZ HESSIANA:")
+        print("-" * 40)
+
+        sym = self._symbolic()
+        if sym is None:
+            print("Hessiana del Lagrangiano (modelo generado):")
+            print(self.evaluate_hessian(solution))
+            print("\nNota: Como f y las restricciones son lineales, la Hessiana es 0.")
+            print("La optimalidad se determina por las restricciones activas.")
+            return
+        
+        # Hessiana de la función objetivo (es constante = 0 para función lineal)
+        H_f = sym.sp.hessian(sym.f, (sym.s, sym.w, sym.j))
+        
+        print("Hessiana de f:")
+        sym.sp.pprint(H_f)
+        
+        # Para un problema lineal con restricciones lineales, 
+        # la optimalidad se determina por la factibilidad
+        print("\nNota: Como f es lineal, H_f = 0.")
+        print("La optimalidad se determina por las restricciones activas.")
+        
+    def comparative_analysis(self):
+        """
+        Análisis comparativo de métodos
+        """
+        print("\n9. ANÁLISIS COMPARATIVO DE MÉTODOS:")
+        print("-" * 45)
+        
+        # Método de sustitución directa, con los parámetros de esta instancia
+        p, w_per_s, autonomy = self.priority_ratio, self.spec.w_per_s, self.autonomy
+        print("Método de sustitución directa:")
+        print(f"De g₂: s = {p:g}j")
+        print(f"De g₃: w = {w_per_s:g}s = {p * w_per_s:g}j")
+        print(f"Sustituyendo en g₁: {p:g}j + {p * w_per_s:g}j + j = {autonomy:g}")
+        print(f"{1 + p + p * w_per_s:g}j = {autonomy:g} → j = {autonomy:g}/{1 + p + p * w_per_s:g}")
+
+        direct = solve_batch(*self.spec)
+        s_direct, w_direct, j_direct = float(direct.s), float(direct.w), float(direct.j)
+        
+        print(f"Solución directa: s = {s_direct:.6f}, w = {w_direct:.6f}, j = {j_direct:.6f}")
+        
+        # Comparar con solución de Lagrange
+        solution = self.solve_kkt_conditions()
+        if solution:
+            s_lag, w_lag, j_lag, _ = solution
+            print(f"Solución Lagrange: s = {s_lag:.6f}, w = {w_lag:.6f}, j = {j_lag:.6f}")
+            
+            # Diferencias
+            print(f"Diferencias: Δs = {abs(s_direct - s_lag):.10f}")
+            print(f"            Δw = {abs(w_direct - w_lag):.10f}")
+            print(f"            Δj = {abs(j_direct - j_lag):.10f}")
+
+def main():
+    # Ejecutar análisis de Lagrange
+    print("INICIANDO ANÁLISIS CON MULTIPLICADORES DE LAGRANGE")
+    print("="*60)
+
+    analyzer = LagrangeAnalysis()
+
+    # Configurar y resolver
+    L = analyzer.setup_lagrangian()
+    grad_f, grad_g1, grad_g2, grad_g3 = analyzer.compute_gradients()
+    solution_data = analyzer.solve_kkt_conditions()
+
+    if solution_data:
+        s_opt, w_opt, j_opt, full_solution = solution_data
+        analyzer.verify_optimality_conditions(full_solution)
+        analyzer.analyze_hessian(full_solution)
+
+    analyzer.comparative_analysis()
+
+    print("\n" + "="*60)
+    print("ANÁLISIS COMPLETADO")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+import numpy as np
+from scipy import sparse
+from scipy.optimize import OptimizeResult, linprog
+
+from .presolve import STATUSES, presolve_model
+
+
+class NZoneModel:
+    """
+    Modelo lineal de N zonas resuelto con HiGHS (scipy.optimize.linprog)
+
+    min  Σ c_i·x_i
+    s.a. Σ x_i = L                  (autonomía, o Σ x_i <= L si full_coverage=False)
+         x_i = r·x_k                (filas de razón / cobertura prioritaria)
+         c_i·x_i = r·c_k·x_k        (filas de equilibrio energético)
+         lower_i <= x_i <= upper_i
+    """
+
+    def __init__(self, costs, autonomy, ratios=(), balances=(),
+                 lower=None, upper=None, full_coverage=True):
+        self.costs = np.asarray(costs, dtype=float)
+        self.n_zones = self.costs.size
+        self.autonomy = float(autonomy)
+
+        # Cada fila es (i, k, r); se guardan como arreglos para construir las matrices sin bucles
+        self.ratios = self._as_rows(ratios)
+        self.balances = self._as_rows(balances)
+
+        self.lower = np.zeros(self.n_zones) if lower is None else np.broadcast_to(
+            np.asarray(lower, dtype=float), (self.n_zones,))
+        self.upper = np.full(self.n_zones, np.inf) if upper is None else np.broadcast_to(
+            np.asarray(upper, dtype=float), (self.n_zones,))
+
+        # Como en analytical_solution(), por defecto la autonomía se usa completa
+        self.full_coverage = full_coverage
+
+    @staticmethod
+    def _as_rows(rows):
+        rows = np.asarray(rows, dtype=float).reshape(-1, 3)
+        return rows[:, 0].astype(np.intp), rows[:, 1].astype(np.intp), rows[:, 2]
+
+    @classmethod
+    def from_drone_optimization(cls, optimizer, full_coverage=True):
+        """
+        Construye el modelo equivalente de tres zonas (s, w, j) de DroneOptimization
+        """
+        return cls(
+            [optimizer.c_A, optimizer.c_B, optimizer.c_C],
+            optimizer.autonomy,
+            ratios=[(0, 2, optimizer.priority_ratio)],     # s = p·j
+            balances=[(1, 0, optimizer.balance_ratio)],    # c_B·w = b·c_A·s
+            full_coverage=full_coverage,
+        )
+
+    def autonomy_matrix(self):
+        """
+        Fila de autonomía: 1·x <= L (o = L)
+        """
+        return sparse.csr_array(np.ones((1, self.n_zones)))
+
+    def ratio_matrix(self):
+        """
+        Filas x_i - r·x_k = 0
+        """
+        i, k, r = self.ratios
+        return self._pair_rows(i, k, np.ones_like(r), -r)
+
+    def balance_matrix(self):
+        """
+        Filas c_i·x_i - r·c_k·x_k = 0
+        """
+        i, k, r = self.balances
+        return self._pair_rows(i, k, self.costs[i], -r * self.costs[k])
+
+    def _pair_rows(self, i, k, coef_i, coef_k):
+        m = i.size
+        rows = np.concatenate([np.arange(m), np.arange(m)])
+        cols = np.concatenate([i, k])
+        data = np.concatenate([coef_i, coef_k])
+        # coo -> csr suma las entradas duplicadas (i == k)
+        return sparse.coo_array((data, (rows, cols)), shape=(m, self.n_zones)).tocsr()
+
+    def rhs(self):
+        """
+        Lados derechos (b_ub, b_eq) sin construir las matrices
+        """
+        b_eq = np.zeros(int(self.full_coverage) + self.ratios[0].size + self.balances[0].size)
+        if self.full_coverage:
+            b_eq[0] = self.autonomy
+            return np.zeros(0), b_eq
+        return np.array([self.autonomy]), b_eq
+
+    def build(self):
+        """
+        Devuelve (c, A_ub, b_ub, A_eq, b_eq, bounds) en formato disperso para linprog
+        """
+        eq_blocks = [self.ratio_matrix(), self.balance_matrix()]
+        b_ub, b_eq = self.rhs()
+
+        A_ub = None
+        if self.full_coverage:
+            eq_blocks.insert(0, self.autonomy_matrix())
+        else:
+            A_ub = self.autonomy_matrix()
+
+        A_eq = sparse.vstack(eq_blocks, format='csr')
+        if A_eq.shape[0] == 0:
+            A_eq, b_eq = None, None
+        if A_ub is None:
+            b_ub = None
+
+        bounds = np.column_stack([self.lower, self.upper])
+        return self.costs, A_ub, b_ub, A_eq, b_eq, bounds
+
+    def presolve(self, tol=1e-9):
+        """
+        Diagnóstico algebraico del modelo (ver presolve.presolve_model)
+        """
+        return presolve_model(self, tol)
+
+    def solve(self, method='highs', presolve=True, **options):
+        """
+        Resuelve el programa lineal con HiGHS
+
+        El resultado es el OptimizeResult de linprog; los multiplicadores duales
+        están en result.eqlin.marginals y result.ineqlin.marginals.
+
+        Con presolve=True, los modelos infactibles o no acotados se detectan sin
+        llamar a linprog: el resultado tiene success=False, el status de linprog
+        (2 o 3), el motivo en message y el diagnóstico completo en result.presolve.
+        Los modelos factibles se resuelven con HiGHS para obtener los duales.
+        """
+        diagnosis = self.presolve() if presolve else None
+        if diagnosis is not None and diagnosis.status in ('infeasible', 'unbounded'):
+            return OptimizeResult(x=None, fun=np.nan, success=False,
+                                  status=STATUSES.index(diagnosis.status),
+                                  message=diagnosis.message, nit=0, presolve=diagnosis)
+
+        c, A_ub, b_ub, A_eq, b_eq, bounds = self.build()
+        result = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq,
+                         bounds=bounds, method=method, options=options or None)
+        result.presolve = diagnosis
+        return result
+
+
+def main():
+    from .optimization_solver import DroneOptimization
+
+    print("MODELO LINEAL DE N ZONAS (HiGHS)")
+    print("="*50)
+
+    # Mismo problema que DroneOptimization
+    result = NZoneModel.from_drone_optimization(DroneOptimization()).solve()
+
+    if result.success:
+        s, w, j = result.x
+        print(f"s = {s:.4f} km")
+        print(f"w = {w:.4f} km")
+        print(f"j = {j:.4f} km")
+        print(f"Consumo mínimo: {result.fun:.4f} unidades")
+    else:
+        print(f"Sin solución ({STATUSES[result.status] if result.status < 4 else result.status}): "
+              f"{result.message}")
+        if getattr(result, 'presolve', None) is not None and result.presolve.conflicts:
+            print(f"Restricciones en conflicto: {', '.join(result.presolve.conflicts)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,308 @@
+"""
+Instrumentación de etapas del solver y exportación de métricas
+
+Las funciones instrumentadas abren una etapa con `stage(nombre)`; al cerrarla
+se guarda un registro estructurado con el tiempo de pared, el tiempo de CPU del
+proceso y los campos que la etapa haya añadido (iteraciones, evaluaciones,
+aciertos de caché, residuos de las restricciones, escenarios...).
+
+Sin un Recorder activo, stage() devuelve siempre el mismo objeto vacío: no se
+leen relojes ni se crean registros, así que el costo es una comprobación.
+
+    from drone_optimization import metrics
+
+    with metrics.recording() as recorder:
+        DroneOptimization().solve_optimization()
+    recorder.write_jsonl('metrics.jsonl')
+    recorder.write_prometheus('metrics.prom')
+
+Cada proceso tiene su propio Recorder; stream.py reenvía al proceso principal
+los registros de sus trabajadores.
+"""
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Campos numéricos que se acumulan como contadores por etapa
+COUNTERS = ('iterations', 'function_evaluations', 'gradient_evaluations', 'scenarios')
+
+_recorder = None
+
+
+class _NullStage:
+    """
+    Etapa sin efecto que se usa cuando la instrumentación está desactivada
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def __setitem__(self, key, value):
+        pass
+
+    def update(self, *args, **kwargs):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('recorder', 'fields', '_wall', '_cpu')
+
+    def __init__(self, recorder, name, labels):
+        self.recorder = recorder
+        self.fields = {'stage': name, **labels}
+
+    def __enter__(self):
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.fields['wall_s'] = time.perf_counter() - self._wall
+        self.fields['cpu_s'] = time.process_time() - self._cpu
+        if exc_type is not None:
+            self.fields['error'] = exc_type.__name__
+        self.recorder.add(self.fields)
+        return False
+
+    def __setitem__(self, key, value):
+        self.fields[key] = value
+
+    def update(self, *args, **kwargs):
+        self.fields.update(*args, **kwargs)
+
+
+class Recorder:
+    """
+    Colector de registros de etapas con agregados por etapa
+
+    maxlen: registros individuales que se conservan (los agregados no se pierden)
+    stream: archivo de texto opcional donde se escribe cada registro como JSON lines
+    """
+
+    def __init__(self, maxlen=100_000, stream=None):
+        self.stream = stream
+        self._records = deque(maxlen=maxlen)
+        self._stages = {}
+        self._caches = {}
+        self._lock = threading.Lock()
+
+    def add(self, record):
+        record.setdefault('timestamp', time.time())
+        with self._lock:
+            self._records.append(record)
+            self._aggregate(record)
+            if self.stream is not None:
+                self.stream.write(json.dumps(record, default=_json_default) + '\n')
+
+    def extend(self, records):
+        for record in records:
+            self.add(dict(record))
+
+    def _aggregate(self, record):
+        if record['stage'] == 'cache_stats':
+            self._caches[record['cache']] = record
+            return
+
+        totals = self._stages.get(record['stage'])
+        if totals is None:
+            totals = self._stages[record['stage']] = {
+                'calls': 0, 'errors': 0, 'wall_s': 0.0, 'cpu_s': 0.0, 'wall_max_s': 0.0,
+                'cache_lookups': 0, 'cache_hits': 0, 'residuals': {},
+                **{name: 0 for name in COUNTERS},
+            }
+        totals['calls'] += 1
+        totals['errors'] += 'error' in record
+        totals['wall_s'] += record.get('wall_s', 0.0)
+        totals['cpu_s'] += record.get('cpu_s', 0.0)
+        totals['wall_max_s'] = max(totals['wall_max_s'], record.get('wall_s', 0.0))
+        for name in COUNTERS:
+            totals[name] += record.get(name) or 0
+        if 'cache_hit' in record:
+            totals['cache_lookups'] += 1
+            totals['cache_hits'] += bool(record['cache_hit'])
+        for key, value in record.items():
+            if key.startswith('residual_') and value is not None and not math.isnan(value):
+                name = key[len('residual_'):]
+                totals['residuals'][name] = max(totals['residuals'].get(name, 0.0), abs(value))
+
+    def records(self):
+        with self._lock:
+            return list(self._records)
+
+    def summary(self):
+        """
+        Agregados por etapa: llamadas, tiempos, contadores, tasa de aciertos y residuo máximo
+        """
+        with self._lock:
+            summary = {}
+            for stage, totals in self._stages.items():
+                entry = {key: value for key, value in totals.items() if key != 'residuals'}
+                entry['residual_max'] = dict(totals['residuals'])
+                lookups = totals['cache_lookups']
+                entry['cache_hit_rate'] = totals['cache_hits'] / lookups if lookups else None
+                summary[stage] = entry
+            return summary
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+            self._stages.clear()
+            self._caches.clear()
+
+    # --- Exportación ----------------------------------------------------
+
+    def write_jsonl(self, path):
+        with open(path, 'w', encoding='utf-8') as fh:
+            for record in self.records():
+                fh.write(json.dumps(record, default=_json_default) + '\n')
+
+    def prometheus(self, prefix='drone_optimization'):
+        """
+        Agregados en formato de texto de Prometheus
+        """
+        summary = self.summary()
+        with self._lock:
+            caches = {name: dict(record) for name, record in self._caches.items()}
+
+        metrics = [
+            ('stage_calls_total', 'counter', 'Llamadas por etapa', 'calls'),
+            ('stage_errors_total', 'counter', 'Etapas terminadas con excepción', 'errors'),
+            ('stage_wall_seconds_total', 'counter', 'Tiempo de pared acumulado por etapa', 'wall_s'),
+            ('stage_cpu_seconds_total', 'counter', 'Tiempo de CPU del proceso por etapa', 'cpu_s'),
+            ('stage_wall_seconds_max', 'gauge', 'Llamada más lenta de cada etapa', 'wall_max_s'),
+            ('solver_iterations_total', 'counter', 'Iteraciones del solver', 'iterations'),
+            ('solver_function_evaluations_total', 'counter', 'Evaluaciones de la función objetivo',
+             'function_evaluations'),
+            ('solver_gradient_evaluations_total', 'counter', 'Evaluaciones del gradiente',
+             'gradient_evaluations'),
+            ('scenarios_total', 'counter', 'Escenarios procesados', 'scenarios'),
+            ('cache_lookups_total', 'counter', 'Consultas a la caché por etapa', 'cache_lookups'),
+            ('cache_hits_total', 'counter', 'Aciertos de caché por etapa', 'cache_hits'),
+        ]
+        lines = []
+        for k, (name, kind, help_text, key) in enumerate(metrics):
+            # Los contadores opcionales solo se exportan para las etapas que los usan
+            samples = [(stage, entry[key]) for stage, entry in sorted(summary.items())
+                       if k < 5 or entry[key]]
+            if not samples:
+                continue
+            lines += [f'# HELP {prefix}_{name} {help_text}', f'# TYPE {prefix}_{name} {kind}']
+            lines += [f'{prefix}_{name}{{stage="{_escape(stage)}"}} {_number(value)}'
+                      for stage, value in samples]
+
+        residuals = [(stage, constraint, value) for stage, entry in sorted(summary.items())
+                     for constraint, value in sorted(entry['residual_max'].items())]
+        if residuals:
+            name = f'{prefix}_constraint_residual_max'
+            lines += [f'# HELP {name} Máximo |residuo| de cada restricción', f'# TYPE {name} gauge']
+            lines += [f'{name}{{stage="{_escape(stage)}",constraint="{_escape(constraint)}"}} '
+                      f'{_number(value)}' for stage, constraint, value in residuals]
+
+        if caches:
+            name = f'{prefix}_cache_hit_ratio'
+            lines += [f'# HELP {name} Tasa de aciertos de cada SolutionCache observada',
+                      f'# TYPE {name} gauge']
+            lines += [f'{name}{{cache="{_escape(cache)}"}} {_number(record["hit_rate"])}'
+                      for cache, record in sorted(caches.items())]
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path, prefix='drone_optimization'):
+        """
+        Escribe el archivo de forma atómica (apto para el textfile collector)
+        """
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as fh:
+            fh.write(self.prometheus(prefix))
+        os.replace(tmp_path, path)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _json_default(value):
+    # Escalares de NumPy y otros valores no serializables
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+# --- API del módulo -------------------------------------------------------
+
+def enable(recorder=None):
+    """
+    Activa la instrumentación en este proceso y devuelve el Recorder activo
+    """
+    global _recorder
+    _recorder = recorder or Recorder()
+    return _recorder
+
+
+def disable():
+    """
+    Desactiva la instrumentación y devuelve el Recorder que estaba activo
+    """
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def enabled():
+    return _recorder is not None
+
+
+def get_recorder():
+    return _recorder
+
+
+@contextmanager
+def recording(recorder=None):
+    """
+    Activa un Recorder dentro del bloque y restaura el anterior al salir
+    """
+    global _recorder
+    previous = _recorder
+    recorder = enable(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder = previous
+
+
+def stage(name, **labels):
+    """
+    Contexto que mide una etapa; admite stage[campo] = valor y stage.update(...)
+    """
+    recorder = _recorder
+    if recorder is None:
+        return _NULL_STAGE
+    return _Stage(recorder, name, labels)
+
+
+def record(name, **fields):
+    """
+    Registra un evento sin medir tiempos
+    """
+    recorder = _recorder
+    if recorder is not None:
+        recorder.add({'stage': name, **fields})
+
+
+def observe_cache(cache, name='solutions'):
+    """
+    Registra una instantánea de SolutionCache.stats
+    """
+    record('cache_stats', cache=name, **cache.stats)
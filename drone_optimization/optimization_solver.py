@@ -0,0 +1,377 @@
+import numpy as np
+from scipy.optimize import OptimizeResult, minimize
+from collections import namedtuple
+
+from . import metrics
+from .presolve import BATCH_REASONS, INFEASIBLE, UNBOUNDED, presolve_batch
+from .spec import ProblemSpec, spec_parameters
+
+# Resultado del solver vectorizado: un arreglo por campo, un elemento por escenario
+BatchSolution = namedtuple('BatchSolution', ['s', 'w', 'j', 'energy', 'feasible'])
+
+# Velocidades de crucero por zona (km/h): plano, urbano, montañoso
+DEFAULT_SPEEDS = (40.0, 20.0, 30.0)
+
+
+def solve_batch(c_A, c_B, c_C, autonomy, priority_ratio=2.0, balance_ratio=1.0):
+    """
+    Solución analítica vectorizada para muchos escenarios en una sola llamada.
+
+    Todos los argumentos aceptan escalares o arreglos compatibles por broadcasting:
+    - c_A, c_B, c_C: consumo energético por km de cada zona
+    - autonomy: límite de autonomía (km), que se asume activo
+    - priority_ratio: p en la restricción de cobertura s = p·j
+    - balance_ratio: b en el equilibrio energético c_B·w = b·c_A·s
+
+    Devuelve un BatchSolution con arreglos s, w, j, energy y la máscara booleana
+    feasible. Los escenarios no factibles quedan marcados con NaN.
+    """
+    with metrics.stage('solve_batch') as stage:
+        c_A, c_B, c_C, autonomy, p, b = np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (c_A, c_B, c_C, autonomy, priority_ratio, balance_ratio))
+        )
+
+        # De las restricciones de igualdad:
+        # s = p·j
+        # c_B·w = b·c_A·s  ->  w = (b·c_A·p / c_B)·j
+        # Sustituyendo en la restricción de autonomía (activa):
+        # (1 + p + b·c_A·p / c_B)·j = autonomy
+        with np.errstate(divide='ignore', invalid='ignore'):
+            w_per_j = b * c_A * p / c_B
+            j = autonomy / (1 + p + w_per_j)
+            s = p * j
+            w = w_per_j * j
+            energy = c_A * s + c_B * w + c_C * j
+
+        feasible = (
+            (c_B > 0) & (autonomy >= 0)
+            & np.isfinite(energy)
+            & (s >= 0) & (w >= 0) & (j >= 0)
+        )
+
+        s = np.where(feasible, s, np.nan)
+        w = np.where(feasible, w, np.nan)
+        j = np.where(feasible, j, np.nan)
+        energy = np.where(feasible, energy, np.nan)
+        stage['scenarios'] = feasible.size
+
+    return BatchSolution(s, w, j, energy, feasible)
+
+
+# Residuos de las restricciones: autonomía (>0 = excede), prioridad y equilibrio (0 = cumple)
+Residuals = namedtuple('Residuals', ['autonomy', 'priority', 'balance'])
+
+
+def constraint_residuals(s, w, j, c_A, c_B, autonomy, priority_ratio=2.0, balance_ratio=1.0):
+    """
+    Residuos de las restricciones de verify_solution() para arreglos de soluciones
+    """
+    s, w, j = (np.asarray(v, dtype=float) for v in (s, w, j))
+    return Residuals(
+        autonomy=s + w + j - autonomy,
+        priority=s - priority_ratio * j,
+        balance=c_B * w - balance_ratio * c_A * s,
+    )
+
+
+# Tolerancias absolutas por defecto de verify_batch() (las de verify_solution())
+DEFAULT_TOLERANCES = {'autonomy': 1e-3, 'priority': 1e-3, 'balance': 1e-3, 'nonnegativity': 0.0}
+
+# Resultado de verify_batch(): residuos y una máscara booleana por restricción
+Verification = namedtuple('Verification', [
+    'residuals',     # Residuals con arreglos (autonomy, priority, balance)
+    'autonomy',      # s + w + j <= L (+ tol), o |s + w + j - L| <= tol con autonomy_equality
+    'priority',      # |s - p·j| <= tol
+    'balance',       # |c_B·w - b·c_A·s| <= tol
+    'nonnegative',   # s, w, j >= -tol
+    'feasible',      # todas las anteriores
+])
+
+
+def verify_batch(x, c_A, c_B, autonomy, priority_ratio=2.0, balance_ratio=1.0,
+                 tolerances=None, autonomy_equality=False):
+    """
+    Verificación vectorizada de muchas soluciones candidatas, sin E/S
+
+    x: arreglo (N, 3) con columnas (s, w, j); los parámetros son escalares o
+    arreglos (N,) compatibles por broadcasting.
+    tolerances: escalar para todas las restricciones o diccionario que
+    sustituye entradas de DEFAULT_TOLERANCES.
+    autonomy_equality: exigir que la autonomía se use completa (como solve_batch).
+
+    Las filas con NaN se marcan como no factibles.
+    """
+    x = np.asarray(x, dtype=float)
+    if x.shape[-1] != 3:
+        raise ValueError(f"x debe tener forma (N, 3) con columnas (s, w, j), no {x.shape}")
+    if np.isscalar(tolerances):
+        tol = dict.fromkeys(DEFAULT_TOLERANCES, float(tolerances))
+    else:
+        tol = {**DEFAULT_TOLERANCES, **(tolerances or {})}
+
+    with metrics.stage('verify_batch') as stage:
+        s, w, j = x[..., 0], x[..., 1], x[..., 2]
+        residuals = constraint_residuals(s, w, j, c_A, c_B, autonomy, priority_ratio, balance_ratio)
+
+        # Las comparaciones con NaN son False, así que esas filas no pasan
+        if autonomy_equality:
+            autonomy_ok = np.abs(residuals.autonomy) <= tol['autonomy']
+        else:
+            autonomy_ok = residuals.autonomy <= tol['autonomy']
+        priority_ok = np.abs(residuals.priority) <= tol['priority']
+        balance_ok = np.abs(residuals.balance) <= tol['balance']
+        nonnegative = (x >= -tol['nonnegativity']).all(axis=-1)
+        feasible = autonomy_ok & priority_ok & balance_ok & nonnegative
+        stage['scenarios'] = feasible.size
+
+    return Verification(residuals, autonomy_ok, priority_ok, balance_ok, nonnegative, feasible)
+
+
+@spec_parameters
+class DroneOptimization:
+    def __init__(self, cache=None, spec=None):
+        # Caché opcional de soluciones SLSQP (ver cache.SolutionCache)
+        self.cache = cache
+
+        # Coeficientes de consumo por km (c_A, c_B, c_C), autonomía y razones de
+        # prioridad y equilibrio; se leen como self.c_A, self.autonomy, ...
+        self.spec = spec if spec is not None else ProblemSpec()
+
+    def parameters(self):
+        """
+        Parámetros que definen el problema (clave de la caché)
+        """
+        return self.spec.parameters()
+        
+    def objective_function(self, x):
+        """
+        Función objetivo: minimizar el consumo energético total
+        f(s, w, j) = c_A·s + c_B·w + c_C·j
+        """
+        s, w, j = x
+        return self.c_A * s + self.c_B * w + self.c_C * j
+    
+    def constraint_autonomy(self, x):
+        """
+        Restricción de autonomía: s + w + j <= autonomy
+        """
+        s, w, j = x
+        return self.autonomy - (s + w + j)
+    
+    def constraint_priority(self, x):
+        """
+        Restricción de cobertura prioritaria: s = priority_ratio·j
+        """
+        s, w, j = x
+        return s - self.priority_ratio * j
+    
+    def constraint_energy_balance(self, x):
+        """
+        Restricción de equilibrio energético: c_B·w = balance_ratio·c_A·s
+        """
+        s, w, j = x
+        return self.c_B * w - self.balance_ratio * self.c_A * s
+    
+    # Gradientes exactos: el modelo es lineal, así que son constantes
+    def objective_gradient(self, x):
+        """
+        ∇f = (c_A, c_B, c_C)
+        """
+        return np.array([self.c_A, self.c_B, self.c_C])
+
+    def constraint_autonomy_jac(self, x):
+        """
+        ∇(autonomy - s - w - j) = (-1, -1, -1)
+        """
+        return np.array([-1.0, -1.0, -1.0])
+
+    def constraint_priority_jac(self, x):
+        """
+        ∇(s - p·j) = (1, 0, -p)
+        """
+        return np.array([1.0, 0.0, -self.priority_ratio])
+
+    def constraint_energy_balance_jac(self, x):
+        """
+        ∇(c_B·w - b·c_A·s) = (-b·c_A, c_B, 0)
+        """
+        return np.array([-self.balance_ratio * self.c_A, self.c_B, 0.0])
+
+    def solve_optimization(self, x0=None, warm_start=None):
+        """
+        Resuelve el problema de optimización usando scipy
+
+        x0: punto inicial explícito
+        warm_start: resultado previo de solve_optimization() (o su vector x)
+        para reiniciar desde la solución anterior en barridos de parámetros.
+        El resultado incluye nit, nfev y njev.
+
+        Si la instancia tiene caché, los parámetros ya resueltos se devuelven
+        sin volver a optimizar.
+
+        Un presolve algebraico (presolve.presolve_batch) descarta antes de SLSQP
+        los escenarios infactibles: el resultado tiene success=False, x con NaN,
+        el motivo en message y el diagnóstico en result.presolve.
+        """
+        with metrics.stage('solve_optimization') as stage:
+            if self.cache is not None:
+                from .cache import canonical_key
+
+                key = canonical_key('slsqp', **self.parameters())
+                hits = self.cache.hits
+                result = self.cache.get_or_compute(key, lambda: self._solve_slsqp(x0, warm_start))
+                stage['cache_hit'] = self.cache.hits > hits
+            else:
+                result = self._solve_slsqp(x0, warm_start)
+            stage.update(iterations=result.nit, function_evaluations=result.nfev,
+                         gradient_evaluations=result.njev, success=bool(result.success))
+        return result
+
+    def _solve_slsqp(self, x0, warm_start):
+        diagnosis = presolve_batch(**self.parameters())
+        if int(diagnosis.status) in (INFEASIBLE, UNBOUNDED):
+            return OptimizeResult(x=np.full(3, np.nan), fun=np.nan, success=False,
+                                  status=int(diagnosis.status),
+                                  message=f"Presolve: {BATCH_REASONS[int(diagnosis.reason)]}",
+                                  nit=0, nfev=0, njev=0, presolve=diagnosis)
+
+        # Punto inicial
+        if warm_start is not None:
+            x0 = getattr(warm_start, 'x', warm_start)
+        if x0 is None:
+            x0 = [5, 7, 2.5]
+        
+        # Definir restricciones
+        constraints = [
+            {'type': 'ineq', 'fun': self.constraint_autonomy, 'jac': self.constraint_autonomy_jac},
+            {'type': 'eq', 'fun': self.constraint_priority, 'jac': self.constraint_priority_jac},
+            {'type': 'eq', 'fun': self.constraint_energy_balance, 'jac': self.constraint_energy_balance_jac}
+        ]
+        
+        # Límites para las variables (no negativas)
+        bounds = [(0, None), (0, None), (0, None)]
+        
+        # Resolver
+        result = minimize(
+            self.objective_function,
+            np.asarray(x0, dtype=float),
+            method='SLSQP',
+            jac=self.objective_gradient,
+            bounds=bounds,
+            constraints=constraints
+        )
+        
+        return result
+    
+    def analytical_solution(self):
+        """
+        Solución analítica del problema
+        """
+        # De las restricciones de igualdad:
+        # s = p·j
+        # w = (b·c_A/c_B)·s = (b·c_A·p/c_B)·j
+        # Sustituyendo en la restricción de autonomía (activa):
+        # (1 + p + b·c_A·p/c_B)·j = autonomy
+        # (con los valores base: (17/3)·j = 15, j = 45/17)
+        result = self.solve_batch(self.autonomy)
+        return float(result.s), float(result.w), float(result.j)
+
+    def solve_batch(self, autonomy=None, c_A=None, c_B=None, c_C=None,
+                    priority_ratio=None, balance_ratio=None):
+        """
+        Solución analítica vectorizada; los parámetros omitidos toman
+        los valores de esta instancia
+        """
+        return solve_batch(
+            self.c_A if c_A is None else c_A,
+            self.c_B if c_B is None else c_B,
+            self.c_C if c_C is None else c_C,
+            self.autonomy if autonomy is None else autonomy,
+            self.priority_ratio if priority_ratio is None else priority_ratio,
+            self.balance_ratio if balance_ratio is None else balance_ratio,
+        )
+    
+    def verify_batch(self, x, tolerances=None, autonomy_equality=False):
+        """
+        verify_batch() con los parámetros de esta instancia
+        """
+        return verify_batch(x, self.c_A, self.c_B, self.autonomy, self.priority_ratio,
+                            self.balance_ratio, tolerances, autonomy_equality)
+
+    def verify_solution(self, s, w, j, tolerances=None):
+        """
+        Verifica que la solución cumple todas las restricciones
+        """
+        with metrics.stage('verify_solution') as stage:
+            check = self.verify_batch([s, w, j], tolerances)
+            residuals = check.residuals
+            stage.update({f'residual_{name}': float(value)
+                          for name, value in residuals._asdict().items()})
+
+        print("=== VERIFICACIÓN DE LA SOLUCIÓN ===")
+        print(f"s = {s:.4f} km (Zona A)")
+        print(f"w = {w:.4f} km (Zona B)")  
+        print(f"j = {j:.4f} km (Zona C)")
+        print()
+        
+        # Verificar restricción de autonomía
+        print(f"Restricción de autonomía: {s + w + j:.4f} ≤ {self.autonomy:g}")
+        print(f"Cumple: {bool(check.autonomy)}")
+        print()
+        
+        # Verificar restricción de prioridad
+        print(f"Restricción de prioridad: |s - {self.priority_ratio:g}j| = {abs(residuals.priority):.6f}")
+        print(f"Cumple: {bool(check.priority)}")
+        print()
+        
+        # Verificar equilibrio energético
+        print(f"Equilibrio energético: |{self.c_B:g}w - {self.balance_ratio * self.c_A:g}s| = "
+              f"{abs(residuals.balance):.6f}")
+        print(f"Cumple: {bool(check.balance)}")
+        print()
+        
+        # Consumo total
+        total_energy = self.objective_function([s, w, j])
+        print(f"Consumo energético total: {total_energy:.4f} unidades")
+        
+        return total_energy
+
+def main():
+    # Ejecutar optimización
+    print("OPTIMIZACIÓN DEL RECORRIDO DEL DRON")
+    print("="*50)
+
+    optimizer = DroneOptimization()
+
+    # Solución numérica
+    print("\n1. SOLUCIÓN NUMÉRICA (scipy.optimize)")
+    result = optimizer.solve_optimization()
+
+    if result.success:
+        s_num, w_num, j_num = result.x
+        print(f"Solución encontrada:")
+        print(f"s = {s_num:.4f} km")
+        print(f"w = {w_num:.4f} km") 
+        print(f"j = {j_num:.4f} km")
+        print(f"Consumo mínimo: {result.fun:.4f} unidades")
+        print(f"Iteraciones: {result.nit}, evaluaciones de f: {result.nfev}, de ∇f: {result.njev}")
+    else:
+        print(f"Sin solución: {result.message}")
+
+    print("\n" + "="*50)
+
+    # Solución analítica
+    print("\n2. SOLUCIÓN ANALÍTICA")
+    s_ana, w_ana, j_ana = optimizer.analytical_solution()
+    print(f"s = {s_ana:.4f} km")
+    print(f"w = {w_ana:.4f} km")
+    print(f"j = {j_ana:.4f} km")
+
+    print("\n" + "="*50)
+
+    # Verificación
+    optimizer.verify_solution(s_ana, w_ana, j_ana)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,283 @@
+"""
+Re-solución incremental con conjunto activo y multiplicadores de Lagrange
+
+Tras una solución completa (HiGHS) se guarda el conjunto activo: todas las
+igualdades, las desigualdades saturadas y las variables en sus cotas. Con ese
+conjunto fijo el óptimo es la solución del sistema cuadrado K·x = rhs y los
+multiplicadores la de Kᵀ·z = c, de modo que un cambio pequeño de parámetros
+se resuelve con la factorización LU de K:
+
+- cambios de lado derecho (autonomía, cotas): se reutiliza la LU y los
+  multiplicadores no cambian; la energía varía según los precios sombra
+- cambios de costos o razones: se vuelve a factorizar K (sin simplex)
+
+Si el nuevo punto deja de ser factible o algún multiplicador cambia de signo,
+una restricción cambió de estado y se recurre a una solución completa.
+"""
+from collections import namedtuple
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+from .lp_solver import NZoneModel
+
+ParametricSolution = namedtuple('ParametricSolution', [
+    'x',                  # valores óptimos de las variables
+    'energy',             # valor de la función objetivo
+    'eq_multipliers',     # ∂energía/∂b_eq (autonomía, razones, equilibrios)
+    'ineq_multipliers',   # ∂energía/∂b_ub (<= 0)
+    'lower_multipliers',  # ∂energía/∂cota inferior (>= 0)
+    'upper_multipliers',  # ∂energía/∂cota superior (<= 0)
+    'incremental',        # True si se obtuvo sin volver a llamar a HiGHS
+])
+
+
+class ParametricSolver:
+    """
+    Mantiene el conjunto activo de un NZoneModel entre cambios de parámetros
+    """
+
+    def __init__(self, model, tol=1e-9):
+        self.model = model
+        self.tol = tol
+        self.full_solves = 0
+        self.incremental_solves = 0
+        self._active = None
+        self._lu = None
+        self._A_ub = None
+        self.solution = None
+
+    @classmethod
+    def from_drone_optimization(cls, optimizer, tol=1e-9):
+        """
+        Modelo de tres zonas (s, w, j) a partir de un DroneOptimization o LagrangeAnalysis
+        """
+        return cls(NZoneModel.from_drone_optimization(optimizer), tol)
+
+    # --- Solución completa -------------------------------------------------
+
+    def solve(self, **options):
+        """
+        Solución completa con HiGHS; guarda el conjunto activo para las siguientes
+        """
+        result = self.model.solve(**options)
+        self.full_solves += 1
+        if not result.success:
+            self._active = self._lu = self.solution = None
+            raise ValueError(f"No se pudo encontrar una solución óptima: {result.message}")
+
+        n = self.model.n_zones
+        self.solution = ParametricSolution(
+            x=result.x,
+            energy=float(result.fun),
+            eq_multipliers=result.eqlin.marginals if result.eqlin.marginals.size else np.zeros(0),
+            ineq_multipliers=result.ineqlin.marginals if result.ineqlin.marginals.size else np.zeros(0),
+            lower_multipliers=np.asarray(result.lower.marginals, dtype=float).reshape(n),
+            upper_multipliers=np.asarray(result.upper.marginals, dtype=float).reshape(n),
+            incremental=False,
+        )
+        self._set_active_set(self.solution)
+        return self.solution
+
+    def _set_active_set(self, solution):
+        """
+        Identifica el conjunto activo y factoriza el sistema K correspondiente
+
+        Si el óptimo es degenerado o no es un vértice, no hay conjunto activo
+        utilizable y cada actualización hace una solución completa.
+        """
+        model, tol = self.model, self.tol
+        n = model.n_zones
+        x = solution.x
+        _, A_ub, b_ub, _, _, _ = model.build()
+
+        # Candidatos: (tipo, índice, |multiplicador|); las igualdades siempre están activas
+        candidates = []
+        if A_ub is not None:
+            slack = b_ub - A_ub @ x
+            candidates += [('ub', i, abs(solution.ineq_multipliers[i]))
+                           for i in np.flatnonzero(slack <= tol * (1 + np.abs(b_ub)))]
+        at_lower = np.isfinite(model.lower) & (x - model.lower <= tol * (1 + np.abs(model.lower)))
+        at_upper = (np.isfinite(model.upper) & ~at_lower
+                    & (model.upper - x <= tol * (1 + np.abs(model.upper))))
+        candidates += [('lower', i, abs(solution.lower_multipliers[i])) for i in np.flatnonzero(at_lower)]
+        candidates += [('upper', i, abs(solution.upper_multipliers[i])) for i in np.flatnonzero(at_upper)]
+
+        needed = n - solution.eq_multipliers.size
+        if len(candidates) < needed:
+            self._active = self._lu = None
+            return
+        # En un vértice degenerado se prefieren las restricciones con multiplicador no nulo
+        candidates.sort(key=lambda item: -item[2])
+        chosen = candidates[:needed]
+        self._active = {
+            kind: np.array(sorted(i for k, i, _ in chosen if k == kind), dtype=np.intp)
+            for kind in ('ub', 'lower', 'upper')
+        }
+        self._factorize()
+
+    def _system(self):
+        """
+        Matriz cuadrada K de las restricciones activas (igualdades, desigualdades, cotas)
+        """
+        _, A_ub, _, A_eq, _, _ = self.model.build()
+        self._A_ub = A_ub
+        n = self.model.n_zones
+        blocks = []
+        if A_eq is not None:
+            blocks.append(A_eq)
+        if self._active['ub'].size:
+            blocks.append(A_ub[self._active['ub']])
+        fixed = np.concatenate([self._active['lower'], self._active['upper']])
+        blocks.append(sparse.csr_array((np.ones(fixed.size), (np.arange(fixed.size), fixed)),
+                                       shape=(fixed.size, n)))
+        return sparse.vstack(blocks, format='csc')
+
+    def _factorize(self):
+        try:
+            self._lu = splu(self._system())
+        except RuntimeError:
+            # K singular: el conjunto activo no determina un vértice
+            self._active = self._lu = None
+
+    def _rhs(self):
+        model = self.model
+        b_ub, b_eq = model.rhs()
+        return np.concatenate([b_eq, b_ub[self._active['ub']],
+                               model.lower[self._active['lower']],
+                               model.upper[self._active['upper']]])
+
+    # --- Actualización incremental ---------------------------------------
+
+    def update(self, costs=None, autonomy=None, lower=None, upper=None,
+               ratios=None, balances=None, **options):
+        """
+        Aplica cambios al modelo y recalcula el óptimo
+
+        Mientras el conjunto activo sigue siendo válido no se llama a HiGHS;
+        si una restricción cambia de estado se hace una solución completa.
+        """
+        model = self.model
+        rhs_only = costs is None and ratios is None and balances is None
+        n = model.n_zones
+        if costs is not None:
+            model.costs = np.asarray(costs, dtype=float)
+        if autonomy is not None:
+            model.autonomy = float(autonomy)
+        if lower is not None:
+            model.lower = np.broadcast_to(np.asarray(lower, dtype=float), (n,))
+        if upper is not None:
+            model.upper = np.broadcast_to(np.asarray(upper, dtype=float), (n,))
+        if ratios is not None:
+            model.ratios = model._as_rows(ratios)
+        if balances is not None:
+            model.balances = model._as_rows(balances)
+
+        if self._lu is None:
+            return self.solve(**options)
+        if not rhs_only:
+            self._factorize()
+            if self._lu is None:
+                return self.solve(**options)
+
+        solution = self._incremental(recompute_multipliers=not rhs_only)
+        if solution is None:
+            return self.solve(**options)
+        self.incremental_solves += 1
+        self.solution = solution
+        return solution
+
+    def update_parameters(self, c_A=None, c_B=None, c_C=None, autonomy=None,
+                          priority_ratio=None, balance_ratio=None, **options):
+        """
+        update() con los nombres de DroneOptimization (modelo de tres zonas)
+        """
+        model = self.model
+        if model.n_zones != 3:
+            raise ValueError("update_parameters requiere el modelo de tres zonas (s, w, j)")
+        costs = None
+        if c_A is not None or c_B is not None or c_C is not None:
+            costs = model.costs.copy()
+            for k, value in enumerate((c_A, c_B, c_C)):
+                if value is not None:
+                    costs[k] = value
+        ratios = None if priority_ratio is None else [(0, 2, priority_ratio)]
+        balances = None if balance_ratio is None else [(1, 0, balance_ratio)]
+        # Las filas de equilibrio dependen de los costos
+        if costs is not None and balances is None:
+            balances = np.column_stack(model.balances)
+        return self.update(costs=costs, autonomy=autonomy, ratios=ratios,
+                           balances=balances, **options)
+
+    def _incremental(self, recompute_multipliers):
+        model, tol, active = self.model, self.tol, self._active
+        rhs = self._rhs()
+        if not np.isfinite(rhs).all():
+            return None
+        x = self._lu.solve(rhs)
+
+        # Factibilidad primal: desigualdades inactivas y cotas de variables libres
+        A_ub = self._A_ub
+        if A_ub is not None:
+            b_ub, _ = model.rhs()
+            inactive = np.ones(b_ub.size, dtype=bool)
+            inactive[active['ub']] = False
+            if (A_ub[inactive] @ x > b_ub[inactive] + tol * (1 + np.abs(b_ub[inactive]))).any():
+                return None
+        if ((x < model.lower - tol * (1 + np.abs(model.lower)))
+                | (x > model.upper + tol * (1 + np.abs(model.upper)))).any():
+            return None
+
+        previous = self.solution
+        if recompute_multipliers:
+            # Kᵀ·z = c: multiplicadores de igualdades, desigualdades y cotas activas
+            z = self._lu.solve(model.costs, trans='T')
+            m_eq, m_ub, m_lo = previous.eq_multipliers.size, active['ub'].size, active['lower'].size
+            eq = z[:m_eq]
+            ineq = np.zeros(previous.ineq_multipliers.size)
+            ineq[active['ub']] = z[m_eq:m_eq + m_ub]
+            lower_mult = np.zeros(model.n_zones)
+            lower_mult[active['lower']] = z[m_eq + m_ub:m_eq + m_ub + m_lo]
+            upper_mult = np.zeros(model.n_zones)
+            upper_mult[active['upper']] = z[m_eq + m_ub + m_lo:]
+            # Factibilidad dual: signos de los multiplicadores de restricciones activas
+            if (ineq > tol).any() or (lower_mult < -tol).any() or (upper_mult > tol).any():
+                return None
+        else:
+            eq, ineq = previous.eq_multipliers, previous.ineq_multipliers
+            lower_mult, upper_mult = previous.lower_multipliers, previous.upper_multipliers
+
+        return ParametricSolution(x, float(model.costs @ x), eq, ineq,
+                                  lower_mult, upper_mult, incremental=True)
+
+
+def main():
+    import time
+
+    from .lagrange_analysis import LagrangeAnalysis
+
+    print("RE-SOLUCIÓN INCREMENTAL CON MULTIPLICADORES DE LAGRANGE")
+    print("="*60)
+
+    solver = LagrangeAnalysis().parametric_solver()
+    solution = solver.solve()
+    print(f"Solución inicial: s = {solution.x[0]:.4f}, w = {solution.x[1]:.4f}, j = {solution.x[2]:.4f}")
+    print(f"Precio sombra de la autonomía (λ₁): {solution.eq_multipliers[0]:.6f} unidades/km")
+
+    start = time.perf_counter()
+    for autonomy in np.linspace(14, 16, 1_000):
+        solution = solver.update_parameters(autonomy=autonomy)
+    elapsed = time.perf_counter() - start
+    print(f"\n1000 cambios de autonomía: {elapsed * 1e3:.2f} ms "
+          f"({solver.incremental_solves} incrementales, {solver.full_solves} completas)")
+    print(f"Energía con L = 16: {solution.energy:.4f} unidades")
+
+    solution = solver.update_parameters(c_A=1.3)
+    kind = 'incremental' if solution.incremental else 'completa'
+    print(f"Con c_A = 1.3 (re-solución {kind}): energía = {solution.energy:.4f}, "
+          f"λ = {np.round(solution.eq_multipliers, 6)}")
+
+
+if __name__ == '__main__':
+    main()
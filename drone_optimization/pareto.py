@@ -0,0 +1,236 @@
+"""
+Frente de Pareto entre energía, cobertura y tiempo de vuelo
+
+El modelo base minimiza solo la energía y fija la prioridad (s = p·j) y el
+equilibrio (c_B·w = b·c_A·s) como igualdades. En el modo multiobjetivo esas
+razones y la distancia total pasan a ser parámetros del barrido (ε-restricción):
+cada combinación se resuelve con solve_batch() y se evalúan tres objetivos:
+
+- energía:   c_A·s + c_B·w + c_C·j                  (minimizar)
+- cobertura: q_A·s + q_B·w + q_C·j, q = pesos de prioridad por zona (maximizar)
+- tiempo:    s/v_A + w/v_B + j/v_C, v = velocidades por zona (minimizar)
+
+non_dominated() filtra los candidatos en O(n log n) para dos y tres objetivos.
+"""
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+import numpy as np
+
+from .optimization_solver import DEFAULT_SPEEDS, DroneOptimization, solve_batch
+
+OBJECTIVES = ('energy', 'coverage', 'time')
+
+# +1 = minimizar, -1 = maximizar
+SENSES = {'energy': 1, 'coverage': -1, 'time': 1}
+
+Candidates = namedtuple('Candidates', [
+    's', 'w', 'j', 'energy', 'coverage', 'time',
+    'distance', 'priority_ratio', 'balance_ratio',
+])
+
+
+def objectives(s, w, j, c_A, c_B, c_C, speeds=DEFAULT_SPEEDS, coverage_weights=(1.0, 1.0, 1.0)):
+    """
+    (energía, cobertura, tiempo en horas) de planes (s, w, j) vectorizados
+    """
+    v_A, v_B, v_C = speeds
+    q_A, q_B, q_C = coverage_weights
+    energy = c_A * s + c_B * w + c_C * j
+    coverage = q_A * s + q_B * w + q_C * j
+    time = s / v_A + w / v_B + j / v_C
+    return energy, coverage, time
+
+
+def _non_dominated_3d(F):
+    # Barrido en orden lexicográfico con una escalera (f2 creciente, f3 decreciente)
+    # de los puntos no dominados ya vistos: un punto está dominado si algún punto
+    # de la escalera con f2 <= su f2 tiene f3 <= su f3
+    order = np.lexsort((F[:, 2], F[:, 1], F[:, 0]))
+    f2 = F[order, 1].tolist()
+    f3 = F[order, 2].tolist()
+    stair2, stair3_neg = [], []
+    keep = np.zeros(len(order), dtype=bool)
+    for k in range(len(order)):
+        a, b = f2[k], f3[k]
+        i = bisect_right(stair2, a) - 1
+        if i >= 0 and -stair3_neg[i] <= b:
+            continue
+        keep[k] = True
+        # Se quitan de la escalera los puntos que el nuevo domina en (f2, f3)
+        pos = bisect_left(stair2, a)
+        end = bisect_right(stair3_neg, -b, lo=pos)
+        stair2[pos:end] = [a]
+        stair3_neg[pos:end] = [-b]
+    mask = np.zeros(len(order), dtype=bool)
+    mask[order] = keep
+    return mask
+
+
+def non_dominated(F, chunk_size=2048):
+    """
+    Máscara de los puntos no dominados de F (n × m, todos los objetivos a minimizar)
+
+    Los puntos repetidos se conservan todos si no están dominados. Con m <= 3 se
+    usa un barrido O(n log n); con más objetivos, comparaciones por bloques.
+    """
+    F = np.asarray(F, dtype=float)
+    if F.ndim != 2:
+        raise ValueError("F debe ser una matriz n × m")
+    n, m = F.shape
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+
+    # Se trabaja con filas únicas; las repetidas heredan el resultado
+    unique, inverse = np.unique(F, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+
+    if m == 1:
+        mask = unique[:, 0] == unique[:, 0].min()
+    elif m == 2:
+        # Orden lexicográfico: un punto es no dominado si su f2 mejora el mínimo previo
+        order = np.lexsort((unique[:, 1], unique[:, 0]))
+        f2 = unique[order, 1]
+        previous = np.minimum.accumulate(np.concatenate([[np.inf], f2[:-1]]))
+        mask = np.zeros(len(unique), dtype=bool)
+        mask[order] = f2 < previous
+    elif m == 3:
+        mask = _non_dominated_3d(unique)
+    else:
+        mask = np.ones(len(unique), dtype=bool)
+        for start in range(0, len(unique), chunk_size):
+            block = unique[start:start + chunk_size]
+            front = unique[mask]
+            dominated = ((front[None, :, :] <= block[:, None, :]).all(axis=2)
+                         & (front[None, :, :] < block[:, None, :]).any(axis=2)).any(axis=1)
+            mask[start:start + chunk_size] &= ~dominated
+        # Los puntos de bloques posteriores también pueden dominar a los anteriores
+        front = np.flatnonzero(mask)
+        for start in range(0, len(front), chunk_size):
+            idx = front[start:start + chunk_size]
+            block = unique[idx]
+            others = unique[mask]
+            dominated = ((others[None, :, :] <= block[:, None, :]).all(axis=2)
+                         & (others[None, :, :] < block[:, None, :]).any(axis=2)).any(axis=1)
+            mask[idx[dominated]] = False
+    return mask[inverse]
+
+
+class ParetoAnalysis:
+    """
+    Frente de Pareto energía-cobertura-tiempo por barridos de ε-restricción
+
+    speeds: velocidades (v_A, v_B, v_C) en km/h
+    coverage_weights: pesos de prioridad (q_A, q_B, q_C) de la cobertura
+    priority_range, balance_range: intervalos de p y b que se barren
+    """
+
+    def __init__(self, optimizer=None, speeds=DEFAULT_SPEEDS, coverage_weights=(2.0, 1.0, 1.0),
+                 priority_range=(0.5, 4.0), balance_range=(0.5, 2.0)):
+        self.optimizer = optimizer or DroneOptimization()
+        self.speeds = tuple(speeds)
+        self.coverage_weights = tuple(coverage_weights)
+        self.priority_range = priority_range
+        self.balance_range = balance_range
+
+    def candidates(self, n_distance=50, n_priority=40, n_balance=50):
+        """
+        Planes del barrido distancia × prioridad × equilibrio (una llamada a solve_batch)
+
+        La distancia total D recorre (0, autonomía]: con la autonomía como
+        igualdad, solve_batch(autonomy=D) cubre exactamente D km.
+        """
+        opt = self.optimizer
+        D, p, b = np.meshgrid(np.linspace(0, opt.autonomy, n_distance + 1)[1:],
+                              np.linspace(*self.priority_range, n_priority),
+                              np.linspace(*self.balance_range, n_balance), indexing='ij')
+        D, p, b = D.ravel(), p.ravel(), b.ravel()
+        solution = solve_batch(opt.c_A, opt.c_B, opt.c_C, D, p, b)
+        energy, coverage, time = objectives(solution.s, solution.w, solution.j,
+                                            opt.c_A, opt.c_B, opt.c_C,
+                                            self.speeds, self.coverage_weights)
+        return Candidates(solution.s, solution.w, solution.j, energy, coverage, time, D, p, b)
+
+    @staticmethod
+    def objective_matrix(candidates):
+        """
+        Matriz n × 3 con los objetivos orientados a minimizar
+        """
+        return np.column_stack([SENSES[name] * getattr(candidates, name) for name in OBJECTIVES])
+
+    def front(self, candidates=None):
+        """
+        Candidatos no dominados
+        """
+        candidates = candidates if candidates is not None else self.candidates()
+        mask = non_dominated(self.objective_matrix(candidates))
+        return Candidates(*(np.asarray(column)[mask] for column in candidates))
+
+    def weighted_sum(self, weights, candidates=None, chunk_size=256):
+        """
+        Índice del mejor candidato para cada vector de pesos (energía, cobertura, tiempo)
+
+        Los objetivos se normalizan a [0, 1] antes de ponderarlos; weights es
+        (3,) o (k, 3). Devuelve un arreglo de k índices.
+        """
+        candidates = candidates if candidates is not None else self.front()
+        F = self.objective_matrix(candidates)
+        low, high = F.min(axis=0), F.max(axis=0)
+        F = (F - low) / np.where(high > low, high - low, 1.0)
+        weights = np.atleast_2d(np.asarray(weights, dtype=float))
+        best = np.empty(len(weights), dtype=np.intp)
+        for start in range(0, len(weights), chunk_size):
+            best[start:start + chunk_size] = np.argmin(weights[start:start + chunk_size] @ F.T, axis=1)
+        return best
+
+    def epsilon_constraint(self, energy_max=np.inf, time_max=np.inf, candidates=None):
+        """
+        Índice del candidato de máxima cobertura con energía <= energy_max y
+        tiempo <= time_max (escalares o arreglos compatibles); -1 si no hay ninguno
+        """
+        candidates = candidates if candidates is not None else self.front()
+        energy_max, time_max = np.broadcast_arrays(np.asarray(energy_max, dtype=float),
+                                                   np.asarray(time_max, dtype=float))
+        feasible = ((candidates.energy <= energy_max.ravel()[:, None])
+                    & (candidates.time <= time_max.ravel()[:, None]))
+        coverage = np.where(feasible, candidates.coverage, -np.inf)
+        best = np.argmax(coverage, axis=1)
+        best[~feasible.any(axis=1)] = -1
+        return best.reshape(energy_max.shape)
+
+
+def main():
+    import time
+
+    print("FRENTE DE PARETO: ENERGÍA - COBERTURA - TIEMPO")
+    print("="*50)
+
+    analysis = ParetoAnalysis()
+    start = time.perf_counter()
+    candidates = analysis.candidates()
+    solve_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    front = analysis.front(candidates)
+    sort_time = time.perf_counter() - start
+
+    print(f"Candidatos: {candidates.energy.size:,} (resueltos en {solve_time*1000:.1f} ms)")
+    print(f"Puntos no dominados: {front.energy.size:,} (filtrados en {sort_time*1000:.1f} ms)")
+
+    print("\nCompromisos por suma ponderada (energía, cobertura, tiempo):")
+    weights = [(1, 0, 0), (0, 1, 0), (0, 0, 1), (1, 1, 1)]
+    for w, k in zip(weights, analysis.weighted_sum(weights, front)):
+        print(f"  pesos {w}: s = {front.s[k]:.2f}, w = {front.w[k]:.2f}, j = {front.j[k]:.2f} km | "
+              f"energía {front.energy[k]:.2f}, cobertura {front.coverage[k]:.2f}, "
+              f"tiempo {front.time[k]*60:.1f} min")
+
+    print("\nMáxima cobertura con energía <= ε:")
+    budgets = np.array([5.0, 10.0, 15.0, 20.0])
+    for eps, k in zip(budgets, analysis.epsilon_constraint(budgets, candidates=front)):
+        if k >= 0:
+            print(f"  ε = {eps:g}: cobertura {front.coverage[k]:.2f}, energía {front.energy[k]:.2f}, "
+                  f"p = {front.priority_ratio[k]:.2f}, b = {front.balance_ratio[k]:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,381 @@
+"""
+Presolve del sistema lineal de restricciones
+
+Antes de llamar a SLSQP o a HiGHS se analiza algebraicamente el sistema formado
+por la autonomía, las filas de razón (cobertura prioritaria) y las de equilibrio
+energético:
+
+- una fila a_i·x_i + a_k·x_k = 0 con coeficientes de signo opuesto liga dos
+  variables (x_i = ρ·x_k, ρ > 0); cada grupo de variables ligadas se reduce a una
+  sola variable t con x_v = escala_v·t
+- una fila con coeficientes del mismo signo, o con un solo coeficiente no nulo,
+  obliga a x = 0 (fila forzante)
+- un ciclo de filas consistente es redundante; uno inconsistente fuerza el grupo a 0
+- las cotas de cada variable se trasladan a t; un intervalo vacío o un valor fijo
+  fuera de las cotas es infactible
+
+Lo que queda es una mochila continua (la fila de autonomía y cotas por grupo)
+que se resuelve ordenando los grupos por costo por km. Solo los grupos con cota
+inferior -inf se dejan al solver (estado 'reduced'), salvo que ya se vea que el
+problema no está acotado.
+
+presolve_batch() hace el mismo análisis, vectorizado, para muchos escenarios del
+problema de tres zonas de DroneOptimization.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from . import metrics
+
+STATUSES = ('solved', 'reduced', 'infeasible', 'unbounded')
+
+# Códigos de presolve_batch(); infeasible y unbounded coinciden con los de linprog
+SOLVED, REDUCED, INFEASIBLE, UNBOUNDED = range(4)
+
+Presolve = namedtuple('Presolve', [
+    'status',      # 'solved', 'reduced', 'infeasible' o 'unbounded'
+    'message',
+    'conflicts',   # filas y cotas responsables de la infactibilidad o no acotación
+    'redundant',   # filas redundantes
+    'fixed',       # {índice: valor} de las variables fijadas
+    'x',           # solución completa (None si no queda determinada)
+    'energy',
+    'reduced',     # ReducedProblem (None si el problema es infactible)
+])
+
+ReducedProblem = namedtuple('ReducedProblem', [
+    'groups',      # grupo de cada variable original (-1 si está fija)
+    'scales',      # x_v = scales[v]·t[groups[v]]
+    'costs',       # costo de cada grupo: Σ c_v·escala_v
+    'weights',     # coeficiente en la autonomía: Σ escala_v
+    'lower',
+    'upper',
+    'rhs',         # autonomía que queda tras las variables fijas
+    'equality',    # autonomía como igualdad (full_coverage)
+])
+
+
+def _failure(status, message, conflicts, redundant=()):
+    return Presolve(status, message, tuple(conflicts), tuple(redundant), {}, None, np.nan, None)
+
+
+def _pair_rows(model):
+    """
+    Filas a_i·x_i + a_k·x_k = 0 del modelo con su etiqueta
+    """
+    i, k, r = model.ratios
+    for row in range(i.size):
+        yield f'ratio[{row}]', int(i[row]), int(k[row]), 1.0, -float(r[row])
+    i, k, r = model.balances
+    for row in range(i.size):
+        yield (f'balance[{row}]', int(i[row]), int(k[row]),
+               float(model.costs[i[row]]), -float(r[row] * model.costs[k[row]]))
+
+
+def presolve_model(model, tol=1e-9):
+    """
+    Presolve de un NZoneModel; devuelve un Presolve
+    """
+    with metrics.stage('presolve') as stage:
+        result = _presolve_model(model, tol)
+        stage.update(status=result.status, redundant=len(result.redundant), fixed=len(result.fixed))
+    return result
+
+
+def _presolve_model(model, tol):
+    n = model.n_zones
+    costs = model.costs
+    lower = np.asarray(model.lower, dtype=float)
+    upper = np.asarray(model.upper, dtype=float)
+
+    empty = np.flatnonzero(lower > upper + tol)
+    if empty.size:
+        labels = [f'bounds[{v}]' for v in empty]
+        return _failure('infeasible', f"Cotas vacías (lower > upper) en {', '.join(labels)}", labels)
+
+    # Unión-búsqueda con escalas: x_v = scale[v]·x_parent[v]
+    parent = list(range(n))
+    scale = [1.0] * n
+
+    def find(v):
+        path = []
+        while parent[v] != v:
+            path.append(v)
+            v = parent[v]
+        factor = 1.0
+        for u in reversed(path):
+            factor *= scale[u]
+            scale[u] = factor
+            parent[u] = v
+        return v, factor
+
+    redundant = []
+    zeros = []      # (variable, fila) que anulan el grupo de la variable
+    links = []      # (variable, fila) de las filas que ligan grupos
+    # Filas de coeficientes del mismo signo sobre variables que pueden ser
+    # negativas: no se reducen, así que el presolve solo puede probar que el
+    # problema es infactible (relajarlas no elimina infactibilidades)
+    relaxed = []
+    for label, i, k, a_i, a_k in _pair_rows(model):
+        if i == k:
+            a_i, a_k = a_i + a_k, 0.0
+        if abs(a_i) <= tol and abs(a_k) <= tol:
+            redundant.append(label)
+        elif abs(a_i) <= tol or abs(a_k) <= tol:
+            zeros.append((k if abs(a_i) <= tol else i, label))
+        elif (a_i > 0) == (a_k > 0):
+            if lower[i] < 0 or lower[k] < 0:
+                relaxed.append(label)
+            else:
+                zeros.append((i, label))
+                zeros.append((k, label))
+        else:
+            rho = -a_k / a_i
+            (ri, si), (rk, sk) = find(i), find(k)
+            if ri == rk:
+                if abs(si - rho * sk) <= tol * max(abs(si), abs(rho * sk)):
+                    redundant.append(label)
+                else:
+                    zeros.append((i, label))
+            else:
+                parent[ri] = rk
+                scale[ri] = rho * sk / si
+                links.append((i, label))
+
+    roots, scales = zip(*(find(v) for v in range(n))) if n else ((), ())
+    roots, scales = np.array(roots, dtype=np.intp), np.array(scales, dtype=float)
+    _, groups = np.unique(roots, return_inverse=True)
+    n_groups = int(groups.max()) + 1 if n else 0
+
+    zero_reason = {}
+    for v, label in zeros:
+        zero_reason.setdefault(int(groups[v]), label)
+
+    def group_labels(g):
+        # Filas que ligan el grupo y cotas no triviales de sus variables
+        labels = [label for v, label in links if groups[v] == g]
+        return labels + [f'bounds[{v}]' for v in np.flatnonzero(groups == g)
+                         if lower[v] != 0.0 or np.isfinite(upper[v])]
+
+    # Cotas de t por grupo
+    t_lower = np.full(n_groups, -np.inf)
+    t_upper = np.full(n_groups, np.inf)
+    np.maximum.at(t_lower, groups, lower / scales)
+    np.minimum.at(t_upper, groups, upper / scales)
+
+    width_tol = tol * np.maximum(1.0, np.abs(np.where(np.isfinite(t_lower), t_lower, 0.0)))
+    empty = np.flatnonzero(t_lower > t_upper + width_tol)
+    if empty.size:
+        g = empty[0]
+        return _failure('infeasible', "Las filas de razón y equilibrio y las cotas no admiten "
+                        f"ningún valor en el grupo de variables {np.flatnonzero(groups == g).tolist()}",
+                        group_labels(g), redundant)
+    for g, label in zero_reason.items():
+        if t_lower[g] > tol or t_upper[g] < -tol:
+            labels = [label] + group_labels(g)
+            return _failure('infeasible', f"{label} obliga a x = 0 en las variables "
+                            f"{np.flatnonzero(groups == g).tolist()}, fuera de sus cotas",
+                            labels, redundant)
+        t_lower[g] = t_upper[g] = 0.0
+
+    weights = np.bincount(groups, scales, minlength=n_groups)
+    group_costs = np.bincount(groups, costs * scales, minlength=n_groups)
+    is_fixed = t_upper - t_lower <= width_tol
+    rhs = model.autonomy - float(weights[is_fixed] @ t_lower[is_fixed]) if is_fixed.any() else model.autonomy
+
+    free = np.flatnonzero(~is_fixed)
+    group_index = np.full(n_groups, -1, dtype=np.intp)
+    group_index[free] = np.arange(free.size)
+    reduced = ReducedProblem(
+        groups=group_index[groups], scales=scales, costs=group_costs[free], weights=weights[free],
+        lower=t_lower[free], upper=t_upper[free], rhs=rhs, equality=bool(model.full_coverage),
+    )
+    fixed = {int(v): float(scales[v] * t_lower[groups[v]]) for v in np.flatnonzero(is_fixed[groups])}
+    summary = (f"variables: {n} -> grupos libres: {free.size}, variables fijas: {len(fixed)}, "
+               f"filas redundantes: {len(redundant)}")
+
+    t, status, message, conflicts = _solve_knapsack(reduced, tol)
+    if relaxed and status != 'infeasible':
+        return Presolve('reduced', f"Filas que el presolve no reduce ({', '.join(relaxed)}) quedan "
+                        f"para el solver; {summary}", (), tuple(redundant), fixed, None, np.nan, reduced)
+    if status in ('infeasible', 'unbounded'):
+        if status == 'infeasible' and conflicts == ['lower']:
+            conflicts = ['autonomy'] + [f'bounds[{v}]' for v in np.flatnonzero(lower > 0)]
+        elif status == 'infeasible':
+            # No se llega a cubrir L: cotas superiores finitas y grupos anulados
+            forcing = list(dict.fromkeys(zero_reason.values()))
+            if forcing:
+                message += f" ({', '.join(forcing)} obligan a x = 0 en parte de las variables)"
+            conflicts = ['autonomy'] + forcing + [f'bounds[{v}]' for v in np.flatnonzero(np.isfinite(upper))]
+        else:
+            conflicts = [label for g in conflicts for label in group_labels(free[g])]
+        return _failure(status, message, conflicts, redundant)
+    if status == 'reduced':
+        return Presolve('reduced', f"{message}; {summary}", (), tuple(redundant), fixed,
+                        None, np.nan, reduced)
+
+    values = t_lower.copy()
+    values[free] = t
+    x = scales * values[groups]
+    return Presolve('solved', f"Resuelto en el presolve: {summary}", (), tuple(redundant), fixed,
+                    x, float(costs @ x), reduced)
+
+
+def _solve_knapsack(problem, tol):
+    """
+    min Σ C_g·t_g  s.a.  Σ S_g·t_g <= R (o = R),  lower <= t <= upper,  S > 0
+
+    Devuelve (t, estado, mensaje, conflictos): grupos si no está acotado,
+    ['lower'] o ['upper'] según las cotas que causan la infactibilidad.
+    """
+    C, S, lo, hi, R = problem.costs, problem.weights, problem.lower, problem.upper, problem.rhs
+    ratio = C / S if C.size else C
+
+    unbounded_below = np.flatnonzero(np.isinf(lo))
+    if unbounded_below.size:
+        # Bajar t_g sin límite libera autonomía: no acotado si eso mejora el
+        # objetivo por sí solo (desigualdad) o si otro grupo sin cota superior
+        # aprovecha la autonomía liberada a menor costo por unidad
+        open_above = np.isinf(hi)
+        for g in unbounded_below:
+            cheaper = np.flatnonzero(open_above & (ratio < ratio[g]))
+            cheaper = cheaper[cheaper != g]
+            if (not problem.equality and C[g] > 0) or cheaper.size:
+                return None, 'unbounded', "El objetivo no está acotado inferiormente", [g, *cheaper[:1]]
+        return None, 'reduced', "Quedan grupos con cota inferior -inf para el solver", []
+
+    base = float(S @ lo)
+    capacity = R - base
+    scale = tol * max(1.0, abs(R))
+    if capacity < -scale:
+        return None, 'infeasible', (f"La autonomía L = {R:g} no alcanza para las cotas inferiores "
+                                    f"de las variables (se necesitan {base:g} km)"), ['lower']
+
+    # Se llenan los grupos por costo por km creciente; con desigualdad, solo los de costo negativo
+    order = np.argsort(ratio, kind='stable')
+    if not problem.equality:
+        order = order[ratio[order] < 0]
+    width = S[order] * (hi[order] - lo[order])
+    before = np.concatenate([[0.0], np.cumsum(width)[:-1]])
+    take = np.clip(capacity - before, 0.0, width)
+    if problem.equality and take.sum() < capacity - scale:
+        return None, 'infeasible', (f"Las cotas superiores no permiten cubrir la autonomía "
+                                    f"L = {R:g} exigida con full_coverage"), ['upper']
+    t = lo.copy()
+    t[order] += take / S[order]
+    return t, 'solved', '', []
+
+
+# Motivo de cada escenario de presolve_batch() y su estado
+BATCH_REASONS = (
+    'solución determinada por el presolve',
+    'autonomía negativa: s + w + j >= 0 no puede ser <= L',
+    'prioridad y equilibrio solo admiten s = w = j = 0 y la autonomía exige cubrir L > 0',
+    'prioridad y equilibrio solo admiten s = w = j = 0',
+    'prioridad y equilibrio son dependientes; queda para el solver',
+    'parámetros no finitos',
+)
+BATCH_STATUS = np.array([SOLVED, INFEASIBLE, INFEASIBLE, SOLVED, REDUCED, INFEASIBLE], dtype=np.int8)
+
+BatchPresolve = namedtuple('BatchPresolve', ['s', 'w', 'j', 'energy', 'status', 'reason'])
+
+
+def presolve_batch(c_A, c_B, c_C, autonomy, priority_ratio=2.0, balance_ratio=1.0,
+                   full_coverage=False):
+    """
+    Presolve vectorizado del problema de tres zonas (s, w, j >= 0)
+
+    Las filas de prioridad (1, 0, -p) y equilibrio (-b·c_A, c_B, 0) dejan una
+    recta de soluciones con dirección d = (p·c_B, p·b·c_A, c_B) (su producto
+    vectorial). Si d tiene componentes de signos opuestos solo queda x = 0; si
+    d = 0 las filas son dependientes y el escenario queda para el solver.
+    Sobre la recta, la autonomía da la solución: con full_coverage se cubre L
+    y con desigualdad se cubre L solo si el costo por km es negativo (como SLSQP).
+
+    Devuelve un BatchPresolve con s, w, j y energy (NaN si el presolve no los
+    determina), status (SOLVED, REDUCED, INFEASIBLE) y reason (índice en BATCH_REASONS).
+    """
+    with metrics.stage('presolve_batch') as stage:
+        c_A, c_B, c_C, autonomy, p, b = np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (c_A, c_B, c_C, autonomy, priority_ratio, balance_ratio))
+        )
+        d = np.stack([p * c_B, p * b * c_A, c_B])
+        dependent = (d == 0).all(axis=0)
+        d = np.where((d <= 0).all(axis=0) & ~dependent, -d, d)
+        forcing = (d < 0).any(axis=0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = autonomy / d.sum(axis=0)
+            if not full_coverage:
+                t = np.where(c_A * d[0] + c_B * d[1] + c_C * d[2] < 0, t, 0.0)
+            t = np.where(forcing | dependent, 0.0, t)
+            s, w, j = d * t
+
+        reason = np.zeros(c_A.shape, dtype=np.int8)
+        reason[forcing] = 3
+        if full_coverage:
+            reason[forcing & (autonomy > 0)] = 2
+        reason[dependent] = 4
+        reason[autonomy < 0] = 1
+        finite = np.isfinite(c_A) & np.isfinite(c_B) & np.isfinite(c_C) & np.isfinite(autonomy)
+        reason[~(finite & np.isfinite(p) & np.isfinite(b))] = 5
+        status = BATCH_STATUS[reason]
+
+        solved = status == SOLVED
+        s, w, j = (np.where(solved, v, np.nan) for v in (s, w, j))
+        energy = np.where(solved, c_A * s + c_B * w + c_C * j, np.nan)
+        stage.update(scenarios=status.size, infeasible=int(np.count_nonzero(status == INFEASIBLE)))
+
+    return BatchPresolve(s, w, j, energy, status, reason)
+
+
+def main():
+    import time
+
+    from .lp_solver import NZoneModel
+    from .optimization_solver import DroneOptimization
+
+    print("PRESOLVE DEL SISTEMA LINEAL")
+    print("="*50)
+
+    optimizer = DroneOptimization()
+    cases = [
+        ("Problema base", NZoneModel.from_drone_optimization(optimizer)),
+        ("Autonomía insuficiente para las cotas", NZoneModel(
+            [1.2, 0.9, 1.5], 5.0, ratios=[(0, 2, 2.0)], balances=[(1, 0, 1.0)], lower=[4, 0, 2])),
+        ("Razones en conflicto (s = 2j y s = 3j con L > 0)", NZoneModel(
+            [1.2, 0.9, 1.5], 15.0, ratios=[(0, 2, 2.0), (0, 2, 3.0)], balances=[(1, 0, 1.0)])),
+        ("Fila redundante (s = 2j dos veces)", NZoneModel(
+            [1.2, 0.9, 1.5], 15.0, ratios=[(0, 2, 2.0), (0, 2, 2.0)], balances=[(1, 0, 1.0)])),
+        ("Variable sin cota inferior", NZoneModel(
+            [1.2, 0.9, 1.5], 15.0, lower=[-np.inf, 0, 0], full_coverage=False)),
+    ]
+    for title, model in cases:
+        result = model.presolve()
+        print(f"\n{title}: {result.status}")
+        print(f"  {result.message}")
+        if result.conflicts:
+            print(f"  Conflictos: {', '.join(result.conflicts)}")
+        if result.redundant:
+            print(f"  Redundantes: {', '.join(result.redundant)}")
+        if result.x is not None:
+            print(f"  x = {np.round(result.x, 4).tolist()}, energía {result.energy:.4f}")
+
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    autonomy = rng.uniform(-5, 20, n)
+    priority = rng.uniform(-1, 3, n)
+    start = time.perf_counter()
+    batch = presolve_batch(optimizer.c_A, optimizer.c_B, optimizer.c_C, autonomy, priority,
+                           full_coverage=True)
+    elapsed = time.perf_counter() - start
+    print(f"\nLote de {n:,} escenarios con L y p aleatorios ({elapsed*1000:.1f} ms):")
+    for code, reason in enumerate(BATCH_REASONS):
+        count = int(np.count_nonzero(batch.reason == code))
+        if count:
+            print(f"  {STATUSES[BATCH_STATUS[code]]:<10} {count:>9,}  {reason}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Renderizado por lotes sin interfaz gráfica
+
+Cada escenario se dibuja con el backend Agg y se guarda directamente en
+archivos PNG/SVG/PDF. Los nombres de archivo son el hash del contenido
+(parámetros, estilo, gráfica, formato y resolución, más la versión del paquete
+y RENDER_VERSION), de modo que un escenario sin cambios no se vuelve a dibujar
+y una versión nueva del código de las gráficas no reutiliza archivos antiguos.
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from . import __version__
+from .spec import PARAMETERS, ProblemSpec
+
+# Gráficas disponibles -> método de DroneVisualization
+PLOTS = {
+    'surface': 'plot_3d_surface',
+    'contour': 'plot_contour_analysis',
+    'summary': 'plot_optimization_summary',
+}
+
+# Se incrementa cuando cambia el código de las gráficas para invalidar la caché
+RENDER_VERSION = 2
+
+
+def use_headless_backend():
+    """
+    Selecciona el backend Agg (sin ventanas) antes de crear figuras
+    """
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+
+def content_hash(scenario, plot, fmt, style=None, dpi=100):
+    """
+    Hash estable de todo lo que determina el contenido de un archivo renderizado
+
+    El escenario se completa con los valores por defecto: {} y {'autonomy': 15}
+    dibujan lo mismo y comparten archivo.
+    """
+    key = {
+        'version': RENDER_VERSION,
+        'package': __version__,
+        'scenario': ProblemSpec(**scenario).parameters(),
+        'style': style or {},
+        'plot': plot,
+        'format': fmt,
+        'dpi': dpi,
+    }
+    encoded = json.dumps(key, sort_keys=True, separators=(',', ':')).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def output_path(output_dir, scenario, plot, fmt, style=None, dpi=100):
+    digest = content_hash(scenario, plot, fmt, style, dpi)
+    return os.path.join(output_dir, f'{plot}-{digest[:20]}.{fmt}')
+
+
+def render_scenario(scenario, output_dir, plots=tuple(PLOTS), formats=('png',),
+                    style=None, dpi=100):
+    """
+    Renderiza las gráficas de un escenario y devuelve un registro por archivo
+
+    Los archivos existentes se reutilizan (cached=True) sin crear la figura.
+    """
+    unknown = set(scenario) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Parámetros desconocidos: {sorted(unknown)}")
+
+    records = []
+    pending = {}
+    for plot in plots:
+        for fmt in formats:
+            path = output_path(output_dir, scenario, plot, fmt, style, dpi)
+            cached = os.path.exists(path)
+            records.append({'plot': plot, 'format': fmt, 'path': path, 'cached': cached})
+            if not cached:
+                pending.setdefault(plot, []).append(path)
+
+    if pending:
+        use_headless_backend()
+        import matplotlib.pyplot as plt
+        from .visualization import DroneVisualization
+
+        visualizer = DroneVisualization(style=style, **scenario)
+        for plot, paths in pending.items():
+            fig = getattr(visualizer, PLOTS[plot])(show=False)
+            try:
+                for path in paths:
+                    # Escritura atómica: otro proceso nunca ve un archivo a medias
+                    root, ext = os.path.splitext(path)
+                    tmp_path = f'{root}.{os.getpid()}.tmp{ext}'
+                    fig.savefig(tmp_path, dpi=dpi)
+                    os.replace(tmp_path, path)
+            finally:
+                plt.close(fig)
+
+    return records
+
+
+def _render_task(args):
+    scenario, output_dir, plots, formats, style, dpi = args
+    return render_scenario(scenario, output_dir, plots, formats, style, dpi)
+
+
+def render_dashboards(scenarios, output_dir, plots=tuple(PLOTS), formats=('png',),
+                      style=None, dpi=100, workers=None):
+    """
+    Renderiza muchos escenarios en procesos paralelos
+
+    scenarios: lista de diccionarios con parámetros de DroneVisualization
+    workers: número de procesos (None = todos los núcleos, 1 = sin pool)
+    Devuelve una lista con los registros de cada escenario, en el mismo orden.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [(dict(scenario), output_dir, tuple(plots), tuple(formats), style, dpi)
+             for scenario in scenarios]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(tasks))
+    if workers <= 1:
+        return [_render_task(task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_render_task, tasks))
+
+
+def main():
+    print("RENDERIZADO DE DASHBOARDS SIN INTERFAZ")
+    print("="*50)
+
+    scenarios = [{'autonomy': autonomy} for autonomy in (10, 15, 20)]
+    results = render_dashboards(scenarios, 'renders', formats=('png', 'svg'))
+
+    for scenario, records in zip(scenarios, results):
+        for record in records:
+            status = 'caché' if record['cached'] else 'nuevo'
+            print(f"{scenario} {record['plot']:>8} [{status}] {record['path']}")
+
+
+if __name__ == '__main__':
+    main()
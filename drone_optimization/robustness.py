@@ -0,0 +1,280 @@
+"""
+Análisis de robustez por Monte Carlo
+
+Los coeficientes de consumo y la autonomía se tratan como variables aleatorias
+(viento, carga útil, estado de la batería). Un plan (s, w, j) se evalúa sobre
+10⁶-10⁷ realizaciones muestreadas por bloques de tamaño fijo, así que la memoria
+no depende del número de muestras. Cada bloque usa su propio flujo de números
+aleatorios derivado de la semilla (SeedSequence.spawn): el resultado es el mismo
+para una semilla y un tamaño de bloque dados.
+
+Los cuantiles se estiman con un histograma fijo acumulado bloque a bloque
+(error del orden del ancho de un bin); las probabilidades de fallo son exactas.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .optimization_solver import DroneOptimization, solve_batch
+
+# Parámetros que pueden ser aleatorios
+RANDOM_PARAMETERS = ('c_A', 'c_B', 'c_C', 'autonomy')
+
+# Distribuciones admitidas: nombre del método de numpy.random.Generator
+DISTRIBUTIONS = ('normal', 'uniform', 'lognormal', 'triangular', 'gamma')
+
+RobustnessReport = namedtuple('RobustnessReport', [
+    'plan',                    # (s, w, j) evaluado
+    'n_samples',
+    'failure_probability',     # P(autonomía excedida o energía sobre el presupuesto)
+    'failure_stderr',          # error estándar de failure_probability
+    'violation_probability',   # diccionario por restricción
+    'energy_mean',
+    'energy_std',
+    'energy_quantiles',        # {q: valor}
+    'margin_quantiles',        # {q: autonomía - distancia planificada} (km)
+    'seed',                    # entropía de la SeedSequence (para reproducir la corrida)
+])
+
+
+class _StreamingQuantiles:
+    """
+    Histograma de rango fijo para estimar cuantiles sin guardar las muestras
+
+    El rango se toma del primer bloque con un margen; los valores fuera de él se
+    cuentan en los extremos y se conservan el mínimo y el máximo exactos.
+    """
+
+    def __init__(self, bins=16_384, margin=0.5):
+        self.bins = bins
+        self.margin = margin
+        self.edges = None
+        self.counts = None
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    def add(self, values):
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+        if self.edges is None:
+            lo, hi = float(values.min()), float(values.max())
+            pad = self.margin * (hi - lo) or max(abs(lo), 1.0) * 1e-6
+            self.edges = np.linspace(lo - pad, hi + pad, self.bins + 1)
+            self.counts = np.zeros(self.bins + 2, dtype=np.int64)
+        index = np.searchsorted(self.edges, values, side='right')
+        self.counts += np.bincount(index, minlength=self.bins + 2)
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+
+    def quantiles(self, qs):
+        if self.counts is None:
+            return {q: float('nan') for q in qs}
+        cumulative = np.cumsum(self.counts)
+        total = cumulative[-1]
+        result = {}
+        for q in qs:
+            target = q * total
+            k = int(np.searchsorted(cumulative, target, side='left'))
+            if k == 0:
+                result[q] = self.minimum
+            elif k == self.bins + 1:
+                result[q] = self.maximum
+            else:
+                # Interpolación lineal dentro del bin k (entre edges[k-1] y edges[k])
+                before = cumulative[k - 1]
+                fraction = (target - before) / max(self.counts[k], 1)
+                value = self.edges[k - 1] + fraction * (self.edges[k] - self.edges[k - 1])
+                result[q] = float(np.clip(value, self.minimum, self.maximum))
+        return result
+
+
+class RobustnessAnalysis:
+    """
+    Evaluación estocástica de planes de DroneOptimization
+
+    distributions: {parámetro: (distribución, *argumentos)} con argumentos como en
+        numpy.random.Generator, p. ej. {'c_A': ('normal', 1.2, 0.06),
+        'autonomy': ('uniform', 13.5, 15.5)}. Por defecto, normal con 5 % de
+        desviación alrededor de los valores del optimizador.
+    energy_budget: energía disponible; None = solo se comprueba la autonomía
+    balance_tolerance: desequilibrio relativo |c_B·w - b·c_A·s| / (c_A·s) tolerado
+    """
+
+    def __init__(self, optimizer=None, distributions=None, energy_budget=None,
+                 balance_tolerance=0.05, chunk_size=1_000_000, seed=None,
+                 quantiles=(0.01, 0.05, 0.5, 0.95, 0.99), bins=16_384):
+        self.optimizer = optimizer or DroneOptimization()
+        if distributions is None:
+            distributions = {name: ('normal', float(getattr(self.optimizer, name)),
+                                    0.05 * float(getattr(self.optimizer, name)))
+                             for name in RANDOM_PARAMETERS}
+        for name, spec in distributions.items():
+            if name not in RANDOM_PARAMETERS:
+                raise ValueError(f"Parámetro no aleatorizable: {name}; válidos: {RANDOM_PARAMETERS}")
+            if spec[0] not in DISTRIBUTIONS:
+                raise ValueError(f"Distribución desconocida: {spec[0]}; válidas: {DISTRIBUTIONS}")
+        self.distributions = dict(distributions)
+        self.energy_budget = energy_budget
+        self.balance_tolerance = balance_tolerance
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.quantiles = tuple(quantiles)
+        self.bins = bins
+
+    def nominal_plan(self, autonomy=None):
+        """
+        Plan analítico con los coeficientes nominales del optimizador
+        """
+        return np.array(self.optimizer.solve_batch(autonomy)[:3], dtype=float)
+
+    def sample(self, n, rng):
+        """
+        n realizaciones de los parámetros aleatorios (los demás quedan fijos)
+        """
+        samples = {}
+        for name in RANDOM_PARAMETERS:
+            spec = self.distributions.get(name)
+            if spec is None:
+                samples[name] = np.full(n, float(getattr(self.optimizer, name)))
+            else:
+                kind, *args = spec
+                samples[name] = getattr(rng, kind)(*args, size=n)
+        return samples
+
+    def _chunks(self, n_samples, seed_sequence):
+        n_chunks = -(-n_samples // self.chunk_size)
+        for k, child in enumerate(seed_sequence.spawn(n_chunks)):
+            size = min(self.chunk_size, n_samples - k * self.chunk_size)
+            yield self.sample(size, np.random.default_rng(child))
+
+    def evaluate(self, plan=None, n_samples=1_000_000, seed_sequence=None):
+        """
+        Evalúa un plan (s, w, j) sobre n_samples realizaciones
+
+        plan: por defecto el plan nominal (solve_batch con los coeficientes del optimizador)
+        """
+        plan = self.nominal_plan() if plan is None else np.asarray(plan, dtype=float)
+        s, w, j = plan
+        distance = s + w + j
+        seed_sequence = seed_sequence or np.random.SeedSequence(self.seed)
+        b = float(self.optimizer.balance_ratio)
+
+        violations = {'autonomy': 0, 'balance': 0}
+        if self.energy_budget is not None:
+            violations['energy'] = 0
+        failures = 0
+        total = total_sq = 0.0
+        energy_q = _StreamingQuantiles(self.bins)
+        margin_q = _StreamingQuantiles(self.bins)
+
+        for params in self._chunks(n_samples, seed_sequence):
+            energy = params['c_A'] * s + params['c_B'] * w + params['c_C'] * j
+            margin = params['autonomy'] - distance
+            imbalance = np.abs(params['c_B'] * w - b * params['c_A'] * s)
+
+            failed = margin < 0
+            violations['autonomy'] += int(np.count_nonzero(failed))
+            if self.energy_budget is not None:
+                over = energy > self.energy_budget
+                violations['energy'] += int(np.count_nonzero(over))
+                failed |= over
+            violations['balance'] += int(np.count_nonzero(
+                imbalance > self.balance_tolerance * np.abs(params['c_A'] * s)))
+            failures += int(np.count_nonzero(failed))
+
+            total += float(energy.sum())
+            total_sq += float(np.square(energy).sum())
+            energy_q.add(energy)
+            margin_q.add(margin)
+
+        mean = total / n_samples
+        p = failures / n_samples
+        return RobustnessReport(
+            plan=tuple(float(v) for v in plan),
+            n_samples=n_samples,
+            failure_probability=p,
+            failure_stderr=float(np.sqrt(p * (1 - p) / n_samples)),
+            violation_probability={name: count / n_samples for name, count in violations.items()},
+            energy_mean=mean,
+            energy_std=float(np.sqrt(max(total_sq / n_samples - mean ** 2, 0.0))),
+            energy_quantiles=energy_q.quantiles(self.quantiles),
+            margin_quantiles=margin_q.quantiles(self.quantiles),
+            seed=seed_sequence.entropy,
+        )
+
+    def chance_constrained(self, alpha=0.05, n_samples=1_000_000):
+        """
+        Plan de máxima cobertura con P(fallo) <= alpha (aproximación por muestreo)
+
+        Las razones de prioridad y equilibrio fijan la dirección del plan con los
+        coeficientes nominales; solo se elige la distancia total D. Cada muestra
+        admite como máximo D_i = min(L_i, E / (c_i·u)), con u el plan por km, y D
+        es el cuantil alpha de D_i. El plan se valida con muestras independientes.
+
+        Devuelve (plan, RobustnessReport de la validación).
+        """
+        design, validation = np.random.SeedSequence(self.seed).spawn(2)
+        direction = self.nominal_plan(autonomy=1.0)
+
+        allowed = _StreamingQuantiles(self.bins)
+        for params in self._chunks(n_samples, design):
+            limit = params['autonomy']
+            if self.energy_budget is not None:
+                per_km = params['c_A'] * direction[0] + params['c_B'] * direction[1] + params['c_C'] * direction[2]
+                with np.errstate(divide='ignore'):
+                    limit = np.minimum(limit, np.where(per_km > 0, self.energy_budget / per_km, np.inf))
+            allowed.add(limit)
+
+        distance = max(allowed.quantiles([alpha])[alpha], 0.0)
+        plan = direction * distance
+        return plan, self.evaluate(plan, n_samples, validation)
+
+
+def main():
+    import time
+
+    print("ANÁLISIS DE ROBUSTEZ (MONTE CARLO)")
+    print("="*50)
+
+    optimizer = DroneOptimization()
+    nominal_energy = float(solve_batch(optimizer.c_A, optimizer.c_B, optimizer.c_C,
+                                       optimizer.autonomy).energy)
+    analysis = RobustnessAnalysis(
+        optimizer,
+        distributions={
+            'c_A': ('normal', 1.2, 0.08),      # viento
+            'c_B': ('normal', 0.9, 0.05),
+            'c_C': ('lognormal', np.log(1.5), 0.08),
+            'autonomy': ('normal', 15.0, 0.6),  # estado de la batería
+        },
+        energy_budget=1.05 * nominal_energy,
+        seed=42,
+    )
+
+    n = 5_000_000
+    start = time.perf_counter()
+    report = analysis.evaluate(n_samples=n)
+    elapsed = time.perf_counter() - start
+    _print_report("Plan nominal", report)
+    print(f"Tiempo: {elapsed:.2f} s para {n:,} muestras")
+
+    plan, report = analysis.chance_constrained(alpha=0.05, n_samples=n)
+    _print_report("Plan con restricción de probabilidad (α = 0.05)", report)
+
+
+def _print_report(title, report):
+    s, w, j = report.plan
+    print(f"\n{title}: s = {s:.4f}, w = {w:.4f}, j = {j:.4f} km")
+    print(f"  Probabilidad de fallo: {report.failure_probability:.4%} ± {report.failure_stderr:.4%}")
+    for name, probability in report.violation_probability.items():
+        print(f"  Violación de {name}: {probability:.4%}")
+    print(f"  Energía: media {report.energy_mean:.4f}, desviación {report.energy_std:.4f}")
+    print("  Cuantiles de energía: " + ", ".join(
+        f"q{q:g} = {value:.4f}" for q, value in report.energy_quantiles.items()))
+    print("  Cuantiles del margen de autonomía (km): " + ", ".join(
+        f"q{q:g} = {value:.4f}" for q, value in report.margin_quantiles.items()))
+
+
+if __name__ == '__main__':
+    main()
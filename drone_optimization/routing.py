@@ -0,0 +1,312 @@
+"""
+Optimización de rutas entre puntos de paso (TSP con 2-opt y Or-opt)
+
+Cada punto de paso pertenece a una zona (A, B o C). El costo de un tramo es su
+longitud ponderada por el consumo por km de las zonas de sus extremos
+(c_A, c_B, c_C de DroneOptimization). Los vecinos candidatos salen de un KD-tree
+y las mejoras 2-opt/Or-opt se evalúan de forma vectorizada sobre todo el
+recorrido; en cada ronda se aplican todos los movimientos que no se solapan.
+Si el recorrido supera la autonomía, se divide en salidas que vuelven a la base.
+"""
+from collections import namedtuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from .optimization_solver import DroneOptimization
+
+ZONES = ('A', 'B', 'C')
+
+Route = namedtuple('Route', [
+    'tour',           # orden de visita (índices de puntos), empieza en la base
+    'sorties',        # lista de arreglos: cada salida parte y vuelve a la base
+    'distance',       # km totales volados, incluidas las vueltas a la base
+    'energy',         # consumo energético total
+    'zone_distance',  # km volados en cada zona (A, B, C)
+    'unreachable',    # puntos fuera del alcance de ida y vuelta desde la base
+])
+
+
+def zone_codes(zones):
+    """
+    Convierte etiquetas 'A'/'B'/'C' (o 0/1/2) en códigos enteros 0/1/2
+    """
+    zones = np.asarray(zones)
+    if zones.dtype.kind in 'US':
+        codes = np.full(zones.shape, -1, dtype=np.intp)
+        for code, name in enumerate(ZONES):
+            codes[zones == name] = code
+    else:
+        codes = zones.astype(np.intp)
+    if ((codes < 0) | (codes >= len(ZONES))).any():
+        raise ValueError(f"Zonas válidas: {ZONES}")
+    return codes
+
+
+class RouteOptimizer:
+    """
+    Planificador de rutas sobre los coeficientes de un DroneOptimization
+    """
+
+    def __init__(self, optimizer=None, k_neighbors=10, max_rounds=1000):
+        self.optimizer = optimizer or DroneOptimization()
+        self.k_neighbors = k_neighbors
+        self.max_rounds = max_rounds
+
+    def zone_costs(self):
+        return np.array([self.optimizer.c_A, self.optimizer.c_B, self.optimizer.c_C])
+
+    def plan(self, coords, zones, depot=0):
+        """
+        Calcula una ruta de bajo consumo que visita todos los puntos
+
+        coords: arreglo (N, 2) de coordenadas en km
+        zones: etiqueta de zona de cada punto
+        depot: índice del punto base (salida y llegada), entre 0 y N - 1
+        """
+        coords = np.asarray(coords, dtype=float)
+        codes = zone_codes(zones)
+        weights = self.zone_costs()[codes]
+        n = len(coords)
+        if n == 0:
+            # Sin puntos de paso no hay base ni salidas
+            empty = np.empty(0, dtype=np.intp)
+            return Route(empty, [], 0.0, 0.0, np.zeros(len(ZONES)), empty)
+        if not 0 <= depot < n:
+            raise ValueError(f"depot={depot} fuera de rango para {n} puntos de paso")
+        if n == 1:
+            return self._route(coords, codes, np.arange(n), depot)
+
+        k = min(self.k_neighbors + 1, n)
+        tree = cKDTree(coords)
+        _, neighbors = tree.query(coords, k=k)
+        neighbors = neighbors[:, 1:] if k > 1 else neighbors[:, :0]
+        geometry = (coords[:, 0].copy(), coords[:, 1].copy(), weights)
+
+        path = self._nearest_neighbor_tour(coords, tree, depot)
+        path = np.append(path, depot)
+
+        # Solo se reevalúan los puntos cuyos tramos cambiaron en la ronda anterior;
+        # cuando no queda ninguno, una pasada completa confirma el óptimo local
+        active = np.ones(n, dtype=bool)
+        for _ in range(self.max_rounds):
+            touched = self._two_opt_round(path, geometry, neighbors, active)
+            touched |= self._or_opt_round(path, geometry, neighbors, active)
+            if touched.any():
+                active = touched
+            elif active.all():
+                break
+            else:
+                active = np.ones(n, dtype=bool)
+
+        return self._route(coords, codes, path[:-1], depot)
+
+    # --- Costos ----------------------------------------------------------
+
+    @staticmethod
+    def _cost(u, v, geometry):
+        """
+        Costo energético de los tramos u -> v (vectorizado)
+        """
+        x, y, w = geometry
+        return np.hypot(x[u] - x[v], y[u] - y[v]) * 0.5 * (w[u] + w[v])
+
+    # --- Recorrido inicial -------------------------------------------------
+
+    @staticmethod
+    def _nearest_neighbor_tour(coords, tree, depot):
+        n = len(coords)
+        visited = np.zeros(n, dtype=bool)
+        tour = np.empty(n, dtype=np.intp)
+        current = depot
+        visited[current] = True
+        tour[0] = current
+        for position in range(1, n):
+            k = 8
+            while True:
+                _, candidates = tree.query(coords[current], k=min(k, n))
+                candidates = np.atleast_1d(candidates)
+                free = candidates[~visited[candidates]]
+                if free.size or k >= n:
+                    break
+                k *= 4
+            current = free[0]
+            visited[current] = True
+            tour[position] = current
+        return tour
+
+    # --- Mejoras locales -------------------------------------------------
+
+    def _two_opt_round(self, path, geometry, neighbors, active):
+        """
+        Aplica los movimientos 2-opt que mejoran y no se solapan (path se modifica)
+
+        Devuelve la máscara de puntos a reevaluar en la siguiente ronda.
+        """
+        touched = np.zeros(len(active), dtype=bool)
+        m = len(path) - 1
+        position = np.empty(len(active), dtype=np.intp)
+        position[path[:-1]] = np.arange(m)
+        edge = self._cost(path[:-1], path[1:], geometry)
+
+        i = np.flatnonzero(active[path[:-1]] | active[path[1:]])
+        j = position[neighbors[path[i]].ravel()]
+        i = np.repeat(i, neighbors.shape[1])
+        i, j = np.minimum(i, j), np.maximum(i, j)
+        valid = j > i + 1
+        i, j = i[valid], j[valid]
+
+        gain = (edge[i] + edge[j]
+                - self._cost(path[i], path[j], geometry)
+                - self._cost(path[i + 1], path[j + 1], geometry))
+
+        improving = gain > 1e-12
+        touched[path[i[improving]]] = True
+        touched[path[j[improving]]] = True
+        for k in self._select(gain, i, j + 1):
+            a, b = i[k], j[k]
+            touched[path[[a, a + 1, b, b + 1]]] = True
+            path[a + 1:b + 1] = path[a + 1:b + 1][::-1].copy()
+        return touched
+
+    def _or_opt_round(self, path, geometry, neighbors, active):
+        """
+        Reubica segmentos de 1 a 3 puntos junto a un vecino cercano (path se modifica)
+
+        Devuelve la máscara de puntos a reevaluar en la siguiente ronda.
+        """
+        touched = np.zeros(len(active), dtype=bool)
+        m = len(path) - 1
+        position = np.empty(len(active), dtype=np.intp)
+        position[path[:-1]] = np.arange(m)
+        edge = self._cost(path[:-1], path[1:], geometry)
+
+        parts = []
+        for length in (1, 2, 3):
+            if m - 1 < length:
+                break
+            # Segmento path[s:s + length], con 1 <= s y s + length <= m
+            s = np.arange(1, m - length + 1)
+            s = s[active[path[s - 1]] | active[path[s]]
+                  | active[path[s + length - 1]] | active[path[s + length]]]
+            removal = (edge[s - 1] + edge[s + length - 1]
+                       - self._cost(path[s - 1], path[s + length], geometry))
+
+            j = position[neighbors[path[s]].ravel()]
+            s = np.repeat(s, neighbors.shape[1])
+            removal = np.repeat(removal, neighbors.shape[1])
+            valid = (j < s - 1) | (j > s + length - 1)
+            s, j, removal = s[valid], j[valid], removal[valid]
+
+            first, last = path[s], path[s + length - 1]
+            b, bn = path[j], path[j + 1]
+            forward = self._cost(b, first, geometry) + self._cost(last, bn, geometry)
+            backward = self._cost(b, last, geometry) + self._cost(first, bn, geometry)
+            insertion = np.minimum(forward, backward) - edge[j]
+
+            parts.append((removal - insertion, s, j, np.full(s.size, length), backward < forward))
+
+        if not parts:
+            return touched
+
+        gain, s, j, length, reverse = (np.concatenate(column) for column in zip(*parts))
+        improving = gain > 1e-12
+        touched[path[s[improving]]] = True
+        lo = np.minimum(s - 1, j)
+        hi = np.maximum(s + length, j + 1)
+        for k in self._select(gain, lo, hi):
+            start, stop, target = s[k], s[k] + length[k], j[k]
+            touched[path[[start - 1, stop, target, target + 1]]] = True
+            touched[path[start:stop]] = True
+            segment = path[start:stop][::-1] if reverse[k] else path[start:stop]
+            segment = segment.copy()
+            if target < start:
+                path[target + 1:stop] = np.concatenate([segment, path[target + 1:start]])
+            else:
+                path[start:target + 1] = np.concatenate([path[stop:target + 1], segment])
+        return touched
+
+    @staticmethod
+    def _select(gain, lo, hi, eps=1e-12):
+        """
+        Elige, por ganancia decreciente, movimientos cuyos rangos [lo, hi] no se solapan
+        """
+        improving = np.flatnonzero(gain > eps)
+        if improving.size == 0:
+            return []
+        improving = improving[np.argsort(-gain[improving])]
+        used = np.zeros(int(hi.max()) + 2, dtype=bool)
+        selected = []
+        for k in improving:
+            if not used[lo[k]:hi[k] + 1].any():
+                used[lo[k]:hi[k] + 1] = True
+                selected.append(k)
+        return selected
+
+    # --- Autonomía -------------------------------------------------------
+
+    def _route(self, coords, codes, tour, depot):
+        """
+        Divide el recorrido en salidas que respetan la autonomía y calcula métricas
+        """
+        tour = np.asarray(tour, dtype=np.intp)
+        weights = self.zone_costs()[codes]
+        autonomy = self.optimizer.autonomy
+        home = np.hypot(*(coords - coords[depot]).T)
+
+        unreachable = tour[2 * home[tour] > autonomy]
+        reachable = tour[(2 * home[tour] <= autonomy) & (tour != depot)]
+
+        sorties, current, flown = [], [], 0.0
+        previous = depot
+        for point in reachable:
+            step = float(np.hypot(*(coords[point] - coords[previous])))
+            if current and flown + step + home[point] > autonomy:
+                sorties.append(np.array([depot] + current + [depot]))
+                current, flown, previous = [], 0.0, depot
+                step = home[point]
+            current.append(point)
+            flown += step
+            previous = point
+        if current:
+            sorties.append(np.array([depot] + current + [depot]))
+
+        distance = energy = 0.0
+        zone_distance = np.zeros(len(ZONES))
+        for sortie in sorties:
+            u, v = sortie[:-1], sortie[1:]
+            length = np.hypot(*(coords[u] - coords[v]).T)
+            distance += length.sum()
+            energy += self._cost(u, v, (coords[:, 0], coords[:, 1], weights)).sum()
+            # Cada tramo se reparte a partes iguales entre las zonas de sus extremos
+            zone_distance += np.bincount(codes[u], 0.5 * length, minlength=len(ZONES))
+            zone_distance += np.bincount(codes[v], 0.5 * length, minlength=len(ZONES))
+
+        return Route(tour, sorties, float(distance), float(energy), zone_distance, unreachable)
+
+
+def main():
+    print("OPTIMIZACIÓN DE RUTA ENTRE PUNTOS DE PASO")
+    print("="*50)
+
+    rng = np.random.default_rng(0)
+    n = 2_000
+    coords = rng.uniform(0, 2, (n, 2))
+    # Zona según la franja horizontal: A (plano), B (urbano), C (montañoso)
+    zones = np.array(ZONES)[np.minimum((coords[:, 0] / 2 * 3).astype(int), 2)]
+
+    optimizer = DroneOptimization()
+    route = RouteOptimizer(optimizer).plan(coords, zones)
+
+    print(f"Puntos de paso: {n}")
+    print(f"Salidas necesarias (autonomía {optimizer.autonomy} km): {len(route.sorties)}")
+    print(f"Distancia total: {route.distance:.3f} km")
+    print(f"Consumo energético total: {route.energy:.3f} unidades")
+    for name, km in zip(ZONES, route.zone_distance):
+        print(f"Zona {name}: {km:.3f} km")
+    if len(route.unreachable):
+        print(f"Puntos fuera de alcance: {len(route.unreachable)}")
+
+
+if __name__ == '__main__':
+    main()
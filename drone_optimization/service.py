@@ -0,0 +1,397 @@
+"""
+Servicio de planificación asíncrono (HTTP/JSON) con micro-lotes
+
+Las peticiones llegan de forma concurrente y se encolan; un único bucle las
+agrupa en micro-lotes (hasta max_batch escenarios o max_delay segundos de
+espera) que se resuelven con solve_batch() en un executor, fuera del bucle de
+eventos. La cola está acotada: si se llena, el servicio responde 503 en lugar
+de acumular memoria (contrapresión).
+
+Rutas:
+    POST /solve    un escenario (objeto JSON) o una lista de escenarios
+    GET  /stats    latencias por petición (p50/p95/p99), tamaños de lote, cola
+    GET  /health   comprobación de vida
+
+Solo usa la biblioteca estándar; `drone-optimization serve --demo 2000`
+arranca el servicio en un puerto libre y lo prueba con peticiones concurrentes.
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from . import metrics
+from .spec import PARAMETERS
+from .stream import OUTPUT_FIELDS, _column_values, solve_records
+
+# Los escenarios ya se validan al recibirlos: las respuestas no llevan 'error'
+RESULT_FIELDS = tuple(name for name in OUTPUT_FIELDS if name not in ('index', 'error'))
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               413: 'Payload Too Large', 503: 'Service Unavailable'}
+
+
+class ServiceOverloaded(RuntimeError):
+    """
+    La cola de peticiones está llena
+    """
+
+
+def validate_scenario(scenario):
+    """
+    Comprueba que un escenario solo tenga parámetros conocidos con valores numéricos
+    """
+    if not isinstance(scenario, dict):
+        raise ValueError("Cada escenario debe ser un objeto JSON")
+    unknown = set(scenario) - set(PARAMETERS) - {'id'}
+    if unknown:
+        raise ValueError(f"Parámetros desconocidos: {sorted(unknown)}")
+    for name in PARAMETERS:
+        value = scenario.get(name)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise ValueError(f"{name} debe ser numérico")
+    return scenario
+
+
+def _rows(columns):
+    values = [_column_values(columns[name], 'jsonl') for name in RESULT_FIELDS]
+    return [dict(zip(RESULT_FIELDS, row)) for row in zip(*values)]
+
+
+class MicroBatcher:
+    """
+    Agrupa peticiones concurrentes en lotes para el solver vectorizado
+
+    max_batch: escenarios por lote como máximo
+    max_delay: espera (s) para completar un lote cuando la cola no llega a max_batch
+    max_queue: escenarios en cola como máximo; después submit() y submit_many() lanzan
+               ServiceOverloaded
+    max_inflight: lotes resolviéndose a la vez en el executor
+    executor: concurrent.futures.Executor (por defecto un hilo)
+    """
+
+    def __init__(self, max_batch=1024, max_delay=0.002, max_queue=10_000,
+                 max_inflight=2, executor=None, latency_window=10_000):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_queue = max_queue
+        self.max_inflight = max_inflight
+        self.executor = executor
+        self._queue = None
+        self._task = None
+        self._slots = None
+        self._solving = set()
+        self._own_executor = executor is None
+        self._latencies = deque(maxlen=latency_window)
+        self.requests = 0
+        self.rejected = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_scenarios = 0
+
+    async def start(self):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._slots = asyncio.Semaphore(self.max_inflight)
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # Las peticiones que quedaron en cola fallan en lugar de quedar colgadas
+        while self._queue is not None and not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(ServiceOverloaded("El servicio se está cerrando"))
+        if self._own_executor and self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    async def submit(self, scenario):
+        """
+        Encola un escenario y espera su resultado (diccionario)
+        """
+        return (await self.submit_many([scenario]))[0]
+
+    async def submit_many(self, scenarios):
+        """
+        Encola varios escenarios y espera sus resultados (lista, en el mismo orden)
+
+        Se encolan todos o ninguno: si no caben en la cola se lanza
+        ServiceOverloaded sin haber encolado nada.
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        if self._queue.maxsize - self._queue.qsize() < len(scenarios):
+            self.rejected += len(scenarios)
+            raise ServiceOverloaded("Cola de peticiones llena")
+        futures = [loop.create_future() for _ in scenarios]
+        for scenario, future in zip(scenarios, futures):
+            self._queue.put_nowait((scenario, future, start))
+        self.requests += len(scenarios)
+        try:
+            return await asyncio.gather(*futures)
+        finally:
+            self._latencies.extend([time.perf_counter() - start] * len(scenarios))
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            self._drain(batch)
+            if len(batch) < self.max_batch and self.max_delay > 0:
+                # Una sola espera corta para dejar que lleguen más peticiones
+                await asyncio.sleep(self.max_delay)
+                self._drain(batch)
+            await self._slots.acquire()
+            # Se guarda una referencia para que la tarea no se recolecte a medias
+            task = asyncio.create_task(self._solve(batch))
+            self._solving.add(task)
+            task.add_done_callback(self._solving.discard)
+
+    def _drain(self, batch):
+        while len(batch) < self.max_batch and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _solve(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            with metrics.stage('service.batch', scenarios=len(batch)):
+                columns = await loop.run_in_executor(
+                    self.executor, solve_records, [scenario for scenario, _, _ in batch])
+            self.batches += 1
+            self.batched_scenarios += len(batch)
+            for (_, future, _), row in zip(batch, _rows(columns)):
+                if not future.done():
+                    future.set_result(row)
+        except Exception as exc:
+            self.errors += len(batch)
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        finally:
+            self._slots.release()
+
+    def stats(self):
+        """
+        Latencias por petición (s) sobre la ventana reciente y contadores
+        """
+        latencies = np.array(self._latencies)
+        percentiles = (np.percentile(latencies, [50, 95, 99]).tolist() if latencies.size
+                       else [None] * 3)
+        return {
+            'requests': self.requests,
+            'rejected': self.rejected,
+            'errors': self.errors,
+            'batches': self.batches,
+            'mean_batch_size': self.batched_scenarios / self.batches if self.batches else None,
+            'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+            'latency_p50_s': percentiles[0],
+            'latency_p95_s': percentiles[1],
+            'latency_p99_s': percentiles[2],
+            'latency_max_s': float(latencies.max()) if latencies.size else None,
+        }
+
+
+class PlanningService:
+    """
+    Servidor HTTP/1.1 mínimo (asyncio) sobre un MicroBatcher
+    """
+
+    def __init__(self, host='127.0.0.1', port=8080, batcher=None, max_body=1 << 20):
+        self.host = host
+        self.port = port
+        self.batcher = batcher or MicroBatcher()
+        self.max_body = max_body
+        self._server = None
+
+    async def start(self):
+        await self.batcher.start()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # Con port=0 el sistema asigna un puerto libre
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.close()
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0))
+                if length > self.max_body:
+                    await self._respond(writer, 413, {'error': 'Cuerpo demasiado grande'}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, payload = await self._dispatch(method, target, body)
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, target, body):
+        path = target.split('?', 1)[0]
+        if path == '/health':
+            return 200, {'status': 'ok'}
+        if path == '/stats':
+            return 200, self.batcher.stats()
+        if path != '/solve':
+            return 404, {'error': f'Ruta desconocida: {path}'}
+        if method != 'POST':
+            return 405, {'error': 'Use POST'}
+
+        # Se valida todo el cuerpo antes de encolar nada: una lista con un
+        # escenario inválido no deja los anteriores en cola
+        try:
+            payload = json.loads(body or b'null')
+            scenarios = payload if isinstance(payload, list) else [payload]
+            for scenario in scenarios:
+                validate_scenario(scenario)
+        except ValueError as exc:
+            return 400, {'error': str(exc)}
+        if len(scenarios) > self.batcher.max_queue:
+            return 413, {'error': f'Más de {self.batcher.max_queue} escenarios en una petición'}
+
+        try:
+            results = await self.batcher.submit_many(scenarios)
+        except ServiceOverloaded as exc:
+            return 503, {'error': str(exc)}
+        return 200, results if isinstance(payload, list) else results[0]
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        head = (f'HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n'
+                f'Content-Type: application/json\r\n'
+                f'Content-Length: {len(body)}\r\n'
+                f'Connection: {"keep-alive" if keep_alive else "close"}\r\n')
+        if status == 503:
+            head += 'Retry-After: 1\r\n'
+        writer.write(head.encode('latin-1') + b'\r\n' + body)
+        await writer.drain()
+
+
+async def request(host, port, method='POST', path='/solve', payload=None):
+    """
+    Cliente mínimo para pruebas locales: devuelve (estado, JSON de respuesta)
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        body = b'' if payload is None else json.dumps(payload).encode()
+        writer.write(f'{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(body)}\r\n'
+                     f'Connection: close\r\n\r\n'.encode('latin-1') + body)
+        await writer.drain()
+        status_line = await reader.readline()
+        status = int(status_line.split()[1])
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.strip().lower() == 'content-length':
+                length = int(value)
+        return status, json.loads(await reader.readexactly(length))
+    finally:
+        writer.close()
+
+
+async def _demo(n_requests, batcher):
+    service = await PlanningService(port=0, batcher=batcher).start()
+    try:
+        rng = np.random.default_rng(0)
+        scenarios = [{'autonomy': float(a), 'c_A': float(c)}
+                     for a, c in zip(rng.uniform(10, 20, n_requests), rng.uniform(1.0, 1.4, n_requests))]
+        # Conexiones abiertas a la vez acotadas para no agotar descriptores de archivo
+        connections = asyncio.Semaphore(256)
+
+        async def send(scenario):
+            async with connections:
+                return await request(service.host, service.port, payload=scenario)
+
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(send(s) for s in scenarios))
+        elapsed = time.perf_counter() - start
+        _, stats = await request(service.host, service.port, 'GET', '/stats')
+    finally:
+        await service.close()
+
+    ok = sum(status == 200 for status, _ in responses)
+    print(f"Peticiones concurrentes: {n_requests} ({ok} correctas) en {elapsed:.3f} s")
+    print(f"Lotes: {stats['batches']}, tamaño medio: {stats['mean_batch_size']:.1f}, "
+          f"rechazadas: {stats['rejected']}")
+    print(f"Latencia p50 / p95 / p99: {stats['latency_p50_s'] * 1e3:.2f} / "
+          f"{stats['latency_p95_s'] * 1e3:.2f} / {stats['latency_p99_s'] * 1e3:.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='drone-optimization serve',
+                                     description='Servicio HTTP/JSON de planificación con micro-lotes')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--max-batch', type=int, default=1024)
+    parser.add_argument('--max-delay-ms', type=float, default=2.0)
+    parser.add_argument('--max-queue', type=int, default=10_000)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='procesos para resolver lotes (1 = un hilo del propio proceso)')
+    parser.add_argument('--demo', type=int, metavar='N',
+                        help='arranca en un puerto libre, envía N peticiones concurrentes y termina')
+    args = parser.parse_args(argv)
+
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    batcher = MicroBatcher(args.max_batch, args.max_delay_ms / 1e3, args.max_queue,
+                           max_inflight=max(2, args.workers), executor=executor)
+    try:
+        if args.demo:
+            print("SERVICIO DE PLANIFICACIÓN (DEMO LOCAL)")
+            print("="*50)
+            asyncio.run(_demo(args.demo, batcher))
+        else:
+            print(f"Servicio de planificación en http://{args.host}:{args.port} (Ctrl+C para salir)")
+            asyncio.run(PlanningService(args.host, args.port, batcher).serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,288 @@
+"""
+Simulación temporal de misiones: batería, velocidad y consumo por terreno
+
+Cada misión es una secuencia de segmentos (zona, longitud). Todas las misiones
+avanzan a la vez con un paso de tiempo fijo: el estado (posición, segmento,
+batería, tiempo) vive en arreglos de NumPy y cada paso son operaciones
+vectorizadas sobre buffers preasignados (out=), sin crear objetos por paso.
+
+Se registran el margen de reserva mínimo, el primer instante por debajo de la
+reserva y el punto de fallo (tiempo, km y segmento) de las misiones que agotan
+la batería antes de terminar.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .optimization_solver import DEFAULT_SPEEDS, DroneOptimization
+from .routing import zone_codes
+
+SimulationResult = namedtuple('SimulationResult', [
+    'completed',          # misión terminada con batería > 0
+    'failed',             # batería agotada antes de terminar
+    'failure_time',       # h desde el despegue (NaN si no falla)
+    'failure_position',   # km recorridos al fallar (NaN si no falla)
+    'failure_segment',    # segmento en el que falla (-1 si no falla)
+    'reserve_violated',   # la batería bajó de la reserva en algún momento
+    'reserve_time',       # primer instante bajo la reserva (h, NaN si nunca)
+    'reserve_margin',     # batería mínima - reserva (negativa = reserva violada)
+    'final_battery',
+    'mission_time',       # h de vuelo hasta terminar, fallar o agotar los pasos
+    'distance',           # km recorridos
+    'steps',              # pasos simulados
+])
+
+
+class MissionSimulator:
+    """
+    Simulador vectorizado de n misiones con hasta k segmentos cada una
+
+    lengths: (n, k) km por segmento; los de longitud 0 se saltan sin gastar tiempo
+             ni pasos (los del final sirven de relleno)
+    zones: (n, k) códigos 0/1/2 o etiquetas 'A'/'B'/'C'
+    capacity: energía de la batería al despegar (escalar o (n,))
+    speeds: velocidad de crucero por zona (km/h)
+    reserve: fracción de la capacidad que debe quedar como reserva
+    idle_power: consumo por hora independiente de la distancia (aviónica, sensores)
+    terrain: multiplicador del consumo por segmento (n, k), p. ej. de CostRaster
+    speed_factor: multiplicador de velocidad por misión (viento), escalar o (n,)
+    noise: desviación relativa del consumo en cada paso (0 = determinista)
+    """
+
+    def __init__(self, lengths, zones, capacity, optimizer=None, speeds=DEFAULT_SPEEDS,
+                 reserve=0.2, idle_power=0.0, terrain=None, speed_factor=1.0,
+                 noise=0.0, seed=None):
+        self.optimizer = optimizer or DroneOptimization()
+        lengths = np.atleast_2d(np.asarray(lengths, dtype=float))
+        codes = np.atleast_2d(zone_codes(zones))
+        if codes.shape != lengths.shape:
+            raise ValueError("lengths y zones deben tener la misma forma (n, k)")
+        if (codes < 0).any() or (codes > 2).any():
+            raise ValueError("Zonas desconocidas: se esperaba 'A', 'B', 'C' o 0, 1, 2")
+        n, k = lengths.shape
+
+        costs = np.array([self.optimizer.c_A, self.optimizer.c_B, self.optimizer.c_C], dtype=float)
+        rates = costs[codes]
+        if terrain is not None:
+            rates = rates * np.broadcast_to(np.asarray(terrain, dtype=float), (n, k))
+        speed = np.asarray(speeds, dtype=float)[codes] * np.broadcast_to(
+            np.asarray(speed_factor, dtype=float), (n,))[:, None]
+        if not (speed > 0).all():
+            raise ValueError("Las velocidades (speeds · speed_factor) deben ser positivas")
+
+        self.n, self.k = n, k
+        self.lengths = lengths
+        self.ends = np.cumsum(lengths, axis=1).ravel()
+        self.rates = rates.ravel()
+        self.speeds = speed.ravel()
+        # Segmentos reales: hasta el último de longitud positiva
+        positive = lengths > 0
+        self.n_segments = np.where(positive.any(axis=1), k - np.argmax(positive[:, ::-1], axis=1), 0)
+        # Primer segmento de longitud positiva a partir de cada índice (k = ninguno),
+        # con una columna extra para el índice k; fila de (k + 1) por misión
+        following = np.where(positive, np.arange(k), k)
+        following = np.minimum.accumulate(following[:, ::-1], axis=1)[:, ::-1]
+        self.next_segment = np.column_stack([following, np.full(n, k)]).ravel()
+        self.capacity = np.broadcast_to(np.asarray(capacity, dtype=float), (n,)).copy()
+        self.reserve = reserve * self.capacity
+        self.idle_power = idle_power
+        self.noise = noise
+        self.rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_plans(cls, plans, capacity, order=(0, 1, 2), **options):
+        """
+        Misiones a partir de planes (s, w, j) de forma (n, 3), volando las zonas en `order`
+        """
+        plans = np.atleast_2d(np.asarray(plans, dtype=float))
+        order = np.asarray(order, dtype=np.intp)
+        zones = np.broadcast_to(order, plans.shape)
+        return cls(plans[:, order], zones, capacity, **options)
+
+    @classmethod
+    def from_route(cls, route, coords, zones, capacity, **options):
+        """
+        Una misión por salida de una Route; cada tramo se reparte a partes iguales
+        entre las zonas de sus extremos, como en el costo de routing.py
+        """
+        coords = np.asarray(coords, dtype=float)
+        codes = zone_codes(zones)
+        k = 2 * max(len(sortie) - 1 for sortie in route.sorties)
+        lengths = np.zeros((len(route.sorties), k))
+        segment_zones = np.zeros((len(route.sorties), k), dtype=np.intp)
+        for i, sortie in enumerate(route.sorties):
+            u, v = sortie[:-1], sortie[1:]
+            half = 0.5 * np.hypot(*(coords[u] - coords[v]).T)
+            m = 2 * len(u)
+            lengths[i, :m:2] = lengths[i, 1:m:2] = half
+            segment_zones[i, :m:2], segment_zones[i, 1:m:2] = codes[u], codes[v]
+        return cls(lengths, segment_zones, capacity, **options)
+
+    def run(self, dt=1 / 360, max_steps=10_000, check_every=64):
+        """
+        Simula hasta que todas las misiones terminan o fallan (o max_steps pasos)
+
+        dt: paso de tiempo en horas (por defecto 10 s). Dentro de un paso una
+        misión no cruza el final de su segmento: el resto del paso no se vuela,
+        así que dt debe ser pequeño frente a la duración de los segmentos. El
+        tiempo y el consumo fijo se cobran por lo volado (distancia / velocidad),
+        no por el paso completo.
+        """
+        n = self.n
+        offsets = np.arange(n, dtype=np.intp) * self.k
+        next_offsets = np.arange(n, dtype=np.intp) * (self.k + 1)
+
+        # Estado
+        position = np.zeros(n)
+        segment = np.take(self.next_segment, next_offsets)
+        battery = self.capacity.copy()
+        min_battery = battery.copy()
+        elapsed = np.zeros(n)
+        active = self.n_segments > 0
+        done = ~active
+        failed = np.zeros(n, dtype=bool)
+        failure_time = np.full(n, np.nan)
+        failure_position = np.full(n, np.nan)
+        failure_segment = np.full(n, -1, dtype=np.intp)
+        reserve_time = np.full(n, np.nan)
+        reserve_seen = np.zeros(n, dtype=bool)
+
+        # Buffers de trabajo
+        index = np.empty(n, dtype=np.intp)
+        capped = np.empty(n, dtype=np.intp)
+        segment_end = np.empty(n)
+        rate = np.empty(n)
+        speed = np.empty(n)
+        step = np.empty(n)
+        remaining = np.empty(n)
+        used = np.empty(n)
+        flown = np.empty(n)
+        noise = np.empty(n)
+        flag = np.empty(n, dtype=bool)
+        below = np.empty(n, dtype=bool)
+        spare = np.empty(n, dtype=bool)
+        last = np.maximum(self.n_segments - 1, 0)
+
+        steps = 0
+        for steps in range(1, max_steps + 1):
+            # Datos del segmento actual de cada misión
+            np.minimum(segment, last, out=capped)
+            np.add(offsets, capped, out=index)
+            np.take(self.ends, index, out=segment_end)
+            np.take(self.rates, index, out=rate)
+            np.take(self.speeds, index, out=speed)
+
+            # Avance: v·dt sin pasar del final del segmento; 0 si la misión no está activa
+            np.multiply(speed, dt, out=step)
+            np.subtract(segment_end, position, out=remaining)
+            np.minimum(step, remaining, out=step)
+            np.multiply(step, active, out=step)
+            # Tiempo volado en el paso
+            np.divide(step, speed, out=flown)
+
+            # Consumo: tasa del segmento (con ruido) por distancia + potencia fija
+            np.multiply(rate, step, out=used)
+            if self.noise:
+                self.rng.standard_normal(out=noise)
+                noise *= self.noise
+                noise += 1.0
+                used *= noise
+            if self.idle_power:
+                np.multiply(flown, self.idle_power, out=noise)
+                used += noise
+            battery -= used
+            position += step
+            elapsed += flown
+
+            # Cambio de segmento (saltando los de longitud 0) y fin de misión
+            np.subtract(segment_end, 1e-12, out=remaining)
+            np.greater_equal(position, remaining, out=flag)
+            flag &= active
+            segment += flag
+            np.add(next_offsets, segment, out=index)
+            np.take(self.next_segment, index, out=segment)
+            np.greater_equal(segment, self.n_segments, out=flag)
+            flag &= active
+            done |= flag
+
+            # Reserva (primer instante por debajo) y fallo
+            np.minimum(min_battery, battery, out=min_battery)
+            np.less(battery, self.reserve, out=below)
+            np.logical_not(reserve_seen, out=spare)
+            below &= spare
+            np.copyto(reserve_time, elapsed, where=below)
+            reserve_seen |= below
+            np.less_equal(battery, 0.0, out=below)
+            below &= active
+            np.logical_not(done, out=spare)
+            below &= spare
+            np.copyto(failure_time, elapsed, where=below)
+            np.copyto(failure_position, position, where=below)
+            np.copyto(failure_segment, capped, where=below)
+            failed |= below
+
+            active &= spare
+            np.logical_not(failed, out=spare)
+            active &= spare
+            if steps % check_every == 0 and not active.any():
+                break
+
+        return SimulationResult(
+            completed=done & ~failed,
+            failed=failed,
+            failure_time=failure_time,
+            failure_position=failure_position,
+            failure_segment=failure_segment,
+            reserve_violated=reserve_seen,
+            reserve_time=reserve_time,
+            reserve_margin=min_battery - self.reserve,
+            final_battery=battery,
+            mission_time=elapsed,
+            distance=position,
+            steps=steps,
+        )
+
+
+def main():
+    import time
+
+    print("SIMULACIÓN TEMPORAL DE MISIONES")
+    print("="*50)
+
+    optimizer = DroneOptimization()
+    plan = np.array(optimizer.solve_batch()[:3], dtype=float)
+    planned_energy = float(optimizer.solve_batch().energy)
+
+    n = 10_000
+    rng = np.random.default_rng(0)
+    # Misiones del plan óptimo con viento y terreno distintos en cada dron
+    simulator = MissionSimulator.from_plans(
+        np.broadcast_to(plan, (n, 3)), capacity=1.08 * planned_energy, optimizer=optimizer,
+        reserve=0.1, idle_power=0.5, speed_factor=rng.uniform(0.7, 1.1, n),
+        terrain=rng.normal(1.0, 0.05, (n, 3)), noise=0.05, seed=1,
+    )
+
+    start = time.perf_counter()
+    result = simulator.run(dt=1 / 3600, max_steps=10_000)
+    elapsed = time.perf_counter() - start
+
+    print(f"Misiones: {n:,} | pasos: {result.steps:,} (1 s) | tiempo: {elapsed:.2f} s")
+    print(f"Plan: s = {plan[0]:.3f}, w = {plan[1]:.3f}, j = {plan[2]:.3f} km; "
+          f"energía planificada {planned_energy:.3f}, batería {1.08 * planned_energy:.3f}")
+    print(f"Completadas: {result.completed.mean():.2%}")
+    print(f"Fallidas: {result.failed.mean():.2%}")
+    print(f"Reserva violada: {result.reserve_violated.mean():.2%}")
+    print("Margen de reserva (cuantiles 5/50/95 %): " + ", ".join(
+        f"{q:.3f}" for q in np.percentile(result.reserve_margin, [5, 50, 95])))
+    if result.failed.any():
+        zones = np.bincount(result.failure_segment[result.failed], minlength=3)
+        print(f"Punto de fallo medio: {np.nanmean(result.failure_position):.3f} km, "
+              f"{np.nanmean(result.failure_time) * 60:.1f} min")
+        print(f"Fallos por zona (A, B, C): {tuple(int(c) for c in zones)}")
+    pending = ~(result.completed | result.failed)
+    if pending.any():
+        print(f"Sin terminar al agotar los pasos: {pending.sum()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,283 @@
+"""
+Definición única de los parámetros del problema
+
+ProblemSpec guarda los seis parámetros de un escenario (coeficientes de consumo,
+autonomía y razones de prioridad y equilibrio) en un arreglo de NumPy; es la
+fuente de los valores por defecto para DroneOptimization, DroneVisualization y
+LagrangeAnalysis, que exponen sus campos como atributos (c_A, autonomy, ...).
+
+ProblemBatch guarda n escenarios en un buffer contiguo (6, n), una fila por
+parámetro, y ProblemBatch[k] es un ProblemSpec que apunta a la columna k sin
+copiarla. SharedProblemBatch coloca ese buffer en multiprocessing.shared_memory:
+al enviarlo a otro proceso solo viajan el nombre del bloque y n.
+
+Las restricciones se escriben siempre en la misma forma:
+
+- autonomía:   s + w + j <= autonomy
+- prioridad:   s = priority_ratio·j
+- equilibrio:  c_B·w = balance_ratio·c_A·s, es decir, w = w_per_s·s
+"""
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Parámetros del problema, en el orden de solve_batch()
+PARAMETERS = ('c_A', 'c_B', 'c_C', 'autonomy', 'priority_ratio', 'balance_ratio')
+
+# Problema base: zonas A (plano), B (urbano) y C (montañoso), 15 km, s = 2j, c_B·w = c_A·s
+DEFAULTS = (1.2, 0.9, 1.5, 15.0, 2.0, 1.0)
+
+INDEX = {name: k for k, name in enumerate(PARAMETERS)}
+
+
+class ProblemSpec:
+    """
+    Parámetros de un escenario en un arreglo (6,) de float64
+
+    Los campos se leen y escriben como atributos; los omitidos toman DEFAULTS.
+    """
+    __slots__ = ('values',)
+
+    def __init__(self, c_A=None, c_B=None, c_C=None, autonomy=None,
+                 priority_ratio=None, balance_ratio=None):
+        given = (c_A, c_B, c_C, autonomy, priority_ratio, balance_ratio)
+        self.values = np.array([default if value is None else value
+                                for value, default in zip(given, DEFAULTS)], dtype=float)
+
+    @classmethod
+    def view(cls, values):
+        """
+        Spec sobre un buffer existente (p. ej. una columna de un ProblemBatch), sin copiarlo
+        """
+        spec = cls.__new__(cls)
+        spec.values = values
+        return spec
+
+    @classmethod
+    def from_object(cls, obj):
+        """
+        Spec con los atributos c_A, ..., balance_ratio de cualquier objeto
+        """
+        return cls(*(float(getattr(obj, name)) for name in PARAMETERS))
+
+    def parameters(self):
+        """
+        Diccionario nombre -> valor (float)
+        """
+        return dict(zip(PARAMETERS, self.values.tolist()))
+
+    def replace(self, **changes):
+        """
+        Copia con algunos campos cambiados
+        """
+        return ProblemSpec(**{**self.parameters(), **changes})
+
+    def copy(self):
+        return ProblemSpec(*self.values.tolist())
+
+    @property
+    def w_per_s(self):
+        """
+        w / s de la restricción de equilibrio: b·c_A/c_B
+        """
+        return self.balance_ratio * self.c_A / self.c_B
+
+    def __iter__(self):
+        return iter(self.values.tolist())
+
+    def __eq__(self, other):
+        if not isinstance(other, ProblemSpec):
+            return NotImplemented
+        return bool(np.array_equal(self.values, other.values))
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={value:g}' for name, value in self.parameters().items())
+        return f'ProblemSpec({fields})'
+
+
+def resolve_spec(spec=None, **overrides):
+    """
+    spec (por defecto ProblemSpec()) con los valores de overrides que no son None
+
+    Sin cambios se devuelve el mismo spec, sin copiarlo (puede ser una vista de un lote).
+    """
+    changes = {name: value for name, value in overrides.items() if value is not None}
+    if spec is None:
+        return ProblemSpec(**changes)
+    return spec.replace(**changes) if changes else spec
+
+
+def _field(index, name):
+    def get(self):
+        return float(self.values[index])
+
+    def set(self, value):
+        self.values[index] = value
+
+    return property(get, set, doc=f'{name} (campo {index} del buffer)')
+
+
+for _index, _name in enumerate(PARAMETERS):
+    setattr(ProblemSpec, _name, _field(_index, _name))
+
+
+def spec_parameters(cls):
+    """
+    Decorador de clase: expone los campos de self.spec como atributos
+
+    optimizer.c_A equivale a optimizer.spec.c_A, también al asignar.
+    """
+    def delegate(name):
+        return property(lambda self: getattr(self.spec, name),
+                        lambda self, value: setattr(self.spec, name, value),
+                        doc=f'{name} del ProblemSpec de la instancia')
+
+    for name in PARAMETERS:
+        setattr(cls, name, delegate(name))
+    return cls
+
+
+class ProblemBatch:
+    """
+    n escenarios en un buffer (6, n) de float64, una fila contigua por parámetro
+
+    batch.c_A, batch.autonomy, ... son vistas de las filas; batch[k] es un
+    ProblemSpec sobre la columna k y batch[a:b] otro ProblemBatch sobre las
+    mismas filas, ambos sin copiar.
+    """
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        data = np.asarray(data, dtype=float)
+        if data.ndim != 2 or data.shape[0] != len(PARAMETERS):
+            raise ValueError(f"El buffer debe tener forma ({len(PARAMETERS)}, n), no {data.shape}")
+        self.data = data
+
+    @classmethod
+    def empty(cls, n):
+        return cls(np.empty((len(PARAMETERS), n)))
+
+    @classmethod
+    def from_columns(cls, columns, defaults=None):
+        """
+        Lote a partir de {parámetro: valores}; los ausentes toman defaults (un ProblemSpec)
+
+        n es la longitud de la primera columna (1 si no hay columnas).
+        """
+        unknown = set(columns) - set(PARAMETERS)
+        if unknown:
+            raise ValueError(f"Parámetros desconocidos: {sorted(unknown)}; válidos: {PARAMETERS}")
+        defaults = (defaults if defaults is not None else ProblemSpec()).parameters()
+        n = len(np.atleast_1d(next(iter(columns.values())))) if columns else 1
+        batch = cls.empty(n)
+        for name, row in zip(PARAMETERS, batch.data):
+            row[...] = np.asarray(columns.get(name, defaults[name]), dtype=float)
+        return batch
+
+    @classmethod
+    def from_specs(cls, specs):
+        return cls(np.column_stack([spec.values for spec in specs]))
+
+    def __len__(self):
+        return self.data.shape[1]
+
+    def __getattr__(self, name):
+        # Solo los parámetros: pickle y copy buscan __setstate__ y demás antes de
+        # que exista self.data, y pasar por self.data recursaría sin fin
+        if name not in INDEX:
+            raise AttributeError(f"'ProblemBatch' no tiene el atributo {name!r}")
+        return self.data[INDEX[name]]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return ProblemBatch(self.data[:, key])
+        return ProblemSpec.view(self.data[:, key])
+
+    def __iter__(self):
+        return (self[k] for k in range(len(self)))
+
+    def columns(self):
+        """
+        {parámetro: fila} como vistas del buffer
+        """
+        return dict(zip(PARAMETERS, self.data))
+
+    def chunk(self, start, stop):
+        return {name: row[start:stop] for name, row in zip(PARAMETERS, self.data)}
+
+    def solve(self):
+        """
+        solve_batch() sobre todo el lote
+        """
+        from .optimization_solver import solve_batch
+
+        return solve_batch(*self.data)
+
+    def share(self):
+        """
+        Copia el lote a memoria compartida (ver SharedProblemBatch)
+        """
+        return SharedProblemBatch(self)
+
+
+def _attach(name):
+    try:
+        # Python >= 3.13: el proceso que solo se conecta no registra el bloque
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Antes de 3.13 se registra, pero los procesos hijos comparten el
+        # resource_tracker de quien creó el bloque y el registro es un conjunto:
+        # registrarlo otra vez no cambia nada y el bloque se libera una sola vez
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedProblemBatch:
+    """
+    ProblemBatch en un bloque de multiprocessing.shared_memory
+
+    Al serializarlo (pickle, initargs de un pool) solo viajan el nombre del bloque
+    y el número de escenarios; el proceso que lo recibe se conecta al mismo bloque
+    y shared.batch lee los datos sin copiarlos. El proceso que lo creó libera el
+    bloque con close() o al salir del bloque with.
+    """
+    __slots__ = ('name', 'size', 'batch', '_shm', '_owner')
+
+    def __init__(self, batch):
+        self._shm = shared_memory.SharedMemory(create=True, size=max(batch.data.nbytes, 1))
+        self._owner = True
+        self.name, self.size = self._shm.name, len(batch)
+        self.batch = ProblemBatch(self._buffer())
+        self.batch.data[...] = batch.data
+
+    def _buffer(self):
+        return np.ndarray((len(PARAMETERS), self.size), dtype=np.float64, buffer=self._shm.buf)
+
+    def __getstate__(self):
+        return self.name, self.size
+
+    def __setstate__(self, state):
+        self.name, self.size = state
+        self._shm = _attach(self.name)
+        self._owner = False
+        self.batch = ProblemBatch(self._buffer())
+
+    def close(self):
+        """
+        Suelta el buffer; quien creó el bloque además lo elimina
+        """
+        self.batch = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def __len__(self):
+        return self.size
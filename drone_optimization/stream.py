@@ -0,0 +1,307 @@
+"""
+Procesamiento en streaming de escenarios desde JSONL o CSV
+
+Las líneas de entrada se agrupan en micro-lotes de tamaño fijo. Cada lote se
+analiza, se resuelve con solve_batch() y se serializa en un proceso trabajador;
+el proceso principal solo lee líneas y escribe resultados en orden. El número de
+lotes en vuelo está acotado, así que la memoria no depende del tamaño del archivo.
+
+Los lotes se forman con registros, no con líneas físicas: las líneas en blanco
+se descartan y un registro CSV con saltos de línea dentro de un campo entre
+comillas se mantiene entero, así que index es la posición del escenario entre
+los registros de la entrada. Un registro que no se puede interpretar (JSON
+inválido, un parámetro no numérico) no detiene el flujo: su fila sale como no
+factible, con el motivo en el campo error.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import numpy as np
+
+from . import metrics
+from .optimization_solver import solve_batch, verify_batch
+from .spec import PARAMETERS, ProblemSpec
+
+OUTPUT_FIELDS = (
+    ('index', 'id') + PARAMETERS
+    + ('s', 'w', 'j', 'energy', 'feasible',
+       'residual_autonomy', 'residual_priority', 'residual_balance', 'verified', 'error')
+)
+
+# Clave de los registros que no se pudieron analizar (su valor es el motivo)
+PARSE_ERROR = '__error__'
+
+
+def _detect_format(path, default='jsonl'):
+    if path in (None, '-'):
+        return default
+    ext = os.path.splitext(path)[1].lower()
+    return 'csv' if ext == '.csv' else 'jsonl'
+
+
+def parse_lines(lines, fmt, fieldnames=None):
+    """
+    Convierte registros de texto (ver _records) en diccionarios
+    """
+    if fmt == 'csv':
+        return list(csv.DictReader(lines, fieldnames=fieldnames))
+    records = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            record = {PARSE_ERROR: f'JSON inválido: {exc}'}
+        if not isinstance(record, dict):
+            record = {PARSE_ERROR: f'se esperaba un objeto JSON, no {type(record).__name__}'}
+        records.append(record)
+    return records
+
+
+def _parameter_columns(records):
+    """
+    Columnas de parámetros y motivo de error (o None) de cada registro
+
+    Los parámetros ausentes o vacíos toman los valores de ProblemSpec. Solo los
+    campos que no son numéricos quedan en NaN (todos, si el registro no se pudo
+    analizar), lo que basta para que solve_batch marque la fila no factible;
+    errors[k] dice por qué.
+    """
+    defaults = ProblemSpec().parameters()
+    columns = {name: np.empty(len(records)) for name in PARAMETERS}
+    errors = [None] * len(records)
+    for k, record in enumerate(records):
+        if PARSE_ERROR in record:
+            errors[k] = record[PARSE_ERROR]
+            for name in PARAMETERS:
+                columns[name][k] = np.nan
+            continue
+        problems = []
+        for name in PARAMETERS:
+            value = record.get(name)
+            if value is None or value == '':
+                columns[name][k] = defaults[name]
+                continue
+            try:
+                columns[name][k] = float(value)
+            except (TypeError, ValueError):
+                columns[name][k] = np.nan
+                problems.append(f'{name}={value!r} no es numérico')
+        if problems:
+            errors[k] = '; '.join(problems)
+    return columns, errors
+
+
+def solve_records(records, start=0):
+    """
+    Resuelve una lista de registros y devuelve las columnas de salida
+
+    Los parámetros ausentes o vacíos toman los valores de ProblemSpec; los
+    registros con errores salen no factibles y con el motivo en 'error'.
+    """
+    columns, errors = _parameter_columns(records)
+
+    solution = solve_batch(*(columns[name] for name in PARAMETERS))
+    check = verify_batch(np.column_stack([solution.s, solution.w, solution.j]),
+                         columns['c_A'], columns['c_B'], columns['autonomy'],
+                         columns['priority_ratio'], columns['balance_ratio'])
+
+    columns['index'] = np.arange(start, start + len(records))
+    columns['id'] = [record.get('id') for record in records]
+    columns.update(solution._asdict())
+    columns.update({f'residual_{name}': value for name, value in check.residuals._asdict().items()})
+    columns['verified'] = check.feasible
+    columns['error'] = errors
+    return columns
+
+
+def _column_values(column, fmt):
+    if not isinstance(column, np.ndarray):
+        return column
+    # NaN no es JSON válido; los escenarios no factibles se escriben como null
+    if fmt == 'jsonl' and column.dtype.kind == 'f':
+        nan = np.isnan(column)
+        if nan.any():
+            column = column.astype(object)
+            column[nan] = None
+    return column.tolist()
+
+
+def format_results(columns, fmt):
+    """
+    Serializa las columnas de un lote como texto JSONL o CSV (sin encabezado)
+    """
+    fields = list(OUTPUT_FIELDS)
+    if fmt == 'jsonl':
+        # Campos opcionales: solo si algún registro del lote los tiene
+        fields = [name for name in fields if name not in ('id', 'error')
+                  or any(value is not None for value in columns[name])]
+    rows = zip(*(_column_values(columns[name], fmt) for name in fields))
+
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerows(rows)
+        return buffer.getvalue()
+
+    lines = [json.dumps(dict(zip(fields, row))) for row in rows]
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+def process_lines(lines, start, input_format, output_format, fieldnames=None):
+    """
+    Unidad de trabajo: analiza, resuelve y serializa un micro-lote
+    """
+    with metrics.stage('stream.parse') as stage:
+        records = parse_lines(lines, input_format, fieldnames)
+        stage['scenarios'] = len(records)
+    with metrics.stage('stream.solve'):
+        columns = solve_records(records, start)
+    with metrics.stage('stream.format'):
+        return format_results(columns, output_format)
+
+
+def _process_lines_measured(*args):
+    # En los trabajadores: se miden las etapas y los registros vuelven con el resultado
+    with metrics.recording() as recorder:
+        text = process_lines(*args)
+    return text, recorder.records()
+
+
+def _records(lines, fmt):
+    """
+    Agrupa las líneas físicas en registros y descarta las líneas en blanco
+
+    En CSV un registro sigue abierto mientras tenga un número impar de comillas:
+    un campo entre comillas puede contener saltos de línea (y líneas en blanco).
+    """
+    pending = []
+    quotes = 0
+    for line in lines:
+        if not pending and not line.strip():
+            continue
+        if fmt != 'csv':
+            yield line
+            continue
+        pending.append(line)
+        quotes += line.count('"')
+        if quotes % 2 == 0:
+            yield ''.join(pending)
+            pending, quotes = [], 0
+    if pending:
+        # Comillas sin cerrar al final de la entrada: csv informará del error
+        yield ''.join(pending)
+
+
+def _batches(records, batch_size):
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def process_stream(source, sink, batch_size=10_000, workers=None,
+                   input_format='jsonl', output_format='jsonl', max_pending=None):
+    """
+    Procesa un flujo de texto (source) y escribe los resultados en sink
+
+    workers: procesos trabajadores (None = todos los núcleos, 1 = en el proceso actual)
+    max_pending: lotes en vuelo como máximo (por defecto 2 por trabajador)
+    Devuelve el número de escenarios procesados.
+    """
+    records = _records(source, input_format)
+    fieldnames = None
+    if input_format == 'csv':
+        fieldnames = next(csv.reader([next(records, '')]), None)
+    if output_format == 'csv':
+        sink.write(','.join(OUTPUT_FIELDS) + '\n')
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    count = 0
+    batches = _batches(records, batch_size)
+    if workers <= 1:
+        for batch in batches:
+            sink.write(process_lines(batch, count, input_format, output_format, fieldnames))
+            count += len(batch)
+        sink.flush()
+        return count
+
+    max_pending = max_pending or 2 * workers
+    pending = deque()
+    recorder = metrics.get_recorder()
+    task = process_lines if recorder is None else _process_lines_measured
+
+    def write(future):
+        if recorder is None:
+            sink.write(future.result())
+        else:
+            text, records = future.result()
+            recorder.extend(records)
+            sink.write(text)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch in batches:
+            pending.append(executor.submit(task, batch, count, input_format,
+                                           output_format, fieldnames))
+            count += len(batch)
+            # Contrapresión: se espera al lote más antiguo antes de leer más
+            if len(pending) >= max_pending:
+                with metrics.stage('stream.wait'):
+                    write(pending.popleft())
+        while pending:
+            with metrics.stage('stream.wait'):
+                write(pending.popleft())
+    sink.flush()
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='drone-optimization stream',
+                                     description='Resuelve escenarios desde JSONL/CSV en micro-lotes')
+    parser.add_argument('input', nargs='?', default='-', help="archivo .jsonl/.csv o '-' para stdin")
+    parser.add_argument('-o', '--output', default='-', help="archivo de salida o '-' para stdout")
+    parser.add_argument('--input-format', choices=('jsonl', 'csv'))
+    parser.add_argument('--output-format', choices=('jsonl', 'csv'))
+    parser.add_argument('--batch-size', type=int, default=10_000)
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--metrics', help='archivo de métricas (.prom = Prometheus, otro = JSON lines)')
+    args = parser.parse_args(argv)
+
+    recorder = metrics.enable() if args.metrics else None
+
+    input_format = args.input_format or _detect_format(args.input)
+    output_format = args.output_format or _detect_format(args.output, default=input_format)
+
+    source = sys.stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+    sink = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+    try:
+        count = process_stream(source, sink, args.batch_size, args.workers,
+                               input_format, output_format)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    print(f"Escenarios procesados: {count}", file=sys.stderr)
+    if recorder is not None:
+        if args.metrics.endswith('.prom'):
+            recorder.write_prometheus(args.metrics)
+        else:
+            recorder.write_jsonl(args.metrics)
+        print(f"Métricas guardadas en {args.metrics}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
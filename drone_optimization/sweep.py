@@ -0,0 +1,221 @@
+"""
+Barridos de sensibilidad multiparamétricos
+
+Los diseños (malla completa o hipercubo latino) se recorren por bloques de
+tamaño fijo; cada bloque se resuelve con solve_batch() en un pool de procesos
+y los resultados se guardan en un almacén columnar (un arreglo por campo).
+
+Los puntos de un SampleDesign viven en un ProblemBatch; con varios procesos se
+copian una vez a memoria compartida y los trabajadores leen sus bloques de ahí.
+Los trabajadores devuelven solo las columnas de la solución: los parámetros no
+se serializan en ningún sentido.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .optimization_solver import solve_batch
+from .spec import PARAMETERS, ProblemBatch, ProblemSpec, SharedProblemBatch
+
+# Columnas de resultados que se añaden a los parámetros
+RESULT_COLUMNS = ('s', 'w', 'j', 'energy', 'feasible')
+
+
+def default_parameters():
+    """
+    Valores del problema base (ProblemSpec) para los parámetros no barridos
+    """
+    return ProblemSpec().parameters()
+
+
+def _check_names(names):
+    unknown = set(names) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Parámetros desconocidos: {sorted(unknown)}; válidos: {PARAMETERS}")
+
+
+class GridDesign:
+    """
+    Malla cartesiana sobre los parámetros indicados; los demás quedan fijos
+
+    Los puntos no se materializan: cada bloque se genera a partir de sus índices.
+    """
+
+    def __init__(self, **axes):
+        _check_names(axes)
+        defaults = default_parameters()
+        self.axes = {
+            name: np.atleast_1d(np.asarray(axes.get(name, defaults[name]), dtype=float))
+            for name in PARAMETERS
+        }
+        self.shape = tuple(values.size for values in self.axes.values())
+
+    def __len__(self):
+        return int(np.prod(self.shape))
+
+    def chunk(self, start, stop):
+        indices = np.unravel_index(np.arange(start, stop), self.shape)
+        return {name: values[idx] for (name, values), idx in zip(self.axes.items(), indices)}
+
+
+class SampleDesign:
+    """
+    Conjunto explícito de puntos en un ProblemBatch (una fila por parámetro)
+
+    columns: {parámetro: valores}; los ausentes toman los valores base.
+    batch: ProblemBatch ya construido (p. ej. el de un SharedProblemBatch), sin copiarlo.
+    """
+
+    def __init__(self, columns=None, batch=None):
+        if batch is None:
+            columns = columns or {}
+            _check_names(columns)
+            batch = ProblemBatch.from_columns(columns)
+        self.batch = batch
+
+    @property
+    def columns(self):
+        return self.batch.columns()
+
+    def __len__(self):
+        return len(self.batch)
+
+    def chunk(self, start, stop):
+        return self.batch.chunk(start, stop)
+
+
+def latin_hypercube(n, seed=None, **bounds):
+    """
+    Hipercubo latino de n puntos; bounds mapea parámetro -> (mínimo, máximo)
+    """
+    _check_names(bounds)
+    if not bounds:
+        raise ValueError(f"Indique al menos un parámetro con sus límites; válidos: {PARAMETERS}")
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, (low, high) in bounds.items():
+        # Un punto por estrato, con los estratos permutados de forma independiente
+        strata = (rng.permutation(n) + rng.random(n)) / n
+        columns[name] = low + (high - low) * strata
+    return SampleDesign(columns)
+
+
+class SweepResult:
+    """
+    Almacén columnar de resultados: parámetros de entrada y solución por escenario
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        return self.columns['energy'].size
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def keys(self):
+        return self.columns.keys()
+
+    def save(self, path):
+        """
+        Guarda las columnas en un archivo .npz
+        """
+        np.savez(path, **self.columns)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls({name: data[name] for name in data.files})
+
+    @classmethod
+    def concatenate(cls, parts):
+        names = parts[0].keys()
+        return cls({name: np.concatenate([part[name] for part in parts]) for name in names})
+
+
+def solve_columns(columns, include_parameters=True):
+    """
+    Resuelve un bloque de escenarios y devuelve parámetros + solución como columnas
+    """
+    solution = solve_batch(*(columns[name] for name in PARAMETERS))
+    result = dict(columns) if include_parameters else {}
+    result.update(solution._asdict())
+    return SweepResult(result)
+
+
+# Diseño compartido por cada proceso del pool (se envía una sola vez al iniciarlo;
+# un SharedProblemBatch solo lleva el nombre del bloque de memoria compartida)
+_worker_design = None
+_worker_shared = None
+
+
+def _init_worker(design):
+    global _worker_design, _worker_shared
+    if isinstance(design, SharedProblemBatch):
+        _worker_shared = design
+        design = SampleDesign(batch=design.batch)
+    _worker_design = design
+
+
+def _solve_range(bounds):
+    start, stop = bounds
+    return solve_columns(_worker_design.chunk(start, stop), include_parameters=False)
+
+
+def run_sweep(design, workers=None, chunk_size=100_000):
+    """
+    Ejecuta el barrido por bloques de chunk_size escenarios
+
+    workers: número de procesos (None = todos los núcleos, 1 = sin pool)
+    """
+    n = len(design)
+    ranges = [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+    if not ranges:
+        return solve_columns(design.chunk(0, 0))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(ranges))
+    if workers <= 1:
+        parts = [solve_columns(design.chunk(start, stop)) for start, stop in ranges]
+        return SweepResult.concatenate(parts)
+
+    shared = design.batch.share() if isinstance(design, SampleDesign) else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shared or design,)) as executor:
+            parts = list(executor.map(_solve_range, ranges))
+    finally:
+        if shared is not None:
+            shared.close()
+
+    # Los trabajadores solo devuelven la solución; los parámetros se toman del diseño
+    result = SweepResult.concatenate(parts)
+    columns = {name: np.array(values) for name, values in design.chunk(0, n).items()}
+    columns.update(result.columns)
+    return SweepResult(columns)
+
+
+def main():
+    print("BARRIDO DE SENSIBILIDAD MULTIPARAMÉTRICO")
+    print("="*50)
+
+    design = latin_hypercube(
+        1_000_000, seed=0,
+        c_A=(1.0, 1.4), c_B=(0.7, 1.1), c_C=(1.2, 1.8),
+        autonomy=(10, 20), priority_ratio=(1.5, 2.5), balance_ratio=(0.8, 1.2),
+    )
+    result = run_sweep(design)
+
+    energy = result['energy'][result['feasible']]
+    print(f"Escenarios evaluados: {len(result)}")
+    print(f"Escenarios factibles: {energy.size}")
+    print(f"Consumo mínimo: {energy.min():.4f} unidades")
+    print(f"Consumo mediano: {np.median(energy):.4f} unidades")
+    print(f"Consumo máximo: {energy.max():.4f} unidades")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+"""
+Mapas ráster de costo energético por celda
+
+Los rásters se guardan en un formato binario compacto: una cabecera fija de
+64 bytes seguida de los datos en orden (banda, fila, columna). Se abren con
+numpy.memmap, así que solo se leen del disco las páginas que tocan las rutas
+o los bloques que se recorren; un ráster de varios GB no se carga en memoria.
+
+Cada banda es una componente del costo por km (p. ej. pendiente, viento,
+densidad de obstáculos); el costo de una celda es la suma ponderada de bandas.
+"""
+import struct
+
+import numpy as np
+
+MAGIC = b'DRCM'
+VERSION = 1
+HEADER_SIZE = 64
+
+# magic, versión, dtype ('f4'/'f8'), bandas, filas, columnas, tamaño de celda, origen x, origen y
+_HEADER = struct.Struct('<4sH2sIIIddd')
+
+
+def write_cost_raster(path, data, cell_size=1.0, origin=(0.0, 0.0), dtype=np.float32):
+    """
+    Escribe un ráster de costos (rows, cols) o (bands, rows, cols) en formato compacto
+
+    cell_size y origin están en km; origin es la esquina inferior izquierda y la
+    fila 0 corresponde a la y mínima. dtype puede ser float32 (por defecto) o float64.
+    """
+    data = np.asarray(data)
+    if data.ndim == 2:
+        data = data[None]
+    if data.ndim != 3:
+        raise ValueError("El ráster debe tener forma (rows, cols) o (bands, rows, cols)")
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("dtype debe ser float32 o float64")
+
+    header = _HEADER.pack(MAGIC, VERSION, dtype.str[1:].encode(), *data.shape,
+                          float(cell_size), float(origin[0]), float(origin[1]))
+    with open(path, 'wb') as fh:
+        fh.write(header.ljust(HEADER_SIZE, b'\0'))
+        # Banda a banda para no duplicar en memoria rásters grandes
+        for band in data:
+            np.ascontiguousarray(band, dtype=dtype.newbyteorder('<')).tofile(fh)
+
+
+class CostRaster:
+    """
+    Ráster de costos abierto con numpy.memmap (solo lectura)
+    """
+
+    def __init__(self, data, cell_size=1.0, origin=(0.0, 0.0), band_weights=None):
+        self.data = data if data.ndim == 3 else data[None]
+        self.bands, self.rows, self.cols = self.data.shape
+        self.cell_size = float(cell_size)
+        self.origin = (float(origin[0]), float(origin[1]))
+        self.band_weights = (np.ones(self.bands) if band_weights is None
+                             else np.asarray(band_weights, dtype=float))
+        if self.band_weights.shape != (self.bands,):
+            raise ValueError(f"Se esperaban {self.bands} pesos de banda")
+
+    @classmethod
+    def open(cls, path, band_weights=None):
+        with open(path, 'rb') as fh:
+            header = fh.read(HEADER_SIZE)
+        magic, version, dtype, bands, rows, cols, cell_size, x0, y0 = _HEADER.unpack_from(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} no es un ráster de costos válido")
+        data = np.memmap(path, dtype=np.dtype('<' + dtype.decode()), mode='r',
+                         offset=HEADER_SIZE, shape=(bands, rows, cols))
+        return cls(data, cell_size, (x0, y0), band_weights)
+
+    @property
+    def extent(self):
+        """
+        (x_min, x_max, y_min, y_max) en km
+        """
+        x0, y0 = self.origin
+        return x0, x0 + self.cols * self.cell_size, y0, y0 + self.rows * self.cell_size
+
+    def cell_index(self, x, y):
+        """
+        Fila y columna de las celdas que contienen los puntos (x, y)
+
+        Los puntos sobre el borde superior de la extensión (x = x_max o y = y_max)
+        pertenecen a la última columna o fila; solo se rechazan los que quedan fuera.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        x_min, x_max, y_min, y_max = self.extent
+        inside = (x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)
+        if not inside.all():
+            raise ValueError("Hay puntos fuera de la extensión del ráster")
+        col = np.floor((x - x_min) / self.cell_size).astype(np.intp)
+        row = np.floor((y - y_min) / self.cell_size).astype(np.intp)
+        return np.minimum(row, self.rows - 1), np.minimum(col, self.cols - 1)
+
+    def cost_at(self, x, y):
+        """
+        Costo por km en los puntos (x, y); solo se leen las celdas tocadas
+        """
+        row, col = self.cell_index(x, y)
+        cost = np.zeros(np.shape(row))
+        for band, weight in enumerate(self.band_weights):
+            if weight:
+                cost += weight * self.data[band][row, col]
+        return cost
+
+    def segment_energy(self, start, end, step=None, max_samples=1_000_000):
+        """
+        Energía de cada tramo start[k] -> end[k] por integración sobre el ráster
+
+        Cada tramo se muestrea con la regla del punto medio cada `step` km
+        (por defecto media celda). Los tramos se procesan por bloques de como
+        máximo max_samples muestras para acotar la memoria.
+        """
+        start = np.atleast_2d(np.asarray(start, dtype=float))
+        end = np.atleast_2d(np.asarray(end, dtype=float))
+        step = step or 0.5 * self.cell_size
+
+        delta = end - start
+        length = np.hypot(delta[:, 0], delta[:, 1])
+        samples = np.maximum(np.ceil(length / step).astype(np.intp), 1)
+        energy = np.empty(len(start))
+
+        first = 0
+        while first < len(start):
+            # Bloque de tramos cuyo total de muestras no supera max_samples
+            cumulative = np.cumsum(samples[first:])
+            last = first + max(int(np.searchsorted(cumulative, max_samples, side='right')), 1)
+            block = slice(first, last)
+
+            counts = samples[block]
+            segment = np.repeat(np.arange(counts.size), counts)
+            offsets = np.arange(segment.size) - np.repeat(np.cumsum(counts) - counts, counts)
+            t = (offsets + 0.5) / counts[segment]
+
+            points = start[block][segment] + t[:, None] * delta[block][segment]
+            cost = self.cost_at(points[:, 0], points[:, 1])
+            weights = (length[block] / counts)[segment]
+            energy[block] = np.bincount(segment, cost * weights, minlength=counts.size)
+            first = last
+
+        return energy
+
+    def path_energy(self, points, step=None):
+        """
+        Energía total de una polilínea (M, 2) de puntos en km
+        """
+        points = np.asarray(points, dtype=float)
+        if len(points) < 2:
+            return 0.0
+        return float(self.segment_energy(points[:-1], points[1:], step).sum())
+
+    def zone_coefficients(self, zones, n_zones=3, block_rows=1024):
+        """
+        Costo medio por km de cada zona a partir de un ráster de etiquetas
+
+        zones: arreglo (rows, cols) con códigos 0..n_zones-1 (puede ser un memmap);
+        se recorre por bloques de filas. Devuelve un arreglo (c_A, c_B, c_C, ...).
+        """
+        if np.shape(zones) != (self.rows, self.cols):
+            raise ValueError("El ráster de zonas debe tener la misma forma que el de costos")
+        totals = np.zeros(n_zones)
+        counts = np.zeros(n_zones)
+        for top in range(0, self.rows, block_rows):
+            rows = slice(top, min(top + block_rows, self.rows))
+            codes = np.asarray(zones[rows], dtype=np.intp).ravel()
+            cost = np.zeros(codes.size)
+            for band, weight in enumerate(self.band_weights):
+                if weight:
+                    cost += weight * np.asarray(self.data[band][rows], dtype=float).ravel()
+            valid = (codes >= 0) & (codes < n_zones)
+            totals += np.bincount(codes[valid], cost[valid], minlength=n_zones)
+            counts += np.bincount(codes[valid], minlength=n_zones)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return totals / counts
+
+    def apply_to(self, optimizer, zones):
+        """
+        Sustituye c_A, c_B y c_C de un DroneOptimization por los del ráster
+        """
+        optimizer.c_A, optimizer.c_B, optimizer.c_C = (float(c) for c in self.zone_coefficients(zones))
+        return optimizer
+
+
+def main():
+    import os
+    import tempfile
+
+    from .optimization_solver import DroneOptimization
+
+    print("MAPAS RÁSTER DE COSTO ENERGÉTICO")
+    print("="*50)
+
+    # Campo de 6 x 3 km con celdas de 10 m: franjas A (plano), B (urbano), C (montañoso)
+    rows, cols, cell = 300, 600, 0.01
+    rng = np.random.default_rng(0)
+    zones = np.repeat(np.arange(3), cols // 3)[None, :].repeat(rows, axis=0)
+    base = np.array([1.2, 0.9, 1.5])[zones]
+    slope = 0.1 * rng.random((rows, cols)) * (zones == 2)
+    wind = 0.05 * rng.standard_normal((rows, cols))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'field.drcm')
+        write_cost_raster(path, np.stack([base, slope, wind]), cell_size=cell)
+        raster = CostRaster.open(path)
+
+        coefficients = raster.zone_coefficients(zones)
+        print("Coeficientes efectivos por zona:")
+        for name, value in zip('ABC', coefficients):
+            print(f"  c_{name} = {value:.4f} unidades/km")
+
+        optimizer = raster.apply_to(DroneOptimization(), zones)
+        s, w, j = optimizer.analytical_solution()
+        print(f"Solución con coeficientes del ráster: s = {s:.4f}, w = {w:.4f}, j = {j:.4f}")
+
+        path_points = np.array([[0.1, 0.1], [5.9, 2.9], [0.1, 2.9]])
+        print(f"Energía de la ruta de ejemplo: {raster.path_energy(path_points):.4f} unidades")
+
+        # Liberar el memmap antes de borrar el archivo
+        del raster
+
+
+if __name__ == '__main__':
+    main()
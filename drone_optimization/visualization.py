@@ -0,0 +1,864 @@
+import argparse
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.transforms import Bbox
+from matplotlib.widgets import Slider
+import seaborn as sns
+
+from .optimization_solver import solve_batch
+from .spec import resolve_spec, spec_parameters
+
+
+# Estilo por defecto de las gráficas
+DEFAULT_STYLE = {'style': 'seaborn-v0_8', 'palette': 'husl'}
+
+# Parámetro -> (etiqueta, mínimo, máximo) de los deslizadores del explorador
+EXPLORER_RANGES = {
+    'c_A': ('c_A (Plano)', 0.3, 3.0),
+    'c_B': ('c_B (Urbano)', 0.3, 3.0),
+    'c_C': ('c_C (Montañoso)', 0.3, 3.0),
+    'autonomy': ('Autonomía (km)', 5.0, 25.0),
+    'priority_ratio': ('Prioridad p', 0.5, 4.0),
+    'balance_ratio': ('Equilibrio b', 0.25, 3.0),
+}
+
+
+# Estadísticos de density_grid
+DENSITY_STATISTICS = ('count', 'sum', 'mean', 'min', 'max')
+
+
+def density_grid(x, y, values=None, bins=256, extent=None, statistic='count',
+                 chunk_size=1_000_000):
+    """
+    Agrega puntos (x, y) en una malla regular con np.bincount, por bloques
+
+    El costo de dibujar el resultado depende solo de bins, no del número de
+    puntos. bins: entero o (nx, ny); extent: (x_min, x_max, y_min, y_max), por
+    defecto el rango de los datos finitos. Los puntos fuera de extent o con
+    valores no finitos se descartan.
+
+    Devuelve (grid, extent) con grid de forma (ny, nx); las celdas vacías son
+    NaN salvo con statistic='count'.
+    """
+    if statistic not in DENSITY_STATISTICS:
+        raise ValueError(f"Estadístico desconocido: {statistic}; válidos: {DENSITY_STATISTICS}")
+    if statistic != 'count' and values is None:
+        raise ValueError(f"statistic='{statistic}' requiere values")
+    x, y = np.asarray(x, dtype=float).ravel(), np.asarray(y, dtype=float).ravel()
+    if values is not None:
+        values = np.broadcast_to(np.asarray(values, dtype=float), x.shape).ravel()
+    nx, ny = (bins, bins) if np.isscalar(bins) else bins
+
+    if extent is None:
+        finite = np.isfinite(x) & np.isfinite(y)
+        extent = (float(x[finite].min()), float(x[finite].max()),
+                  float(y[finite].min()), float(y[finite].max()))
+    x0, x1, y0, y1 = extent
+    # Rango nulo (una sola columna de datos): se ensancha para no dividir entre cero
+    x_scale = nx / ((x1 - x0) or 1.0)
+    y_scale = ny / ((y1 - y0) or 1.0)
+
+    cells = nx * ny
+    counts = np.zeros(cells, dtype=np.int64)
+    totals = np.zeros(cells) if statistic in ('sum', 'mean') else None
+    if statistic == 'min':
+        extreme = np.full(cells, np.inf)
+    elif statistic == 'max':
+        extreme = np.full(cells, -np.inf)
+
+    for start in range(0, x.size, chunk_size):
+        xs, ys = x[start:start + chunk_size], y[start:start + chunk_size]
+        keep = (xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1)
+        vs = None
+        if values is not None:
+            vs = values[start:start + chunk_size]
+            keep &= np.isfinite(vs)
+            vs = vs[keep]
+        # El borde superior cae en la última celda
+        ix = np.minimum(((xs[keep] - x0) * x_scale).astype(np.intp), nx - 1)
+        iy = np.minimum(((ys[keep] - y0) * y_scale).astype(np.intp), ny - 1)
+        flat = iy * nx + ix
+
+        counts += np.bincount(flat, minlength=cells)
+        if totals is not None:
+            totals += np.bincount(flat, weights=vs, minlength=cells)
+        elif statistic == 'min':
+            np.minimum.at(extreme, flat, vs)
+        elif statistic == 'max':
+            np.maximum.at(extreme, flat, vs)
+
+    if statistic == 'count':
+        grid = counts.astype(float)
+    elif statistic == 'sum':
+        grid = np.where(counts > 0, totals, np.nan)
+    elif statistic == 'mean':
+        with np.errstate(invalid='ignore', divide='ignore'):
+            grid = np.where(counts > 0, totals / counts, np.nan)
+    else:
+        grid = np.where(counts > 0, extreme, np.nan)
+    return grid.reshape(ny, nx), (x0, x1, y0, y1)
+
+
+def adaptive_mesh(refine, extent, base=16, depth=5):
+    """
+    Malla cuadtree: parte de base×base celdas y divide en 4 las que refine() marca
+
+    refine(x0, y0, x1, y1) recibe arreglos con las esquinas de las celdas y
+    devuelve una máscara booleana. Devuelve los vértices (x, y) únicos de las
+    celdas hoja.
+    """
+    xa, xb, ya, yb = extent
+    edges_x = np.linspace(xa, xb, base + 1)
+    edges_y = np.linspace(ya, yb, base + 1)
+    X0, Y0 = np.meshgrid(edges_x[:-1], edges_y[:-1])
+    x0, y0 = X0.ravel(), Y0.ravel()
+    dx, dy = (xb - xa) / base, (yb - ya) / base
+
+    leaves_x, leaves_y = [], []
+    for level in range(depth + 1):
+        mask = refine(x0, y0, x0 + dx, y0 + dy) if level < depth else np.zeros(x0.size, bool)
+        # Las celdas que no se dividen aportan sus cuatro esquinas
+        keep_x, keep_y = x0[~mask], y0[~mask]
+        leaves_x += [keep_x, keep_x + dx, keep_x, keep_x + dx]
+        leaves_y += [keep_y, keep_y, keep_y + dy, keep_y + dy]
+        if not mask.any():
+            break
+        dx, dy = dx / 2, dy / 2
+        x0, y0 = x0[mask], y0[mask]
+        x0 = np.concatenate([x0, x0 + dx, x0, x0 + dx])
+        y0 = np.concatenate([y0, y0, y0 + dy, y0 + dy])
+
+    points = np.column_stack([np.concatenate(leaves_x), np.concatenate(leaves_y)])
+    # Las esquinas compartidas se unifican redondeando a una fracción de la celda mínima
+    scale = np.array([dx, dy]) / 4
+    _, index = np.unique(np.round(points / scale).astype(np.int64), axis=0, return_index=True)
+    points = points[index]
+    return points[:, 0], points[:, 1]
+
+
+def setup_style(style=None):
+    """
+    Configura el estilo de las gráficas
+    """
+    style = {**DEFAULT_STYLE, **(style or {})}
+    plt.style.use(style['style'])
+    sns.set_palette(style['palette'])
+
+
+@spec_parameters
+class DroneVisualization:
+    def __init__(self, c_A=None, c_B=None, c_C=None, autonomy=None,
+                 priority_ratio=None, balance_ratio=None, style=None, spec=None):
+        setup_style(style)
+        # Parámetros del escenario: spec, con los argumentos dados sustituidos
+        self.spec = resolve_spec(
+            spec, c_A=c_A, c_B=c_B, c_C=c_C, autonomy=autonomy,
+            priority_ratio=priority_ratio, balance_ratio=balance_ratio)
+
+    @property
+    def w_per_s(self):
+        """
+        w = (b·c_A/c_B)·s, de la restricción de equilibrio energético
+        """
+        return self.spec.w_per_s
+        
+    def objective_function(self, s, w, j):
+        return self.c_A * s + self.c_B * w + self.c_C * j
+
+    def optimal_solution(self):
+        """
+        Solución óptima (s, w, j) del escenario con el solver analítico
+        """
+        result = solve_batch(self.c_A, self.c_B, self.c_C, self.autonomy,
+                             self.priority_ratio, self.balance_ratio)
+        return float(result.s), float(result.w), float(result.j)
+
+    @staticmethod
+    def _finish(fig, show):
+        fig.tight_layout()
+        if show:
+            plt.show()
+        return fig
+    
+    def plot_3d_surface(self, show=True):
+        """
+        Gráfica 3D de la función objetivo y restricciones
+        """
+        fig = plt.figure(figsize=(15, 5))
+        
+        # Solución óptima
+        s_opt, w_opt, j_opt = self.optimal_solution()
+        
+        # Subplot 1: Superficie de la función objetivo
+        ax1 = fig.add_subplot(131, projection='3d')
+        
+        # Crear malla para la superficie
+        s_range = np.linspace(0, 10, 50)
+        j_range = np.linspace(0, 5, 50)
+        S, J = np.meshgrid(s_range, j_range)
+        
+        # Calcular w con la restricción de equilibrio w = (b·c_A/c_B)·s
+        W = self.w_per_s * S
+        
+        # Función objetivo
+        Z = self.objective_function(S, W, J)
+        
+        # Superficie
+        surf = ax1.plot_surface(S, J, Z, alpha=0.7, cmap='viridis')
+        
+        # Punto óptimo
+        z_opt = self.objective_function(s_opt, w_opt, j_opt)
+        ax1.scatter([s_opt], [j_opt], [z_opt], color='red', s=100, label='Óptimo')
+        
+        ax1.set_xlabel('s (km) - Zona A')
+        ax1.set_ylabel('j (km) - Zona C')
+        ax1.set_zlabel('Consumo Energético')
+        ax1.set_title('Superficie de la Función Objetivo')
+        ax1.legend()
+        
+        # Subplot 2: Restricciones en el plano s-j
+        ax2 = fig.add_subplot(132)
+        
+        # Restricción de prioridad s = p·j
+        j_line = np.linspace(0, 8, 100)
+        s_line = self.priority_ratio * j_line
+        ax2.plot(j_line, s_line, 'b-', linewidth=2, label=f's = {self.priority_ratio:g}j')
+        
+        # Restricción de autonomía proyectada
+        # s + w + j = autonomy, con w = (b·c_A/c_B)·s
+        # (1 + b·c_A/c_B)·s + j = autonomy
+        j_autonomy = np.linspace(0, self.autonomy, 100)
+        s_autonomy = (self.autonomy - j_autonomy) / (1 + self.w_per_s)
+        ax2.plot(j_autonomy, s_autonomy, 'g--', linewidth=2, label='Restricción de autonomía')
+        
+        # Punto óptimo
+        ax2.plot(j_opt, s_opt, 'ro', markersize=10, label=f'Óptimo ({j_opt:.2f}, {s_opt:.2f})')
+        
+        ax2.set_xlabel('j (km) - Zona C')
+        ax2.set_ylabel('s (km) - Zona A')
+        ax2.set_title('Restricciones en el Plano s-j')
+        ax2.grid(True, alpha=0.3)
+        ax2.legend()
+        ax2.set_xlim(0, 8)
+        ax2.set_ylim(0, 12)
+        
+        # Subplot 3: Distribución de distancias
+        ax3 = fig.add_subplot(133)
+        
+        zones = ['Zona A\n(Plano)', 'Zona B\n(Urbano)', 'Zona C\n(Montañoso)']
+        distances = [s_opt, w_opt, j_opt]
+        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+        
+        bars = ax3.bar(zones, distances, color=colors, alpha=0.8, edgecolor='black')
+        ax3.set_ylabel('Distancia (km)')
+        ax3.set_title('Distribución Óptima de Distancias')
+        ax3.grid(True, alpha=0.3, axis='y')
+        
+        # Añadir valores en las barras
+        for bar, dist in zip(bars, distances):
+            height = bar.get_height()
+            ax3.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                    f'{dist:.2f} km', ha='center', va='bottom', fontweight='bold')
+        
+        return self._finish(fig, show)
+        
+    def plot_contour_analysis(self, show=True):
+        """
+        Análisis de contornos y gradientes
+        """
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        
+        # Solución óptima
+        s_opt, w_opt, j_opt = self.optimal_solution()
+        
+        # Crear malla
+        s_range = np.linspace(0, 12, 100)
+        j_range = np.linspace(0, 6, 100)
+        S, J = np.meshgrid(s_range, j_range)
+        
+        # Subplot 1: Contornos de la función objetivo
+        W = self.w_per_s * S  # Restricción de equilibrio w = (b·c_A/c_B)·s
+        Z = self.objective_function(S, W, J)
+        
+        contour1 = ax1.contour(S, J, Z, levels=20, colors='blue', alpha=0.6)
+        ax1.clabel(contour1, inline=True, fontsize=8)
+        
+        # Restricción de prioridad s = p·j
+        j_line = np.linspace(0, 6, 100)
+        s_line = self.priority_ratio * j_line
+        ax1.plot(s_line, j_line, 'r-', linewidth=3, label=f's = {self.priority_ratio:g}j')
+        
+        # Punto óptimo
+        ax1.plot(s_opt, j_opt, 'ro', markersize=12, label=f'Óptimo')
+        
+        ax1.set_xlabel('s (km) - Zona A')
+        ax1.set_ylabel('j (km) - Zona C')
+        ax1.set_title('Contornos de la Función Objetivo')
+        ax1.legend()
+        ax1.grid(True, alpha=0.3)
+        
+        # Subplot 2: Región factible
+        # Crear región factible considerando todas las restricciones
+        s_feas = np.linspace(0, 10, 1000)
+        j_feas = s_feas / self.priority_ratio  # De s = p·j
+        w_feas = self.w_per_s * s_feas  # De w = (b·c_A/c_B)·s
+        
+        # Filtrar por restricción de autonomía
+        total_dist = s_feas + w_feas + j_feas
+        feasible_mask = total_dist <= self.autonomy
+        
+        s_feasible = s_feas[feasible_mask]
+        j_feasible = j_feas[feasible_mask]
+        
+        ax2.fill_between(s_feasible, 0, j_feasible, alpha=0.3, color='green', label='Región Factible')
+        ax2.plot(s_feasible, j_feasible, 'g-', linewidth=2, label='Frontera Factible')
+        ax2.plot(s_opt, j_opt, 'ro', markersize=12, label='Óptimo')
+        
+        ax2.set_xlabel('s (km) - Zona A')
+        ax2.set_ylabel('j (km) - Zona C')
+        ax2.set_title('Región Factible del Problema')
+        ax2.legend()
+        ax2.grid(True, alpha=0.3)
+        
+        # Subplot 3: Análisis de sensibilidad
+        # Variar el límite de autonomía
+        autonomy_limits = np.linspace(10, 20, 50)
+        optimal_energies = solve_batch(self.c_A, self.c_B, self.c_C, autonomy_limits,
+                                       self.priority_ratio, self.balance_ratio).energy
+        
+        ax3.plot(autonomy_limits, optimal_energies, 'b-', linewidth=2)
+        ax3.axvline(x=self.autonomy, color='r', linestyle='--', label=f'Límite actual ({self.autonomy:g} km)')
+        ax3.axhline(y=self.objective_function(s_opt, w_opt, j_opt), color='r', linestyle='--', alpha=0.5)
+        
+        ax3.set_xlabel('Límite de Autonomía (km)')
+        ax3.set_ylabel('Consumo Energético Óptimo')
+        ax3.set_title('Análisis de Sensibilidad - Autonomía')
+        ax3.legend()
+        ax3.grid(True, alpha=0.3)
+        
+        # Subplot 4: Comparación de consumos por zona
+        zones = ['Zona A', 'Zona B', 'Zona C']
+        distances = [s_opt, w_opt, j_opt]
+        unit_costs = [self.c_A, self.c_B, self.c_C]
+        total_costs = [d * c for d, c in zip(distances, unit_costs)]
+        
+        x = np.arange(len(zones))
+        width = 0.35
+        
+        bars1 = ax4.bar(x - width/2, distances, width, label='Distancia (km)', alpha=0.8)
+        bars2 = ax4.bar(x + width/2, total_costs, width, label='Consumo Energético', alpha=0.8)
+        
+        ax4.set_xlabel('Zonas')
+        ax4.set_ylabel('Valores')
+        ax4.set_title('Comparación: Distancias vs Consumos')
+        ax4.set_xticks(x)
+        ax4.set_xticklabels(zones)
+        ax4.legend()
+        ax4.grid(True, alpha=0.3, axis='y')
+        
+        # Añadir valores en las barras
+        for bars in [bars1, bars2]:
+            for bar in bars:
+                height = bar.get_height()
+                ax4.text(bar.get_x() + bar.get_width()/2., height + 0.05,
+                        f'{height:.2f}', ha='center', va='bottom', fontsize=9)
+        
+        return self._finish(fig, show)
+        
+    def plot_optimization_summary(self, show=True):
+        """
+        Resumen visual de la optimización
+        """
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        
+        # Solución óptima
+        s_opt, w_opt, j_opt = self.optimal_solution()
+        total_energy = self.objective_function(s_opt, w_opt, j_opt)
+        
+        # Subplot 1: Diagrama de barras con desglose
+        categories = ['Distancia\n(km)', 'Costo Unitario\n(energía/km)', 'Costo Total\n(energía)']
+        zona_a = [s_opt, self.c_A, s_opt * self.c_A]
+        zona_b = [w_opt, self.c_B, w_opt * self.c_B]
+        zona_c = [j_opt, self.c_C, j_opt * self.c_C]
+        
+        x = np.arange(len(categories))
+        width = 0.25
+        
+        ax1.bar(x - width, zona_a, width, label='Zona A (Plano)', color='#FF6B6B', alpha=0.8)
+        ax1.bar(x, zona_b, width, label='Zona B (Urbano)', color='#4ECDC4', alpha=0.8)
+        ax1.bar(x + width, zona_c, width, label='Zona C (Montañoso)', color='#45B7D1', alpha=0.8)
+        
+        ax1.set_ylabel('Valores')
+        ax1.set_title('Desglose de la Solución Óptima')
+        ax1.set_xticks(x)
+        ax1.set_xticklabels(categories)
+        ax1.legend()
+        ax1.grid(True, alpha=0.3, axis='y')
+        
+        # Subplot 2: Gráfico de pastel - Distribución de distancias
+        sizes = [s_opt, w_opt, j_opt]
+        labels = [f'Zona A\n{s_opt:.2f} km', f'Zona B\n{w_opt:.2f} km', f'Zona C\n{j_opt:.2f} km']
+        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+        
+        wedges, texts, autotexts = ax2.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
+                                          startangle=90, textprops={'fontsize': 10})
+        ax2.set_title('Distribución de Distancias por Zona')
+        
+        # Subplot 3: Gráfico de pastel - Distribución de consumo energético
+        energy_sizes = [s_opt * self.c_A, w_opt * self.c_B, j_opt * self.c_C]
+        energy_labels = [f'Zona A\n{energy_sizes[0]:.2f}', f'Zona B\n{energy_sizes[1]:.2f}', f'Zona C\n{energy_sizes[2]:.2f}']
+        
+        wedges2, texts2, autotexts2 = ax3.pie(energy_sizes, labels=energy_labels, colors=colors, 
+                                             autopct='%1.1f%%', startangle=90, textprops={'fontsize': 10})
+        ax3.set_title('Distribución de Consumo Energético')
+        
+        # Subplot 4: Métricas clave
+        ax4.axis('off')
+        
+        # Crear tabla de métricas
+        metrics_data = [
+            ['Métrica', 'Valor', 'Unidad'],
+            ['Distancia Zona A', f'{s_opt:.3f}', 'km'],
+            ['Distancia Zona B', f'{w_opt:.3f}', 'km'],
+            ['Distancia Zona C', f'{j_opt:.3f}', 'km'],
+            ['Distancia Total', f'{s_opt + w_opt + j_opt:.3f}', 'km'],
+            ['Consumo Total', f'{total_energy:.3f}', 'unidades'],
+            ['Eficiencia', f'{total_energy/(s_opt + w_opt + j_opt):.3f}', 'energía/km']
+        ]
+        
+        table = ax4.table(cellText=metrics_data[1:], colLabels=metrics_data[0],
+                         cellLoc='center', loc='center', bbox=[0, 0, 1, 1])
+        table.auto_set_font_size(False)
+        table.set_fontsize(11)
+        table.scale(1, 2)
+        
+        # Colorear encabezados
+        for i in range(3):
+            table[(0, i)].set_facecolor('#E8E8E8')
+            table[(0, i)].set_text_props(weight='bold')
+        
+        ax4.set_title('Métricas de la Solución Óptima', pad=20, fontsize=14, fontweight='bold')
+        
+        return self._finish(fig, show)
+
+    def plot_density(self, x, y, values=None, statistic='count', bins=256, extent=None,
+                     labels=('x', 'y'), title=None, log=None, ax=None, show=True):
+        """
+        Mapa de densidad (o de un estadístico de values) para millones de puntos
+
+        Los puntos se agregan con density_grid() y se dibuja una sola imagen;
+        log=None usa escala logarítmica para los conteos.
+        """
+        from matplotlib.colors import LogNorm
+
+        grid, extent = density_grid(x, y, values, bins, extent, statistic)
+        if ax is None:
+            fig, ax = plt.subplots(figsize=(8, 6))
+        else:
+            fig = ax.figure
+
+        if log is None:
+            log = statistic == 'count'
+        if log:
+            grid = np.where(grid > 0, grid, np.nan)
+            finite = grid[np.isfinite(grid)]
+            norm = LogNorm(vmin=finite.min(), vmax=finite.max()) if finite.size else None
+        else:
+            norm = None
+
+        image = ax.imshow(grid, origin='lower', aspect='auto', extent=extent,
+                          interpolation='nearest', cmap='viridis', norm=norm)
+        colorbar_label = 'Escenarios' if statistic == 'count' else f'{statistic}'
+        fig.colorbar(image, ax=ax, label=colorbar_label)
+        ax.grid(False)
+        ax.set_xlabel(labels[0])
+        ax.set_ylabel(labels[1])
+        ax.set_title(title or f'Densidad de {np.asarray(x).size:,} escenarios')
+        return self._finish(fig, show)
+
+    def plot_sweep_density(self, result, x='autonomy', y='c_A', value='energy',
+                           statistic='mean', bins=256, show=True):
+        """
+        Resultados de run_sweep() agregados en dos paneles: escenarios por celda
+        y estadístico de value (solo escenarios factibles)
+        """
+        feasible = np.asarray(result['feasible'], dtype=bool)
+        xs, ys = np.asarray(result[x])[feasible], np.asarray(result[y])[feasible]
+        extent = (float(xs.min()), float(xs.max()), float(ys.min()), float(ys.max()))
+
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        self.plot_density(xs, ys, bins=bins, extent=extent, labels=(x, y),
+                          title=f'Escenarios factibles ({xs.size:,})', ax=ax1, show=False)
+        self.plot_density(xs, ys, np.asarray(result[value])[feasible], statistic, bins, extent,
+                          labels=(x, y), title=f'{value} ({statistic}) por celda', ax=ax2, show=False)
+        return self._finish(fig, show)
+
+    def refinement_mask(self, s0, j0, s1, j1):
+        """
+        Celdas del plano s-j que cortan la frontera de autonomía o la recta
+        s = p·j, o que contienen el óptimo (criterio de adaptive_mesh)
+        """
+        s_opt, _, j_opt = self.optimal_solution()
+        corners = [(s0, j0), (s1, j0), (s0, j1), (s1, j1)]
+        autonomy = np.stack([(1 + self.w_per_s) * s + j - self.autonomy for s, j in corners])
+        priority = np.stack([s - self.priority_ratio * j for s, j in corners])
+        crosses = lambda g: (g.min(axis=0) <= 0) & (g.max(axis=0) >= 0)
+        optimum = (s0 <= s_opt) & (s_opt <= s1) & (j0 <= j_opt) & (j_opt <= j1)
+        return crosses(autonomy) | crosses(priority) | optimum
+
+    def plot_adaptive_contour(self, base=16, depth=5, extent=(0, 12, 0, 6), show=True):
+        """
+        Contornos de la función objetivo sobre una malla adaptativa, más fina
+        cerca del óptimo y de las fronteras de factibilidad
+        """
+        import matplotlib.tri as mtri
+
+        s, j = adaptive_mesh(self.refinement_mask, extent, base, depth)
+        energy = self.objective_function(s, self.w_per_s * s, j)
+        s_opt, _, j_opt = self.optimal_solution()
+        triangulation = mtri.Triangulation(s, j)
+
+        fig, ax = plt.subplots(figsize=(10, 7))
+        filled = ax.tricontourf(triangulation, energy, levels=20, cmap='viridis', alpha=0.85)
+        fig.colorbar(filled, ax=ax, label='Consumo Energético')
+        ax.triplot(triangulation, color='white', linewidth=0.2, alpha=0.4)
+
+        j_line = np.array([extent[2], extent[3]])
+        ax.plot(self.priority_ratio * j_line, j_line, 'r-', linewidth=2,
+                label=f's = {self.priority_ratio:g}j')
+        ax.plot((self.autonomy - j_line) / (1 + self.w_per_s), j_line, 'w--', linewidth=2,
+                label='Restricción de autonomía')
+        ax.plot(s_opt, j_opt, 'ro', markersize=10, label='Óptimo')
+
+        ax.set_xlim(extent[0], extent[1])
+        ax.set_ylim(extent[2], extent[3])
+        ax.set_xlabel('s (km) - Zona A')
+        ax.set_ylabel('j (km) - Zona C')
+        ax.grid(False)
+        ax.set_title(f'Malla Adaptativa ({s.size:,} vértices)')
+        ax.legend()
+        return self._finish(fig, show)
+
+    def plot_pareto_front(self, front, candidates=None, max_points=20_000, show=True):
+        """
+        Frente de Pareto energía-cobertura-tiempo (ver pareto.ParetoAnalysis)
+
+        Panel 3D del frente coloreado por la razón de prioridad y proyecciones
+        energía-cobertura y tiempo-cobertura; los candidatos dominados se
+        muestran como densidad en gris. Se dibujan como máximo max_points puntos
+        del frente (submuestreo uniforme).
+        """
+        step = max(1, front.energy.size // max_points)
+        energy, coverage = front.energy[::step], front.coverage[::step]
+        minutes, priority = front.time[::step] * 60, front.priority_ratio[::step]
+
+        fig = plt.figure(figsize=(18, 6))
+        ax1 = fig.add_subplot(131, projection='3d')
+        points = ax1.scatter(energy, coverage, minutes, c=priority, cmap='viridis', s=6)
+        fig.colorbar(points, ax=ax1, shrink=0.6, label='Razón de prioridad p')
+        ax1.set_xlabel('Energía')
+        ax1.set_ylabel('Cobertura')
+        ax1.set_zlabel('Tiempo (min)')
+        ax1.set_title(f'Frente de Pareto ({front.energy.size:,} puntos)')
+
+        for ax, x, xlabel in ((fig.add_subplot(132), energy, 'Energía'),
+                              (fig.add_subplot(133), minutes, 'Tiempo de vuelo (min)')):
+            if candidates is not None:
+                x_all = candidates.energy if xlabel == 'Energía' else candidates.time * 60
+                grid, extent = density_grid(x_all, candidates.coverage, bins=200)
+                ax.imshow(np.where(grid > 0, 1.0, np.nan), origin='lower', aspect='auto',
+                          extent=extent, cmap='Greys', vmin=0, vmax=3, interpolation='nearest')
+            ax.scatter(x, coverage, c=priority, cmap='viridis', s=4)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel('Cobertura ponderada')
+            ax.set_title(f'Cobertura vs {xlabel.split(" (")[0]}')
+            ax.grid(True, alpha=0.3)
+
+        return self._finish(fig, show)
+
+    def interactive_explorer(self, resolution=400, ranges=None, show=True):
+        """
+        Explorador de sensibilidad con deslizadores (ver SensitivityExplorer)
+        """
+        explorer = SensitivityExplorer(self, resolution, ranges)
+        if show:
+            plt.show()
+        return explorer
+
+
+class SensitivityExplorer:
+    """
+    Explorador interactivo con deslizadores para costos, autonomía y razones
+
+    La figura se construye una sola vez. Al mover un deslizador solo se
+    actualizan los datos de los artistas (set_data, set_height) y se redibujan
+    con blitting sobre el fondo guardado de cada eje: los tres gráficos y el
+    deslizador que cambió, no los demás. Las mallas se calculan al crear el
+    explorador y la energía se recalcula en buffers preasignados. Las
+    soluciones vienen de solve_batch (una llamada por cuadro).
+    """
+
+    def __init__(self, visualization, resolution=400, ranges=None, n_autonomy=200):
+        self.params = {
+            'c_A': visualization.c_A, 'c_B': visualization.c_B, 'c_C': visualization.c_C,
+            'autonomy': visualization.autonomy,
+            'priority_ratio': visualization.priority_ratio,
+            'balance_ratio': visualization.balance_ratio,
+        }
+        self.ranges = {**EXPLORER_RANGES, **(ranges or {})}
+        autonomy_max = self.ranges['autonomy'][2]
+
+        # Mallas y buffers: se reutilizan en cada cuadro
+        self.s_max, self.j_max = 0.8 * autonomy_max, 0.4 * autonomy_max
+        self.S, self.J = np.meshgrid(np.linspace(0, self.s_max, resolution),
+                                     np.linspace(0, self.j_max, resolution))
+        self._energy = np.empty_like(self.S)
+        self._distance = np.empty_like(self.S)
+        self._infeasible = np.empty(self.S.shape, dtype=bool)
+        self._index = np.empty(self.S.shape, dtype=np.intp)
+        self._rgba = np.zeros(self.S.shape + (4,), dtype=np.uint8)
+
+        # Paleta como tabla RGBA; la última fila es el gris de la región no factible
+        colors = plt.get_cmap('viridis')(np.linspace(0, 1, 256))
+        self._lut = (np.vstack([colors, [[0.87, 0.87, 0.87, 1.0]]]) * 255).astype(np.uint8)
+        self._j_line = np.array([0.0, self.j_max])
+        self.autonomy_grid = np.linspace(self.ranges['autonomy'][1], autonomy_max, n_autonomy)
+        self._autonomy_query = np.empty(n_autonomy + 1)
+        self._autonomy_query[:-1] = self.autonomy_grid
+
+        self._build_figure()
+        self.update()
+
+    def _build_figure(self):
+        self.figure = fig = plt.figure(figsize=(15, 8))
+        grid = fig.add_gridspec(2, 3, height_ratios=(3, 1.2), hspace=0.35, wspace=0.3)
+        ax_map = fig.add_subplot(grid[0, 0])
+        ax_bars = fig.add_subplot(grid[0, 1])
+        ax_sens = fig.add_subplot(grid[0, 2])
+        autonomy_max = self.ranges['autonomy'][2]
+        cost_max = max(self.ranges[name][2] for name in ('c_A', 'c_B', 'c_C'))
+
+        # Mapa de energía en el plano s-j con w = (b·c_A/c_B)·s (región no factible en gris);
+        # los colores se calculan con la tabla RGBA para no normalizar en cada cuadro
+        self.image = ax_map.imshow(self._rgba, origin='lower', aspect='auto',
+                                   extent=(0, self.s_max, 0, self.j_max), interpolation='none')
+        self.priority_line, = ax_map.plot([], [], 'r-', linewidth=2, label='s = p·j')
+        self.autonomy_line, = ax_map.plot([], [], 'w--', linewidth=2, label='Autonomía')
+        self.optimum_marker, = ax_map.plot([], [], 'ro', markersize=10, label='Óptimo')
+        ax_map.set_xlim(0, self.s_max)
+        ax_map.set_ylim(0, self.j_max)
+        ax_map.set_xlabel('s (km) - Zona A')
+        ax_map.set_ylabel('j (km) - Zona C')
+        ax_map.set_title('Energía y Región Factible')
+        ax_map.legend(loc='upper right', fontsize=8)
+
+        # Distancias óptimas por zona
+        zones = ['Zona A', 'Zona B', 'Zona C']
+        self.bars = ax_bars.bar(zones, [0, 0, 0], color=['#FF6B6B', '#4ECDC4', '#45B7D1'],
+                                alpha=0.8, edgecolor='black')
+        # Recortadas al eje: el blit solo restaura el área de cada eje
+        self.bar_labels = [ax_bars.text(bar.get_x() + bar.get_width()/2., 0, '', ha='center',
+                                        va='bottom', fontweight='bold', clip_on=True)
+                           for bar in self.bars]
+        ax_bars.set_ylim(0, autonomy_max)
+        ax_bars.set_ylabel('Distancia (km)')
+        ax_bars.set_title('Distribución Óptima de Distancias')
+        ax_bars.grid(True, alpha=0.3, axis='y')
+        self.summary_text = ax_bars.text(0.02, 0.97, '', transform=ax_bars.transAxes,
+                                         va='top', fontsize=9)
+
+        # Energía óptima frente a la autonomía
+        self.sensitivity_line, = ax_sens.plot(self.autonomy_grid, np.zeros_like(self.autonomy_grid),
+                                              'b-', linewidth=2)
+        self.sensitivity_marker, = ax_sens.plot([], [], 'ro', markersize=8)
+        ax_sens.set_xlim(self.autonomy_grid[0], self.autonomy_grid[-1])
+        ax_sens.set_ylim(0, cost_max * autonomy_max)
+        ax_sens.set_xlabel('Límite de Autonomía (km)')
+        ax_sens.set_ylabel('Consumo Energético Óptimo')
+        ax_sens.set_title('Sensibilidad - Autonomía')
+        ax_sens.grid(True, alpha=0.3)
+
+        # Artistas animados de cada eje de gráficos
+        self.plot_artists = {
+            ax_map: [self.image, self.priority_line, self.autonomy_line, self.optimum_marker],
+            ax_bars: [*self.bars, *self.bar_labels, self.summary_text],
+            ax_sens: [self.sensitivity_line, self.sensitivity_marker],
+        }
+
+        # Deslizadores: sin redibujo propio; la barra, el asa y el valor se
+        # dibujan en el blit, pero solo los del deslizador que cambió
+        slider_grid = grid[1, :].subgridspec(len(self.ranges), 1, hspace=0.6)
+        self.sliders = {}
+        self.slider_artists = {}
+        for k, (name, (label, low, high)) in enumerate(self.ranges.items()):
+            ax = fig.add_subplot(slider_grid[k])
+            slider = Slider(ax, label, low, high, valinit=self.params[name], valfmt='%.2f')
+            slider.drawon = False
+            slider.on_changed(lambda value, name=name: self.update(**{name: value}))
+            self.sliders[name] = slider
+            self.slider_artists[name] = (ax, [slider.poly, slider.valtext, *ax.lines])
+
+        for artists in [*self.plot_artists.values(), *(a for _, a in self.slider_artists.values())]:
+            for artist in artists:
+                artist.set_animated(True)
+        self._backgrounds = None
+        fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        # Tras un redibujo completo (p. ej. al cambiar el tamaño) se guarda el
+        # fondo de cada eje y se dibujan todos los artistas animados
+        canvas = self.figure.canvas
+        axes = [*self.plot_artists.items(), *self.slider_artists.values()]
+        self._backgrounds = {ax: canvas.copy_from_bbox(self._blit_bbox(ax)) for ax, _ in axes}
+        for _, artists in axes:
+            for artist in artists:
+                self.figure.draw_artist(artist)
+
+    def update(self, **params):
+        """
+        Actualiza los parámetros indicados y redibuja solo los artistas animados
+        """
+        self.params.update(params)
+        p = self.params
+        for name, value in params.items():
+            # Sincroniza los deslizadores sin volver a disparar update()
+            slider = self.sliders[name]
+            if slider.val != value:
+                slider.eventson = False
+                slider.set_val(value)
+                slider.eventson = True
+        c_A, c_B, c_C, autonomy = p['c_A'], p['c_B'], p['c_C'], p['autonomy']
+        w_per_s = p['balance_ratio'] * c_A / c_B
+
+        # Una sola llamada al solver: curva de sensibilidad + escenario actual
+        self._autonomy_query[-1] = autonomy
+        result = solve_batch(c_A, c_B, c_C, self._autonomy_query, p['priority_ratio'], p['balance_ratio'])
+        s_opt, w_opt, j_opt = (float(v[-1]) for v in (result.s, result.w, result.j))
+        energy_opt = float(result.energy[-1])
+
+        # Energía c_A·s + c_B·w + c_C·j con w = w_per_s·s, en los buffers de la malla
+        np.multiply(self.S, c_A + c_B * w_per_s, out=self._energy)
+        self._energy += c_C * self.J
+        np.multiply(self.S, 1 + w_per_s, out=self._distance)
+        self._distance += self.J
+        np.greater(self._distance, autonomy, out=self._infeasible)
+        # Escala de color de 0 a la energía óptima
+        self._energy *= 255 / max(energy_opt, 1e-9)
+        np.clip(self._energy, 0, 255, out=self._energy)
+        self._index[...] = self._energy
+        self._index[self._infeasible] = 256
+        np.take(self._lut, self._index, axis=0, out=self._rgba)
+        self.image.set_data(self._rgba)
+
+        self.priority_line.set_data(p['priority_ratio'] * self._j_line, self._j_line)
+        self.autonomy_line.set_data((autonomy - self._j_line) / (1 + w_per_s), self._j_line)
+        self.optimum_marker.set_data([s_opt], [j_opt])
+
+        for bar, label, value in zip(self.bars, self.bar_labels, (s_opt, w_opt, j_opt)):
+            bar.set_height(value)
+            label.set_y(value + 0.1)
+            label.set_text(f'{value:.2f} km')
+        self.summary_text.set_text(f'Energía: {energy_opt:.3f} | Distancia: {s_opt + w_opt + j_opt:.2f} km')
+
+        self.sensitivity_line.set_ydata(result.energy[:-1])
+        self.sensitivity_marker.set_data([autonomy], [energy_opt])
+
+        self._blit(params)
+        return s_opt, w_opt, j_opt, energy_opt
+
+    def _blit(self, changed):
+        """
+        Redibuja los gráficos y los deslizadores de los parámetros en changed
+        """
+        canvas = self.figure.canvas
+        if self._backgrounds is None:
+            canvas.draw_idle()
+            return
+        axes = [*self.plot_artists.items(), *(self.slider_artists[name] for name in changed)]
+        for ax, artists in axes:
+            canvas.restore_region(self._backgrounds[ax])
+            for artist in artists:
+                self.figure.draw_artist(artist)
+            canvas.blit(self._blit_bbox(ax))
+
+    def _blit_bbox(self, ax):
+        # Los deslizadores ocupan toda la fila (el valor se escribe a la derecha
+        # del eje), hasta la mitad del espacio libre con las filas vecinas
+        if ax in self.plot_artists:
+            return ax.bbox
+        pad = 0.3 * ax.bbox.height
+        return Bbox.from_extents(self.figure.bbox.x0, ax.bbox.y0 - pad,
+                                 self.figure.bbox.x1, ax.bbox.y1 + pad)
+
+    def benchmark(self, frames=200):
+        """
+        Cuadros por segundo al recorrer la autonomía (útil también sin pantalla)
+        """
+        if self._backgrounds is None:
+            self.figure.canvas.draw()
+        values = np.linspace(*self.ranges['autonomy'][1:], frames)
+        start = time.perf_counter()
+        for value in values:
+            self.sliders['autonomy'].set_val(value)
+        return frames / (time.perf_counter() - start)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='drone-optimization plot',
+                                     description='Genera las visualizaciones del escenario base')
+    parser.add_argument('--explore', action='store_true',
+                        help='abre solo el explorador interactivo de sensibilidad')
+    parser.add_argument('--resolution', type=int, default=400,
+                        help='resolución de la malla del explorador')
+    parser.add_argument('--sweep', help='resultados de un barrido (.npz de SweepResult.save)')
+    parser.add_argument('--x', default='autonomy', help='columna del eje x (con --sweep)')
+    parser.add_argument('--y', default='c_A', help='columna del eje y (con --sweep)')
+    parser.add_argument('--value', default='energy', help='columna agregada (con --sweep)')
+    parser.add_argument('--bins', type=int, default=256)
+    args = parser.parse_args(argv)
+
+    visualizer = DroneVisualization()
+    if args.explore:
+        print("EXPLORADOR INTERACTIVO DE SENSIBILIDAD")
+        print("="*50)
+        visualizer.interactive_explorer(args.resolution)
+        return
+
+    if args.sweep:
+        from .sweep import SweepResult
+
+        print("DENSIDAD DE RESULTADOS DEL BARRIDO")
+        print("="*50)
+        result = SweepResult.load(args.sweep)
+        print(f"Escenarios: {len(result):,}")
+        visualizer.plot_sweep_density(result, args.x, args.y, args.value, bins=args.bins)
+        return
+
+    # Crear visualizaciones
+    print("GENERANDO VISUALIZACIONES...")
+    print("="*50)
+
+    print("\n1. Generando gráficas 3D y análisis de superficie...")
+    visualizer.plot_3d_surface()
+
+    print("\n2. Generando análisis de contornos y sensibilidad...")
+    visualizer.plot_contour_analysis()
+
+    print("\n3. Generando resumen de optimización...")
+    visualizer.plot_optimization_summary()
+
+    print("\n4. Generando contornos sobre malla adaptativa...")
+    visualizer.plot_adaptive_contour()
+
+    print("\n5. Generando frente de Pareto (energía, cobertura, tiempo)...")
+    from .pareto import ParetoAnalysis
+    analysis = ParetoAnalysis()
+    candidates = analysis.candidates()
+    visualizer.plot_pareto_front(analysis.front(candidates), candidates)
+
+    print("\n¡Visualizaciones completadas!")
+
+
+if __name__ == '__main__':
+    main()
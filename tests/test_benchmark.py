@@ -0,0 +1,15 @@
+"""
+Benchmark: errores frente a la referencia de cada método
+"""
+from drone_optimization.benchmark import run_benchmarks
+
+
+def test_errors_use_each_method_reference():
+    results = run_benchmarks(batch_sizes=(5,), zone_counts=(3,),
+                             methods=('closed_form', 'kkt_compiled', 'slsqp', 'lp_highs'),
+                             repeat=1)
+    records = {r['method']: r for r in results['results'] if r['n_zones'] == 3 and r['batch_size'] == 5}
+    assert records['slsqp']['error_kind'] == 'max_abs_error_vs_inequality_optimum'
+    assert records['lp_highs']['error_kind'] == 'max_abs_error_vs_closed_form'
+    for record in records.values():
+        assert record['error'] < 1e-6
@@ -0,0 +1,37 @@
+"""
+Copias de los valores en caché y versión de las claves
+"""
+import numpy as np
+
+from drone_optimization import cache as cache_module
+from drone_optimization.cache import SolutionCache, canonical_key
+from drone_optimization.optimization_solver import DroneOptimization
+
+
+def test_hits_return_copies():
+    cache = SolutionCache()
+    optimizer = DroneOptimization(cache=cache)
+    first = optimizer.solve_optimization()
+    expected = first.x.copy()
+    first.x[:] = 99.0
+    second = optimizer.solve_optimization()
+    assert cache.hits == 1
+    np.testing.assert_array_equal(second.x, expected)
+    second.x[:] = -1.0
+    np.testing.assert_array_equal(optimizer.solve_optimization().x, expected)
+
+
+def test_disk_level_survives_new_instance(tmp_path):
+    path = tmp_path / 'solutions.db'
+    key = canonical_key('test', autonomy=15)
+    SolutionCache(path=str(path)).set(key, np.arange(3.0))
+    other = SolutionCache(path=str(path))
+    np.testing.assert_array_equal(other.get(key), np.arange(3.0))
+    assert other.disk_hits == 1
+
+
+def test_key_normalizes_numbers_and_includes_version(monkeypatch):
+    key = canonical_key('slsqp', autonomy=15)
+    assert key == canonical_key('slsqp', autonomy=np.float64(15.0))
+    monkeypatch.setattr(cache_module, 'CACHE_VERSION', cache_module.CACHE_VERSION + 1)
+    assert canonical_key('slsqp', autonomy=15) != key
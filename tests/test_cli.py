@@ -0,0 +1,30 @@
+"""
+Subcomandos de la línea de comandos
+"""
+import pytest
+
+from drone_optimization import cli
+
+
+def test_extra_arguments_are_rejected(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(['solve', '--unknown'])
+    assert excinfo.value.code == 2
+    assert 'unrecognized arguments' in capsys.readouterr().err
+
+
+def test_unknown_command_is_rejected():
+    with pytest.raises(SystemExit):
+        cli.main(['nope'])
+
+
+def test_arguments_reach_subcommand(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(['bench', '--help'])
+    assert excinfo.value.code == 0
+    assert 'drone-optimization bench' in capsys.readouterr().out
+
+
+def test_codegen_check_through_cli(capsys):
+    assert cli.main(['codegen', '--check']) == 0
+    assert 'vigente' in capsys.readouterr().out
@@ -0,0 +1,22 @@
+"""
+Módulo generado: vigente respecto a MODEL y utilizable sin SymPy
+"""
+import subprocess
+import sys
+
+from drone_optimization import codegen
+
+
+def test_bundled_module_is_current(capsys):
+    assert codegen.main(['--check']) == 0
+    assert 'vigente' in capsys.readouterr().out
+
+
+def test_kkt_batch_does_not_import_sympy():
+    code = ('import sys\n'
+            'import drone_optimization.benchmark\n'
+            'from drone_optimization.lagrange_analysis import LagrangeAnalysis, solve_kkt_batch\n'
+            'solve_kkt_batch(1.2, 0.9, 1.5, 15.0)\n'
+            'LagrangeAnalysis().solve_kkt_numeric()\n'
+            'assert "sympy" not in sys.modules\n')
+    subprocess.run([sys.executable, '-c', code], check=True)
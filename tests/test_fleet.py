@@ -0,0 +1,72 @@
+"""
+Asignación de flota: descomposición, paralelo y MILP frente al modelo completo
+"""
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.optimize import linprog
+
+from drone_optimization.fleet import FleetModel
+
+
+def full_lp(model):
+    # Modelo sin descomponer, con una variable por par elegible
+    n = model.drone.size
+    columns = np.arange(n)
+    coverage = sparse.csr_array((np.ones(n), (model.zone, columns)), shape=(model.n_zones, n))
+    capacity = sparse.csr_array((np.ones(n), (model.drone, columns)), shape=(model.n_drones, n))
+    return linprog(model.pair_costs(), A_ub=capacity, b_ub=model.autonomy, A_eq=coverage,
+                   b_eq=model.demands, bounds=(0, None), method='highs')
+
+
+def random_model(seed, size=40.0, **kwargs):
+    rng = np.random.default_rng(seed)
+    return FleetModel.from_positions(
+        zone_costs=rng.uniform(0.8, 1.6, 60), demands=rng.uniform(0.5, 2.0, 60),
+        zone_xy=rng.uniform(0, size, (60, 2)), drone_xy=rng.uniform(0, size, (25, 2)),
+        autonomy=rng.uniform(15, 30, 25), multipliers=rng.uniform(0.9, 1.1, 25), **kwargs)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_decomposition_matches_full_lp(seed):
+    model = random_model(seed)
+    result = model.solve(workers=1)
+    reference = full_lp(model)
+    if reference.success:
+        assert result.success
+        assert result.energy == pytest.approx(reference.fun, rel=1e-7)
+        coverage = np.asarray(result.assignment.sum(axis=0)).ravel()
+        np.testing.assert_allclose(coverage, model.demands, atol=1e-7)
+        assert (result.drone_distance <= model.autonomy + 1e-7).all()
+    else:
+        assert not result.success and result.unserved.size
+
+
+def test_parallel_matches_serial():
+    # Campo grande frente a la autonomía: varias componentes independientes
+    model = random_model(5, size=120.0)
+    serial, parallel = model.solve(workers=1), model.solve(workers=2, tasks_per_worker=2)
+    assert parallel.energy == pytest.approx(serial.energy)
+    np.testing.assert_array_equal(parallel.unserved, serial.unserved)
+    assert parallel.components == serial.components > 1
+
+
+def test_unreachable_and_overloaded_zones_are_unserved():
+    eligible = np.array([[True, True, False], [False, True, False]])
+    model = FleetModel([1.0, 1.0, 1.0], demands=[5.0, 1.0, 1.0], autonomy=[2.0, 10.0],
+                       eligible=eligible)
+    result = model.solve(workers=1)
+    assert not result.success
+    # Zona 2: ningún dron; zonas 0 y 1: la componente no tiene autonomía suficiente
+    assert result.unserved.tolist() == [0, 1, 2]
+
+
+def test_max_zones_milp():
+    model = FleetModel([1.0, 2.0], demands=[1.0, 1.0], autonomy=10.0, multipliers=[1.0, 1.5],
+                       max_zones=1)
+    result = model.solve(workers=1)
+    assert result.success
+    assignment = result.assignment.toarray()
+    assert ((assignment > 0).sum(axis=1) <= 1).all()
+    # Cada dron una zona: min(1·1 + 1.5·2, 1·2 + 1.5·1)
+    assert result.energy == pytest.approx(3.5)
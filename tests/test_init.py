@@ -0,0 +1,16 @@
+"""
+Importación del paquete sin efectos secundarios ni dependencias pesadas
+"""
+import subprocess
+import sys
+
+
+def test_import_is_lazy_and_silent():
+    code = ('import sys\n'
+            'import drone_optimization\n'
+            'for name in ("scipy", "matplotlib", "sympy"):\n'
+            '    assert name not in sys.modules, name\n'
+            'drone_optimization.solve_batch\n'
+            'assert "matplotlib" not in sys.modules\n')
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout == ''
@@ -0,0 +1,68 @@
+"""
+Solución KKT compilada: por lotes, sin sympy.solve y con los nombres estables
+"""
+import numpy as np
+import pytest
+
+from drone_optimization.cache import SolutionCache
+from drone_optimization.lagrange_analysis import LagrangeAnalysis, solve_kkt_batch
+from drone_optimization.optimization_solver import solve_batch
+
+
+def test_batch_matches_closed_form():
+    rng = np.random.default_rng(1)
+    params = [rng.uniform(1.0, 1.4, 50), rng.uniform(0.7, 1.1, 50), rng.uniform(1.2, 1.8, 50),
+              rng.uniform(10, 20, 50), rng.uniform(1.5, 2.5, 50), rng.uniform(0.8, 1.2, 50)]
+    kkt, closed = solve_kkt_batch(*params), solve_batch(*params)
+    for name in ('s', 'w', 'j'):
+        np.testing.assert_allclose(getattr(kkt, name), getattr(closed, name), rtol=1e-12)
+
+
+def test_batch_marks_singular_scenarios():
+    result = solve_kkt_batch([1.2, 1.2], [0.9, 0.0], 1.5, 15.0)
+    assert np.isfinite(result.s[0]) and np.isnan(result.s[1])
+
+
+def test_conditions_do_not_call_sympy_solve(monkeypatch, capsys):
+    sympy = pytest.importorskip('sympy')
+
+    def fail(*args, **kwargs):
+        raise AssertionError('sympy.solve no debe llamarse')
+
+    monkeypatch.setattr(sympy, 'solve', fail)
+    analysis = LagrangeAnalysis(autonomy=20)
+    s, w, j, solution = analysis.solve_kkt_conditions()
+    expected = solve_batch(*analysis.spec)
+    assert (s, w, j) == pytest.approx((float(expected.s), float(expected.w), float(expected.j)))
+    # Las claves son los nombres, con o sin SymPy, antes y después de la parte simbólica
+    assert analysis.s == 's' and analysis.lambda1 == 'lambda1'
+    assert set(solution) == {'s', 'w', 'j', 'lambda1', 'lambda2', 'lambda3'}
+    assert 'Ecuación 6' in capsys.readouterr().out
+
+
+def test_symbolic_model_follows_parameter_changes():
+    pytest.importorskip('sympy')
+    analysis = LagrangeAnalysis()
+    first = analysis._symbolic()
+    assert analysis._symbolic() is first
+    analysis.autonomy = 20
+    assert analysis._symbolic() is not first
+    assert '20' in str(analysis.constraint_expressions()[0])
+
+
+def test_conditions_use_the_cache(capsys):
+    cache = SolutionCache()
+    analysis = LagrangeAnalysis(cache=cache)
+    first = analysis.solve_kkt_conditions()
+    second = analysis.solve_kkt_conditions()
+    assert cache.hits == 1
+    assert first[3] == second[3]
+
+
+def test_comparative_analysis_uses_the_spec(capsys):
+    LagrangeAnalysis(autonomy=20, c_A=2.0).comparative_analysis()
+    output = capsys.readouterr().out
+    assert '= 20 → j = 20/' in output
+    for line in output.splitlines():
+        if line.lstrip().startswith(('Diferencias', 'Δ')):
+            assert float(line.split('=')[-1]) < 1e-9
@@ -0,0 +1,21 @@
+"""
+Modelo lineal de N zonas (HiGHS) frente a la solución cerrada
+"""
+import numpy as np
+
+from drone_optimization.lp_solver import NZoneModel
+from drone_optimization.optimization_solver import DroneOptimization, solve_batch
+from drone_optimization.spec import PARAMETERS
+
+
+def test_three_zone_model_matches_closed_form():
+    rng = np.random.default_rng(0)
+    params = [rng.uniform(1.0, 1.4, 20), rng.uniform(0.7, 1.1, 20), rng.uniform(1.2, 1.8, 20),
+              rng.uniform(10, 20, 20), rng.uniform(1.5, 2.5, 20), rng.uniform(0.8, 1.2, 20)]
+    result = solve_batch(*params)
+    for k in range(len(params[0])):
+        optimizer = DroneOptimization()
+        for name, column in zip(PARAMETERS, params):
+            setattr(optimizer, name, float(column[k]))
+        lp = NZoneModel.from_drone_optimization(optimizer).solve()
+        np.testing.assert_allclose(lp.x, [result.s[k], result.w[k], result.j[k]], atol=1e-8)
@@ -0,0 +1,70 @@
+"""
+Instrumentación: etapas, agregados y exportación
+"""
+import json
+
+import pytest
+
+from drone_optimization import metrics
+from drone_optimization.cache import SolutionCache
+from drone_optimization.optimization_solver import DroneOptimization, solve_batch
+
+
+def test_disabled_stage_is_shared_and_silent():
+    assert not metrics.enabled()
+    with metrics.stage('x') as first, metrics.stage('y') as second:
+        first['scenarios'] = 3
+    assert first is second
+
+
+def test_solver_stages_are_recorded():
+    with metrics.recording() as recorder:
+        DroneOptimization().solve_optimization()
+        solve_batch(1.2, 0.9, 1.5, [10.0, 15.0, 20.0])
+    assert not metrics.enabled()
+    summary = recorder.summary()
+    assert summary['solve_batch']['scenarios'] == 3
+    slsqp = next(entry for stage, entry in summary.items() if stage.startswith('solve_optimization'))
+    assert slsqp['calls'] == 1 and slsqp['iterations'] > 0
+    assert all(entry['wall_s'] >= 0 for entry in summary.values())
+
+
+def test_errors_and_residuals_are_aggregated():
+    with metrics.recording() as recorder:
+        with pytest.raises(ZeroDivisionError):
+            with metrics.stage('failing'):
+                1 / 0
+        for value in (1e-9, -3e-9):
+            with metrics.stage('check') as stage:
+                stage.update(residual_balance=value, cache_hit=value > 0)
+    summary = recorder.summary()
+    assert summary['failing']['errors'] == 1
+    assert recorder.records()[0]['error'] == 'ZeroDivisionError'
+    assert summary['check']['residual_max'] == {'balance': 3e-9}
+    assert summary['check']['cache_hit_rate'] == 0.5
+
+
+def test_exports(tmp_path):
+    cache = SolutionCache()
+    with metrics.recording() as recorder:
+        with metrics.stage('solve "a"', scenarios=4):
+            pass
+        metrics.observe_cache(cache)
+    recorder.write_jsonl(tmp_path / 'metrics.jsonl')
+    recorder.write_prometheus(tmp_path / 'metrics.prom')
+    lines = (tmp_path / 'metrics.jsonl').read_text().splitlines()
+    assert [json.loads(line)['stage'] for line in lines] == ['solve "a"', 'cache_stats']
+    text = (tmp_path / 'metrics.prom').read_text()
+    assert 'drone_optimization_scenarios_total{stage="solve \\"a\\""} 4' in text
+    assert 'drone_optimization_cache_hit_ratio{cache="solutions"}' in text
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_recording_restores_the_previous_recorder():
+    outer = metrics.enable()
+    try:
+        with metrics.recording() as inner:
+            assert metrics.get_recorder() is inner
+        assert metrics.get_recorder() is outer
+    finally:
+        metrics.disable()
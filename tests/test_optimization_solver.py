@@ -0,0 +1,87 @@
+"""
+Solución cerrada por lotes, verificación vectorizada y SLSQP
+"""
+import numpy as np
+import pytest
+
+from drone_optimization.optimization_solver import DroneOptimization, solve_batch, verify_batch
+
+
+def test_analytical_solution_base_problem():
+    s, w, j = DroneOptimization().analytical_solution()
+    assert j == pytest.approx(45 / 17)
+    assert s == pytest.approx(2 * j)
+    assert s + w + j == pytest.approx(15.0)
+
+
+def test_closed_form_satisfies_constraints():
+    rng = np.random.default_rng(0)
+    c_A, c_B, c_C = rng.uniform(1.0, 1.4, 50), rng.uniform(0.7, 1.1, 50), rng.uniform(1.2, 1.8, 50)
+    autonomy, p, b = rng.uniform(10, 20, 50), rng.uniform(1.5, 2.5, 50), rng.uniform(0.8, 1.2, 50)
+    result = solve_batch(c_A, c_B, c_C, autonomy, p, b)
+    assert result.feasible.all()
+    np.testing.assert_allclose(result.s + result.w + result.j, autonomy)
+    np.testing.assert_allclose(result.s, p * result.j)
+    np.testing.assert_allclose(c_B * result.w, b * c_A * result.s)
+    np.testing.assert_allclose(result.energy, c_A * result.s + c_B * result.w + c_C * result.j)
+
+
+def test_nan_parameters_are_infeasible():
+    result = solve_batch([1.2, np.nan], 0.9, 1.5, 15.0)
+    assert result.feasible.tolist() == [True, False]
+    assert np.isnan(result.s[1])
+
+
+@pytest.mark.parametrize('name, jac', [
+    ('objective_function', 'objective_gradient'),
+    ('constraint_autonomy', 'constraint_autonomy_jac'),
+    ('constraint_priority', 'constraint_priority_jac'),
+    ('constraint_energy_balance', 'constraint_energy_balance_jac'),
+])
+def test_jacobians_match_finite_differences(name, jac):
+    optimizer = DroneOptimization()
+    x = np.array([5.0, 7.0, 2.5])
+    fun, grad = getattr(optimizer, name), getattr(optimizer, jac)
+    numeric = [(fun(x + h) - fun(x - h)) / 2e-6 for h in np.eye(3) * 1e-6]
+    np.testing.assert_allclose(grad(x), numeric, atol=1e-6)
+
+
+@pytest.mark.parametrize('autonomy', [10.0, 15.0])
+def test_slsqp_inequality_optimum_is_trivial(autonomy):
+    # Con costos positivos y la autonomía como desigualdad, no volar es óptimo
+    optimizer = DroneOptimization()
+    optimizer.autonomy = autonomy
+    result = optimizer.solve_optimization()
+    np.testing.assert_allclose(result.x, 0.0, atol=1e-8)
+
+
+def test_warm_start_reuses_previous_solution():
+    optimizer = DroneOptimization()
+    cold = optimizer.solve_optimization()
+    warm = optimizer.solve_optimization(warm_start=cold)
+    np.testing.assert_allclose(warm.x, cold.x, atol=1e-8)
+    assert warm.nit <= cold.nit
+
+
+def test_closed_form_passes_verification():
+    rng = np.random.default_rng(0)
+    params = [rng.uniform(1.0, 1.4, 50), rng.uniform(0.7, 1.1, 50), rng.uniform(1.2, 1.8, 50),
+              rng.uniform(10, 20, 50), rng.uniform(1.5, 2.5, 50), rng.uniform(0.8, 1.2, 50)]
+    result = solve_batch(*params)
+    x = np.column_stack([result.s, result.w, result.j])
+    check = verify_batch(x, params[0], params[1], params[3], params[4], params[5],
+                         autonomy_equality=True)
+    assert check.feasible.all()
+    # Sin la igualdad, la solución trivial también cumple la autonomía
+    assert verify_batch(np.zeros((1, 3)), 1.2, 0.9, 15.0).feasible.all()
+
+
+def test_verification_flags_each_constraint():
+    x = [[5.0, 7.0, 2.5], [np.nan, 0.0, 0.0], [-1.0, 0.0, 0.0], [10.0, 10.0, 5.0]]
+    check = verify_batch(x, 1.2, 0.9, 15.0, tolerances={'priority': 0.1, 'balance': 0.5})
+    assert check.feasible.tolist() == [True, False, False, False]
+    assert not check.nonnegative[2]
+    assert not check.autonomy[3]
+    assert check.residuals.autonomy[0] == pytest.approx(-0.5)
+    with pytest.raises(ValueError):
+        verify_batch([[1.0, 2.0]], 1.2, 0.9, 15.0)
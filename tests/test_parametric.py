@@ -0,0 +1,34 @@
+"""
+Re-solución incremental frente a la solución cerrada
+"""
+import numpy as np
+import pytest
+
+from drone_optimization.optimization_solver import DroneOptimization, solve_batch
+from drone_optimization.parametric import ParametricSolver
+
+
+def test_update_parameters_matches_solve_batch():
+    solver = ParametricSolver.from_drone_optimization(DroneOptimization())
+    solver.solve()
+    rng = np.random.default_rng(3)
+    params = DroneOptimization().parameters()
+    for _ in range(60):
+        name = rng.choice(list(params))
+        params[name] *= rng.uniform(0.9, 1.1)
+        solution = solver.update_parameters(**{name: params[name]})
+        expected = solve_batch(**params)
+        np.testing.assert_allclose(solution.x, [expected.s, expected.w, expected.j], atol=1e-8)
+        assert solution.energy == pytest.approx(float(expected.energy), abs=1e-8)
+    assert solver.incremental_solves > 0
+
+
+def test_autonomy_change_reuses_factorization():
+    solver = ParametricSolver.from_drone_optimization(DroneOptimization())
+    first = solver.solve()
+    solution = solver.update_parameters(autonomy=18.0)
+    assert solution.incremental
+    assert solver.full_solves == 1
+    # La energía varía según el precio sombra de la autonomía
+    shadow = first.eq_multipliers[0]
+    assert solution.energy == pytest.approx(first.energy + 3.0 * shadow)
@@ -0,0 +1,54 @@
+"""
+non_dominated frente a la comparación exhaustiva
+"""
+import numpy as np
+import pytest
+
+from drone_optimization.pareto import ParetoAnalysis, non_dominated
+
+
+def brute_force(F):
+    dominated = ((F[None, :, :] <= F[:, None, :]).all(axis=2)
+                 & (F[None, :, :] < F[:, None, :]).any(axis=2)).any(axis=1)
+    return ~dominated
+
+
+@pytest.mark.parametrize('m', [1, 2, 3, 4])
+@pytest.mark.parametrize('seed', range(3))
+def test_non_dominated_matches_brute_force(m, seed):
+    rng = np.random.default_rng(seed)
+    # Valores enteros pequeños: muchos empates y puntos repetidos
+    F = rng.integers(0, 6, size=(400, m)).astype(float)
+    np.testing.assert_array_equal(non_dominated(F, chunk_size=64), brute_force(F))
+
+
+def test_non_dominated_empty():
+    assert non_dominated(np.empty((0, 3))).size == 0
+
+
+def test_front_is_non_dominated():
+    analysis = ParetoAnalysis()
+    candidates = analysis.candidates(n_distance=10, n_priority=8, n_balance=8)
+    front = analysis.front(candidates)
+    F = analysis.objective_matrix(front)
+    assert brute_force(F).all()
+    assert len(front.energy) <= len(candidates.energy)
+
+
+def test_plot_pareto_front_subsamples():
+    matplotlib = pytest.importorskip('matplotlib')
+    pytest.importorskip('seaborn')
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from drone_optimization.visualization import DroneVisualization
+
+    analysis = ParetoAnalysis()
+    candidates = analysis.candidates(n_distance=10, n_priority=8, n_balance=8)
+    front = analysis.front(candidates)
+    fig = DroneVisualization().plot_pareto_front(front, candidates, max_points=50, show=False)
+    ax3d, ax_energy, ax_time = (ax for ax in fig.axes if ax.get_label() != '<colorbar>')
+    step = max(1, front.energy.size // 50)
+    assert len(ax3d.collections[0].get_offsets()) == len(front.energy[::step])
+    # Candidatos dominados como densidad de fondo en las proyecciones
+    assert ax_energy.images and ax_time.images
+    plt.close(fig)
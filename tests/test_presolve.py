@@ -0,0 +1,112 @@
+"""
+Presolve frente a linprog: mismo estado y mismo óptimo
+"""
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+from drone_optimization.lp_solver import NZoneModel
+from drone_optimization.optimization_solver import DroneOptimization
+from drone_optimization.presolve import (INFEASIBLE, REDUCED, SOLVED, STATUSES,
+                                         presolve_batch, presolve_model)
+
+# Estados de linprog -> estados del presolve
+LINPROG_STATUS = {0: 'solved', 2: 'infeasible', 3: 'unbounded'}
+
+
+def random_model(rng):
+    n = int(rng.integers(1, 6))
+    costs = rng.uniform(-1.0, 2.0, n)
+
+    def rows(m):
+        # Razones nulas, negativas y positivas, incluidas filas con i == k
+        return [(rng.integers(n), rng.integers(n), rng.choice([0.0, -1.0, rng.uniform(0.2, 3.0)]))
+                for _ in range(m)]
+
+    lower = rng.choice([0.0, -np.inf, -1.0, 0.5], n)
+    upper = np.where(rng.random(n) < 0.5, np.inf, np.where(np.isfinite(lower), lower, 0.0)
+                     + rng.uniform(-0.5, 5.0, n))
+    return NZoneModel(costs, rng.uniform(-1.0, 20.0), ratios=rows(int(rng.integers(0, 3))),
+                      balances=rows(int(rng.integers(0, 3))), lower=lower, upper=upper,
+                      full_coverage=bool(rng.random() < 0.5))
+
+
+def linprog_result(model):
+    return model.solve(presolve=False)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_presolve_model_matches_linprog(seed):
+    rng = np.random.default_rng(seed)
+    checked = 0
+    for _ in range(250):
+        model = random_model(rng)
+        diagnosis = presolve_model(model)
+        assert diagnosis.status in STATUSES
+        if diagnosis.status == 'reduced':
+            continue
+        result = linprog_result(model)
+        assert result.status in LINPROG_STATUS
+        assert diagnosis.status == LINPROG_STATUS[result.status]
+        if diagnosis.status == 'solved':
+            assert diagnosis.energy == pytest.approx(result.fun, abs=1e-7)
+            c, A_ub, b_ub, A_eq, b_eq, bounds = model.build()
+            if A_eq is not None:
+                np.testing.assert_allclose(A_eq @ diagnosis.x, b_eq, atol=1e-7)
+        checked += 1
+    assert checked > 100
+
+
+def test_infeasible_model_skips_linprog():
+    model = NZoneModel([1.0, 1.0], autonomy=5.0, lower=[3.0, 3.0])
+    result = model.solve()
+    assert not result.success
+    assert result.status == 2
+    assert result.nit == 0
+    assert result.presolve.status == 'infeasible'
+    assert result.presolve.conflicts
+
+
+def test_infeasible_slsqp_scenario_skips_minimize():
+    optimizer = DroneOptimization()
+    optimizer.autonomy = -1.0
+    result = optimizer.solve_optimization()
+    assert not result.success
+    assert np.isnan(result.x).all()
+    assert result.nit == 0
+
+
+def test_conflicting_ratio_cycle_is_infeasible():
+    # x0 = 2·x1 y x1 = 2·x0 solo admiten x = 0, fuera de la cota inferior
+    model = NZoneModel([1.0, 1.0], autonomy=10.0, ratios=[(0, 1, 2.0), (1, 0, 2.0)], lower=0.5)
+    assert presolve_model(model).status == 'infeasible'
+    assert linprog_result(model).status == 2
+
+
+def _linprog_three_zones(c_A, c_B, c_C, autonomy, p, b, full_coverage):
+    A_eq = [[1.0, 0.0, -p], [-b * c_A, c_B, 0.0]]
+    b_eq = [0.0, 0.0]
+    if full_coverage:
+        return linprog([c_A, c_B, c_C], A_eq=A_eq + [[1.0, 1.0, 1.0]], b_eq=b_eq + [autonomy],
+                       bounds=[(0, None)] * 3, method='highs')
+    return linprog([c_A, c_B, c_C], A_ub=[[1.0, 1.0, 1.0]], b_ub=[autonomy], A_eq=A_eq, b_eq=b_eq,
+                   bounds=[(0, None)] * 3, method='highs')
+
+
+@pytest.mark.parametrize('full_coverage', [True, False])
+def test_presolve_batch_matches_linprog(full_coverage):
+    rng = np.random.default_rng(7)
+    n = 300
+    params = [rng.uniform(-1.0, 2.0, n), rng.uniform(-1.0, 2.0, n), rng.uniform(-1.0, 2.0, n),
+              rng.uniform(-2.0, 20.0, n), rng.uniform(-1.0, 3.0, n), rng.uniform(-1.0, 2.0, n)]
+    result = presolve_batch(*params, full_coverage=full_coverage)
+    assert set(np.unique(result.status)) <= {SOLVED, REDUCED, INFEASIBLE}
+    for k in range(n):
+        if result.status[k] == REDUCED:
+            continue
+        reference = _linprog_three_zones(*(float(column[k]) for column in params), full_coverage)
+        if result.status[k] == INFEASIBLE:
+            assert reference.status == 2
+        else:
+            assert reference.status == 0
+            assert result.energy[k] == pytest.approx(reference.fun, abs=1e-7)
@@ -0,0 +1,56 @@
+"""
+Renderizado sin interfaz: nombres por contenido y reutilización de archivos
+"""
+import os
+
+import pytest
+
+pytest.importorskip('matplotlib')
+pytest.importorskip('seaborn')
+
+from drone_optimization import render  # noqa: E402
+from drone_optimization.render import content_hash, render_dashboards, render_scenario  # noqa: E402
+
+
+def test_hash_uses_the_complete_scenario():
+    # Los valores por defecto explícitos u omitidos dibujan lo mismo
+    assert content_hash({}, 'summary', 'png') == content_hash({'autonomy': 15}, 'summary', 'png')
+    assert content_hash({'c_A': 1}, 'summary', 'png') == content_hash({'c_A': 1.0}, 'summary', 'png')
+    assert content_hash({}, 'summary', 'png') != content_hash({'autonomy': 16}, 'summary', 'png')
+    assert content_hash({}, 'summary', 'png') != content_hash({}, 'summary', 'svg')
+    assert content_hash({}, 'summary', 'png') != content_hash({}, 'summary', 'png', dpi=200)
+
+
+def test_hash_changes_with_the_render_version(monkeypatch):
+    before = content_hash({}, 'summary', 'png')
+    monkeypatch.setattr(render, 'RENDER_VERSION', render.RENDER_VERSION + 1)
+    assert content_hash({}, 'summary', 'png') != before
+
+
+def test_existing_files_are_reused(tmp_path, monkeypatch):
+    first = render_scenario({'autonomy': 12}, str(tmp_path), plots=('summary',))
+    assert [record['cached'] for record in first] == [False]
+    assert os.path.getsize(first[0]['path']) > 0
+
+    # Un archivo reutilizado no crea ninguna figura
+    import drone_optimization.visualization as visualization
+    monkeypatch.setattr(visualization, 'DroneVisualization', None)
+    second = render_scenario({'autonomy': 12.0}, str(tmp_path), plots=('summary',))
+    assert second == [{**first[0], 'cached': True}]
+    assert not [name for name in os.listdir(tmp_path) if '.tmp' in name]
+
+
+def test_unknown_parameters_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        render_scenario({'speed': 30}, str(tmp_path))
+
+
+def test_dashboards_keep_the_scenario_order(tmp_path):
+    scenarios = [{'autonomy': 10}, {}, {'autonomy': 15}]
+    results = render_dashboards(scenarios, str(tmp_path), plots=('summary',),
+                                formats=('png', 'svg'), workers=1)
+    assert [len(records) for records in results] == [2, 2, 2]
+    # {} y {'autonomy': 15} comparten archivos: el tercero ya estaba en disco
+    assert [record['cached'] for record in results[2]] == [True, True]
+    assert results[1][0]['path'] == results[2][0]['path']
+    assert len(os.listdir(tmp_path)) == 4
@@ -0,0 +1,57 @@
+"""
+Robustez por Monte Carlo: reproducibilidad por bloques, probabilidades y cuantiles
+"""
+import numpy as np
+import pytest
+from scipy import stats
+
+from drone_optimization.robustness import RobustnessAnalysis
+
+
+def test_seeded_runs_are_reproducible():
+    analysis = RobustnessAnalysis(seed=3, chunk_size=10_000)
+    first, second = analysis.evaluate(n_samples=50_000), analysis.evaluate(n_samples=50_000)
+    assert first == second
+    assert first.seed == 3
+
+
+def test_failure_probability_matches_the_distribution():
+    # Autonomía normal: P(L < distancia planificada) es exacta
+    analysis = RobustnessAnalysis(distributions={'autonomy': ('normal', 15.0, 1.0)},
+                                  seed=0, chunk_size=100_000)
+    plan = analysis.nominal_plan(autonomy=14.0)
+    report = analysis.evaluate(plan, n_samples=400_000)
+    expected = stats.norm.cdf(14.0, loc=15.0, scale=1.0)
+    assert report.failure_probability == pytest.approx(expected, abs=4 * report.failure_stderr)
+    assert report.violation_probability['balance'] == 0.0
+
+
+def test_streaming_quantiles_match_numpy():
+    distributions = {'c_A': ('lognormal', 0.2, 0.1), 'c_C': ('gamma', 9.0, 0.2)}
+    analysis = RobustnessAnalysis(distributions=distributions, seed=1, chunk_size=25_000)
+    report = analysis.evaluate(n_samples=100_000)
+
+    # Las mismas muestras, reconstruidas bloque a bloque
+    s, w, j = report.plan
+    energy = np.concatenate([params['c_A'] * s + params['c_B'] * w + params['c_C'] * j
+                             for params in analysis._chunks(100_000, np.random.SeedSequence(1))])
+    assert report.energy_mean == pytest.approx(energy.mean())
+    assert report.energy_std == pytest.approx(energy.std(), rel=1e-6)
+    for q, value in report.energy_quantiles.items():
+        assert value == pytest.approx(np.quantile(energy, q), rel=1e-3)
+
+
+def test_chance_constrained_plan_meets_alpha():
+    analysis = RobustnessAnalysis(energy_budget=17.0, seed=2, chunk_size=50_000)
+    plan, report = analysis.chance_constrained(alpha=0.05, n_samples=200_000)
+    assert report.failure_probability <= 0.05 + 4 * report.failure_stderr
+    # Misma dirección que el plan nominal
+    nominal = analysis.nominal_plan()
+    np.testing.assert_allclose(plan / plan.sum(), nominal / nominal.sum())
+
+
+def test_invalid_distributions():
+    with pytest.raises(ValueError):
+        RobustnessAnalysis(distributions={'priority_ratio': ('normal', 2.0, 0.1)})
+    with pytest.raises(ValueError):
+        RobustnessAnalysis(distributions={'c_A': ('cauchy', 1.2)})
@@ -0,0 +1,38 @@
+"""
+Rutas: puntos visitados, casos límite y validación de la base
+"""
+import numpy as np
+import pytest
+
+from drone_optimization.routing import RouteOptimizer
+
+
+def test_empty_route():
+    route = RouteOptimizer().plan(np.empty((0, 2)), [])
+    assert route.sorties == [] and route.distance == 0.0 and route.energy == 0.0
+    assert route.tour.size == 0 and route.unreachable.size == 0
+
+
+def test_single_point_route():
+    route = RouteOptimizer().plan([[0.5, 0.5]], ['A'])
+    assert route.tour.tolist() == [0]
+    assert route.sorties == [] and route.distance == 0.0 and route.energy == 0.0
+    assert route.unreachable.size == 0
+
+
+@pytest.mark.parametrize('n, depot', [(1, 1), (1, -1), (5, 5), (5, -1)])
+def test_depot_out_of_range(n, depot):
+    coords = np.zeros((n, 2))
+    with pytest.raises(ValueError):
+        RouteOptimizer().plan(coords, ['A'] * n, depot=depot)
+
+
+def test_route_visits_every_reachable_point():
+    rng = np.random.default_rng(0)
+    coords = rng.uniform(0, 2, (300, 2))
+    zones = np.array(['A', 'B', 'C'])[rng.integers(0, 3, 300)]
+    route = RouteOptimizer().plan(coords, zones)
+    visited = np.concatenate([sortie[1:-1] for sortie in route.sorties])
+    assert sorted(visited.tolist() + route.unreachable.tolist()) == list(range(1, 300))
+    for sortie in route.sorties:
+        assert sortie[0] == 0 and sortie[-1] == 0
@@ -0,0 +1,120 @@
+"""
+Servicio de planificación: micro-lotes, errores y cierre
+"""
+import asyncio
+
+import pytest
+
+from drone_optimization.optimization_solver import solve_batch
+from drone_optimization.service import (MicroBatcher, PlanningService, ServiceOverloaded,
+                                        request)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_concurrent_requests_share_batches():
+    async def scenario():
+        batcher = MicroBatcher(max_batch=64, max_delay=0.01)
+        await batcher.start()
+        try:
+            rows = await asyncio.gather(*(batcher.submit({'autonomy': 10.0 + k})
+                                          for k in range(200)))
+        finally:
+            await batcher.close()
+        return rows, batcher.stats()
+
+    rows, stats = run(scenario())
+    expected = solve_batch(1.2, 0.9, 1.5, [10.0 + k for k in range(200)])
+    assert [row['s'] for row in rows] == pytest.approx(expected.s.tolist())
+    assert stats['requests'] == 200
+    assert stats['batches'] < 200 and stats['mean_batch_size'] > 1
+
+
+def test_invalid_list_enqueues_nothing():
+    async def scenario():
+        service = await PlanningService(port=0, batcher=MicroBatcher(max_delay=0.0)).start()
+        try:
+            bad = await request(service.host, service.port,
+                                payload=[{'autonomy': 10}, {'autonomy': 'x'}])
+            unknown = await request(service.host, service.port, payload=[{'speed': 1}])
+            ok = await request(service.host, service.port, payload=[{'autonomy': 10}, {}])
+            _, stats = await request(service.host, service.port, 'GET', '/stats')
+        finally:
+            await service.close()
+        return bad, unknown, ok, stats
+
+    bad, unknown, ok, stats = run(scenario())
+    assert bad[0] == 400 and 'autonomy' in bad[1]['error']
+    assert unknown[0] == 400
+    assert ok[0] == 200 and [row['autonomy'] for row in ok[1]] == [10.0, 15.0]
+    # Solo los dos escenarios de la petición válida llegaron a la cola
+    assert stats['requests'] == 2
+
+
+def test_full_queue_rejects_the_whole_payload():
+    async def scenario():
+        batcher = MicroBatcher(max_queue=3)
+        # Sin start() del bucle: la cola se llena y no se vacía
+        batcher._queue = asyncio.Queue(maxsize=batcher.max_queue)
+        pending = asyncio.ensure_future(batcher.submit_many([{}, {}]))
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceOverloaded):
+            await batcher.submit_many([{}, {}])
+        depth = batcher._queue.qsize()
+        pending.cancel()
+        return depth, batcher.rejected
+
+    assert run(scenario()) == (2, 2)
+
+
+def test_oversized_payload_and_unknown_routes():
+    async def scenario():
+        service = await PlanningService(port=0, batcher=MicroBatcher(max_queue=4)).start()
+        try:
+            return (await request(service.host, service.port, payload=[{}] * 5),
+                    await request(service.host, service.port, 'GET', '/nope'),
+                    await request(service.host, service.port, 'GET', '/solve'))
+        finally:
+            await service.close()
+
+    oversized, missing, method = run(scenario())
+    assert oversized[0] == 413 and missing[0] == 404 and method[0] == 405
+
+
+def test_solver_errors_reach_every_request():
+    class Broken:
+        def submit(self, *args, **kwargs):
+            raise RuntimeError('solver caído')
+
+    async def scenario():
+        batcher = MicroBatcher(max_delay=0.0, executor=Broken())
+        await batcher.start()
+        try:
+            return await asyncio.gather(*(batcher.submit({}) for _ in range(3)),
+                                        return_exceptions=True), batcher.stats()
+        finally:
+            await batcher.close()
+
+    results, stats = run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert stats['errors'] == 3
+
+
+def test_close_fails_queued_requests_and_stops_the_executor():
+    async def scenario():
+        batcher = MicroBatcher(max_delay=0.0)
+        await batcher.start()
+        await batcher.close()
+        executor_closed = batcher.executor is None
+        # Lo que quedó en cola tras parar el bucle falla en vez de colgarse
+        batcher._queue = asyncio.Queue()
+        future = asyncio.get_running_loop().create_future()
+        batcher._queue.put_nowait(({}, future, 0.0))
+        await batcher.close()
+        return executor_closed, future.exception()
+
+    executor_closed, error = run(scenario())
+    assert executor_closed
+    assert isinstance(error, ServiceOverloaded)
@@ -0,0 +1,53 @@
+"""
+Simulador de misiones: tiempo y consumo por lo volado, segmentos vacíos y fallos
+"""
+import numpy as np
+import pytest
+
+from drone_optimization.optimization_solver import DroneOptimization
+from drone_optimization.simulation import MissionSimulator
+
+
+def test_time_and_idle_energy_follow_the_distance_flown():
+    # 1 km a 40 km/h con dt = 0.01 h: 2.5 pasos, el último recortado
+    simulator = MissionSimulator([[1.0]], ['A'], capacity=100.0, idle_power=10.0)
+    result = simulator.run(dt=0.01)
+    assert result.completed.all()
+    assert result.mission_time[0] == pytest.approx(1.0 / 40.0)
+    assert result.final_battery[0] == pytest.approx(100.0 - 1.2 - 10.0 / 40.0)
+
+
+def test_zero_length_segments_are_free():
+    lengths = [[0.0, 1.0, 0.0, 0.0, 2.0, 0.0], [1.0, 0.0, 0.0, 0.0, 0.0, 2.0]]
+    zones = [['A', 'A', 'B', 'C', 'B', 'A'], ['A', 'B', 'C', 'C', 'C', 'B']]
+    result = MissionSimulator(lengths, zones, capacity=100.0, idle_power=1.0).run(dt=0.001)
+    expected_time = 1.0 / 40.0 + 2.0 / 20.0
+    np.testing.assert_allclose(result.mission_time, expected_time)
+    np.testing.assert_allclose(result.final_battery, 100.0 - 1.2 - 2 * 0.9 - expected_time)
+    np.testing.assert_allclose(result.distance, 3.0)
+    assert result.completed.all()
+
+
+def test_dt_does_not_change_the_totals():
+    plan = np.array(DroneOptimization().solve_batch()[:3], dtype=float)
+    totals = []
+    for dt in (1 / 60, 1 / 3600):
+        result = MissionSimulator.from_plans(plan[None], capacity=30.0, idle_power=0.5).run(dt=dt)
+        totals.append((result.mission_time[0], result.final_battery[0]))
+    np.testing.assert_allclose(totals[0], totals[1])
+
+
+def test_failure_is_located_in_the_segment_where_the_battery_runs_out():
+    # A consume 1.2/km: 5 unidades se agotan a 4.1667 km, dentro del segmento 1
+    result = MissionSimulator([[3.0, 3.0]], [['A', 'A']], capacity=5.0, reserve=0.5).run(dt=1e-4)
+    assert result.failed.all() and not result.completed.any()
+    assert result.failure_segment[0] == 1
+    assert result.failure_position[0] == pytest.approx(5.0 / 1.2, abs=0.01)
+    assert result.reserve_time[0] < result.failure_time[0]
+
+
+def test_empty_missions_and_invalid_speeds():
+    result = MissionSimulator([[0.0, 0.0]], [['A', 'B']], capacity=1.0).run()
+    assert result.completed.all() and result.mission_time[0] == 0.0
+    with pytest.raises(ValueError):
+        MissionSimulator([[1.0]], ['A'], capacity=1.0, speed_factor=0.0)
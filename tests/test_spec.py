@@ -0,0 +1,89 @@
+"""
+ProblemSpec, ProblemBatch y ciclo de vida de SharedProblemBatch
+"""
+import copy
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from drone_optimization.optimization_solver import DroneOptimization
+from drone_optimization.spec import (DEFAULTS, PARAMETERS, ProblemBatch, ProblemSpec,
+                                     SharedProblemBatch)
+
+
+def test_spec_defaults_and_replace():
+    spec = ProblemSpec(autonomy=20)
+    assert list(spec) == [*DEFAULTS[:3], 20.0, *DEFAULTS[4:]]
+    changed = spec.replace(c_A=2.0)
+    assert changed.c_A == 2.0 and spec.c_A == DEFAULTS[0]
+    assert spec.w_per_s == pytest.approx(spec.balance_ratio * spec.c_A / spec.c_B)
+
+
+def test_decorated_class_delegates_to_spec():
+    optimizer = DroneOptimization()
+    optimizer.autonomy = 12.0
+    assert optimizer.spec.autonomy == 12.0
+    assert optimizer.parameters()['autonomy'] == 12.0
+
+
+def test_batch_views_share_the_buffer():
+    batch = ProblemBatch.from_columns({'autonomy': [10.0, 12.0, 14.0]})
+    assert len(batch) == 3
+    batch[1].c_A = 2.0
+    assert batch.c_A[1] == 2.0
+    assert batch[1:].autonomy.tolist() == [12.0, 14.0]
+    with pytest.raises(ValueError):
+        ProblemBatch.from_columns({'speed': [1.0]})
+
+
+@pytest.mark.parametrize('clone', [lambda batch: pickle.loads(pickle.dumps(batch)),
+                                   copy.copy, copy.deepcopy])
+def test_batch_round_trip(clone):
+    batch = ProblemBatch.from_columns({'autonomy': [10.0, 12.0], 'c_A': [1.1, 1.3]})
+    cloned = clone(batch)
+    np.testing.assert_array_equal(cloned.data, batch.data)
+    assert cloned.autonomy.tolist() == [10.0, 12.0]
+    with pytest.raises(AttributeError):
+        cloned.speed
+
+
+def test_shared_batch_pickles_by_name():
+    batch = ProblemBatch.from_columns({'autonomy': np.linspace(10, 20, 1000)})
+    with batch.share() as shared:
+        payload = pickle.dumps(shared)
+        assert len(payload) < 200
+        attached = pickle.loads(payload)
+        np.testing.assert_array_equal(attached.batch.data, batch.data)
+        # Los dos lados ven el mismo bloque
+        shared.batch.autonomy[0] = 99.0
+        assert attached.batch.autonomy[0] == 99.0
+        attached.close()
+        # Quien se conecta solo suelta su vista; el bloque sigue existiendo
+        shared_memory.SharedMemory(name=shared.name).close()
+
+
+def test_shared_batch_close_unlinks():
+    shared = SharedProblemBatch(ProblemBatch.from_columns({'c_A': [1.0, 1.1]}))
+    name = shared.name
+    shared.close()
+    assert shared.batch is None
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def _energy_sum(shared):
+    return float(np.nansum(shared.batch.solve().energy))
+
+
+def test_shared_batch_in_worker_process():
+    batch = ProblemBatch.from_columns({'autonomy': np.linspace(10, 20, 100)})
+    expected = float(np.nansum(batch.solve().energy))
+    with batch.share() as shared, ProcessPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(_energy_sum, shared).result() == pytest.approx(expected)
+
+
+def test_parameters_order():
+    assert PARAMETERS == ('c_A', 'c_B', 'c_C', 'autonomy', 'priority_ratio', 'balance_ratio')
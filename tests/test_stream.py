@@ -0,0 +1,79 @@
+"""
+Índices y errores por registro en el procesamiento en streaming
+"""
+import io
+import json
+
+import pytest
+
+from drone_optimization.stream import process_stream
+
+LINES = [
+    '{"autonomy": 10}',
+    '',
+    '{"autonomy": 12, "id": "b"}',
+    '   ',
+    '{"c_A": "abc"}',
+    'no es JSON',
+    '',
+    '{"autonomy": 14}',
+]
+
+
+def run(batch_size, workers=1, text='\n'.join(LINES) + '\n'):
+    sink = io.StringIO()
+    count = process_stream(io.StringIO(text), sink, batch_size=batch_size, workers=workers)
+    return count, [json.loads(line) for line in sink.getvalue().splitlines()]
+
+
+@pytest.mark.parametrize('batch_size', [1, 2, 3, 100])
+def test_indices_skip_blank_lines(batch_size):
+    count, rows = run(batch_size)
+    assert count == 5
+    assert [row['index'] for row in rows] == list(range(5))
+    assert [row['autonomy'] for row in rows if row['feasible']] == [10.0, 12.0, 14.0]
+
+
+def test_bad_records_do_not_stop_the_stream():
+    _, rows = run(2)
+    errors = [row.get('error') for row in rows]
+    assert errors[0] is None and errors[1] is None and errors[4] is None
+    assert 'c_A' in errors[2]
+    assert 'JSON' in errors[3]
+    assert not rows[2]['feasible'] and not rows[3]['feasible']
+
+
+def test_workers_match_single_process():
+    assert run(2, workers=2) == run(2, workers=1)
+
+
+def test_csv_input():
+    text = 'id,autonomy,c_A\na,10,\n\nb,12,x\nc,14,1.3\n'
+    sink = io.StringIO()
+    count = process_stream(io.StringIO(text), sink, batch_size=2, workers=1, input_format='csv')
+    rows = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert count == 3
+    assert [row['id'] for row in rows] == ['a', 'b', 'c']
+    assert [row['index'] for row in rows] == [0, 1, 2]
+    assert [row['feasible'] for row in rows] == [True, False, True]
+
+
+def test_only_bad_fields_are_nan():
+    _, rows = run(2)
+    # {"c_A": "abc"}: el resto de parámetros conserva sus valores
+    assert rows[2]['c_A'] is None
+    assert rows[2]['autonomy'] == 15.0 and rows[2]['c_B'] == 0.9
+    # JSON inválido: no hay ningún valor que conservar
+    assert rows[3]['autonomy'] is None
+
+
+@pytest.mark.parametrize('batch_size', [1, 2])
+def test_csv_quoted_newlines(batch_size):
+    text = 'id,autonomy\n"a\nb",10\n\n"c\n\n""d""",12\ne,14\n'
+    sink = io.StringIO()
+    count = process_stream(io.StringIO(text), sink, batch_size=batch_size, workers=1,
+                           input_format='csv')
+    rows = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert count == 3
+    assert [row['id'] for row in rows] == ['a\nb', 'c\n\n"d"', 'e']
+    assert [row['autonomy'] for row in rows] == [10.0, 12.0, 14.0]
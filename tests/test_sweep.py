@@ -0,0 +1,35 @@
+"""
+Diseños de barrido y barrido en paralelo
+"""
+import numpy as np
+import pytest
+
+from drone_optimization.sweep import GridDesign, latin_hypercube, run_sweep
+
+
+def test_latin_hypercube_strata():
+    design = latin_hypercube(100, seed=0, autonomy=(10, 20))
+    assert len(design) == 100
+    strata = np.sort(((design.columns['autonomy'] - 10) / 10 * 100).astype(int))
+    np.testing.assert_array_equal(strata, np.arange(100))
+
+
+def test_latin_hypercube_requires_bounds():
+    with pytest.raises(ValueError):
+        latin_hypercube(10)
+
+
+def test_parallel_sweep_matches_serial():
+    design = latin_hypercube(5_000, seed=1, autonomy=(10, 20), c_A=(1.0, 1.4))
+    serial = run_sweep(design, workers=1, chunk_size=1_000)
+    parallel = run_sweep(design, workers=2, chunk_size=1_000)
+    assert set(serial.keys()) == set(parallel.keys())
+    for name in serial.keys():
+        np.testing.assert_array_equal(serial[name], parallel[name])
+
+
+def test_grid_design_size():
+    design = GridDesign(autonomy=np.linspace(10, 20, 5), c_A=[1.0, 1.2])
+    assert len(design) == 10
+    assert len(run_sweep(design, workers=1)) == 10
+
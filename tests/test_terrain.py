@@ -0,0 +1,61 @@
+"""
+Ráster de costos: formato, índices de celda e integración de tramos
+"""
+import numpy as np
+import pytest
+
+from drone_optimization.terrain import CostRaster, write_cost_raster
+
+
+@pytest.fixture
+def raster(tmp_path):
+    # 4 filas x 5 columnas de 0.5 km con origen en (1, 2): costo = 10·fila + columna
+    data = np.add.outer(10.0 * np.arange(4), np.arange(5.0))
+    path = tmp_path / 'field.drcm'
+    write_cost_raster(path, np.stack([data, np.ones_like(data)]), cell_size=0.5, origin=(1.0, 2.0))
+    raster = CostRaster.open(path, band_weights=[1.0, 0.0])
+    yield raster
+    del raster
+
+
+def test_round_trip(raster):
+    assert (raster.bands, raster.rows, raster.cols) == (2, 4, 5)
+    assert raster.extent == (1.0, 3.5, 2.0, 4.0)
+    assert raster.cost_at(1.6, 2.6) == 11.0
+
+
+def test_cell_index_includes_upper_edge(raster):
+    row, col = raster.cell_index([1.0, 3.5, 3.5, 1.0], [2.0, 4.0, 2.0, 4.0])
+    assert row.tolist() == [0, 3, 0, 3]
+    assert col.tolist() == [0, 4, 4, 0]
+    assert raster.cost_at(3.5, 4.0) == 34.0
+
+
+@pytest.mark.parametrize('x, y', [(0.999, 3.0), (3.501, 3.0), (2.0, 1.999), (2.0, 4.001),
+                                  (np.nan, 3.0)])
+def test_cell_index_rejects_points_outside(raster, x, y):
+    with pytest.raises(ValueError):
+        raster.cell_index(x, y)
+
+
+def test_segment_energy_uniform_cost(tmp_path):
+    path = tmp_path / 'uniform.drcm'
+    write_cost_raster(path, np.full((10, 10), 2.0), cell_size=1.0, dtype=np.float64)
+    raster = CostRaster.open(path)
+    start = np.array([[0.0, 0.0], [1.0, 1.0], [5.0, 5.0]])
+    end = np.array([[10.0, 10.0], [1.0, 9.0], [5.0, 5.0]])
+    # Muestras en bloques pequeños: el resultado no depende de max_samples
+    energy = raster.segment_energy(start, end, max_samples=7)
+    np.testing.assert_allclose(energy, 2.0 * np.array([np.hypot(10, 10), 8.0, 0.0]))
+    assert raster.path_energy([[0.0, 0.0]]) == 0.0
+    del raster
+
+
+def test_zone_coefficients_by_blocks(raster):
+    zones = np.zeros((4, 5), dtype=int)
+    zones[:, 2:] = 1
+    zones[3] = 2
+    coefficients = raster.zone_coefficients(zones, block_rows=3)
+    data = np.add.outer(10.0 * np.arange(4), np.arange(5.0))
+    expected = [data[zones == code].mean() for code in range(3)]
+    np.testing.assert_allclose(coefficients, expected)
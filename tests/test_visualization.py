@@ -0,0 +1,98 @@
+"""
+Explorador de sensibilidad (blitting) y mapas de densidad
+"""
+import numpy as np
+import pytest
+
+matplotlib = pytest.importorskip('matplotlib')
+pytest.importorskip('seaborn')
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from drone_optimization.optimization_solver import solve_batch  # noqa: E402
+from drone_optimization.visualization import (DroneVisualization, SensitivityExplorer,  # noqa: E402
+                                              density_grid)
+
+
+@pytest.fixture
+def explorer():
+    explorer = SensitivityExplorer(DroneVisualization(), resolution=50, n_autonomy=20)
+    explorer.figure.canvas.draw()
+    yield explorer
+    plt.close(explorer.figure)
+
+
+def test_explorer_shows_the_closed_form_solution(explorer):
+    s, w, j, energy = explorer.update(autonomy=18.0, c_A=1.5)
+    expected = solve_batch(1.5, 0.9, 1.5, 18.0)
+    assert (s, w, j, energy) == pytest.approx(
+        (float(expected.s), float(expected.w), float(expected.j), float(expected.energy)))
+    assert [bar.get_height() for bar in explorer.bars] == pytest.approx([s, w, j])
+    assert explorer.sliders['autonomy'].val == 18.0
+    np.testing.assert_allclose(explorer.sensitivity_line.get_ydata(),
+                               solve_batch(1.5, 0.9, 1.5, explorer.autonomy_grid).energy)
+
+
+def test_slider_blits_the_plots_and_only_its_own_row(explorer, monkeypatch):
+    blitted = []
+    monkeypatch.setattr(explorer.figure.canvas, 'blit', blitted.append)
+    explorer.sliders['c_B'].set_val(1.1)
+    assert explorer.params['c_B'] == 1.1
+    # Tres gráficos y la fila del deslizador que cambió
+    assert len(blitted) == 4
+    slider_ax = explorer.slider_artists['c_B'][0]
+    row = blitted[-1]
+    assert row.width == pytest.approx(explorer.figure.bbox.width)
+    assert row.y0 < slider_ax.bbox.y0 and row.y1 > slider_ax.bbox.y1
+    # La fila no invade las de los deslizadores vecinos
+    for name, (ax, _) in explorer.slider_artists.items():
+        if name != 'c_B':
+            assert not (row.y0 < ax.bbox.y1 - 1 and row.y1 > ax.bbox.y0 + 1)
+
+
+def test_explorer_benchmark_runs_headless(explorer):
+    assert explorer.benchmark(frames=5) > 0
+
+
+def test_density_grid_counts_match_histogram2d():
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=10_000), rng.normal(size=10_000)
+    extent = (-2.0, 2.0, -1.5, 1.5)
+    grid, _ = density_grid(x, y, bins=(40, 30), extent=extent, chunk_size=777)
+    inside = (np.abs(x) <= 2.0) & (np.abs(y) <= 1.5)
+    expected, _, _ = np.histogram2d(y[inside], x[inside], bins=(30, 40),
+                                    range=[extent[2:], extent[:2]])
+    np.testing.assert_array_equal(grid, expected)
+
+
+@pytest.mark.parametrize('statistic', ['sum', 'mean', 'min', 'max'])
+def test_density_grid_statistics(statistic):
+    x = np.array([0.1, 0.2, 0.9, 1.0, np.nan, 0.5])
+    y = np.array([0.1, 0.1, 0.9, 1.0, 0.5, 0.5])
+    values = np.array([1.0, 3.0, 5.0, 7.0, 9.0, np.inf])
+    grid, _ = density_grid(x, y, values, bins=2, extent=(0, 1, 0, 1), statistic=statistic,
+                           chunk_size=2)
+    # Celda inferior izquierda: 1 y 3; superior derecha: 5 y 7 (el borde superior cuenta)
+    reduce = {'sum': np.sum, 'mean': np.mean, 'min': np.min, 'max': np.max}[statistic]
+    assert grid[0, 0] == reduce([1.0, 3.0]) and grid[1, 1] == reduce([5.0, 7.0])
+    assert np.isnan(grid[0, 1]) and np.isnan(grid[1, 0])
+
+
+def test_density_grid_validation():
+    with pytest.raises(ValueError):
+        density_grid([0.0], [0.0], statistic='median')
+    with pytest.raises(ValueError):
+        density_grid([0.0], [0.0], statistic='mean')
+
+
+def test_sweep_density_plot():
+    rng = np.random.default_rng(1)
+    autonomy, c_A = rng.uniform(10, 20, 5_000), rng.uniform(1.0, 1.4, 5_000)
+    solution = solve_batch(c_A, 0.9, 1.5, autonomy)
+    result = {'autonomy': autonomy, 'c_A': c_A, **solution._asdict()}
+    fig = DroneVisualization().plot_sweep_density(result, bins=32, show=False)
+    images = [ax.images[0] for ax in fig.axes if ax.images]
+    assert len(images) == 2
+    assert np.nansum(images[0].get_array()) == 5_000
+    plt.close(fig)